@@ -0,0 +1,53 @@
+"""SQLite settings benchmark for the profiles database (see `core.model.database`)."""
+import os
+import sys
+import tempfile
+import time
+
+from core.model.database import open_database
+
+
+def benchmark(directory: str, count: int = 1000, synchronous: str = "NORMAL", journal_mode: str = "WAL") -> dict:
+    """
+    Measures insert, lookup and delete throughput (operations per second) of a scratch
+    database in `directory`, one committed transaction per operation as the app does.
+    Point it at a USB stick to compare settings on slow media.
+    """
+    fd, path = tempfile.mkstemp(suffix=".db", dir=directory)
+    os.close(fd)
+    try:
+        conn = open_database(path, journal_mode=journal_mode, synchronous=synchronous)
+        results = {}
+
+        started = time.perf_counter()
+        for i in range(count):
+            with conn:
+                conn.execute("INSERT INTO profiles (ssid, password) VALUES (?, ?)", (f"ssid-{i}", "password"))
+        results['insert'] = count / (time.perf_counter() - started)
+
+        started = time.perf_counter()
+        for i in range(count):
+            conn.execute("SELECT password FROM profiles WHERE ssid = ?", (f"ssid-{i}",)).fetchone()
+        results['lookup'] = count / (time.perf_counter() - started)
+
+        started = time.perf_counter()
+        for i in range(count):
+            with conn:
+                conn.execute("DELETE FROM profiles WHERE ssid = ?", (f"ssid-{i}",))
+        results['delete'] = count / (time.perf_counter() - started)
+
+        conn.close()
+        return results
+    finally:
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+
+if __name__ == "__main__":
+    # Usage: python -m benchmarks.database [directory] [count]
+    target = sys.argv[1] if len(sys.argv) > 1 else "."
+    ops = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    for journal, sync in (("DELETE", "FULL"), ("WAL", "FULL"), ("WAL", "NORMAL")):
+        rates = benchmark(target, ops, synchronous=sync, journal_mode=journal)
+        print(f"{journal:6} {sync:6} " + "  ".join(f"{k}: {v:,.0f}/s" for k, v in rates.items()))
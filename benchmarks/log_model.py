@@ -0,0 +1,51 @@
+"""Throughput benchmark for `core.model.log_model.LogListModel` behind a live QListView."""
+import sys
+import time
+
+from core.model.log_model import LogListModel
+
+
+def benchmark(seconds=3.0, capacity=5000, burst=200):
+    """
+    Feeds a QListView-backed model with bursts of records for `seconds` while the event
+    loop keeps repainting, and reports how many records per second the view absorbed.
+
+    Returns:
+        dict: {'records': int, 'records_per_second': float, 'rows': int, 'evicted': int}
+    """
+    from PyQt6.QtWidgets import QApplication, QListView
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    model = LogListModel(capacity=capacity)
+    view = QListView()
+    view.setModel(model)
+    model.log_added.connect(view.scrollToBottom)
+    view.show()
+
+    records = 0
+    started = flushed = time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        model.add_logs((f"DEBUG - benchmark record {records + i}", "DEBUG") for i in range(burst))
+        records += burst
+        # Flush at the pace of the LogQueueConsumer's default 50ms drain interval.
+        if time.perf_counter() - flushed >= 0.05:
+            model.flush()
+            flushed = time.perf_counter()
+        app.processEvents()
+    model.flush()
+    app.processEvents()
+    elapsed = time.perf_counter() - started
+
+    return {
+        'records': records,
+        'records_per_second': records / elapsed,
+        'rows': model.rowCount(),
+        'evicted': model.evicted,
+    }
+
+
+if __name__ == "__main__":
+    # Usage: python -m benchmarks.log_model [seconds] [capacity]
+    duration = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    print(benchmark(duration, size))
@@ -0,0 +1,53 @@
+"""Scaling benchmark for `core.services.netsh_parser.parse_networks`."""
+import sys
+import time
+
+from core.services.netsh_parser import parse_networks
+
+
+def _synthetic_networks(count: int) -> str:
+    """Builds a `show networks mode=bssid` dump with `count` networks of two BSSIDs each."""
+    lines = ["Interface name : Wi-Fi", f"There are {count} networks currently visible.", ""]
+    for i in range(count):
+        lines += [
+            f"SSID {i + 1} : net:{i}",
+            "    Network type            : Infrastructure",
+            "    Authentication          : WPA2-Personal",
+            "    Encryption              : CCMP",
+        ]
+        for b in range(2):
+            lines += [
+                f"    BSSID {b + 1}                 : 00:11:22:33:{i % 256:02x}:{b:02x}",
+                f"         Signal             : {(i + b) % 100}%",
+                "         Radio type         : 802.11ac",
+                f"         Channel            : {36 if b else 6}",
+            ]
+        lines.append("")
+    return "\n".join(lines)
+
+
+def benchmark(sizes=(100, 1000, 10000)) -> dict:
+    """
+    Times `parse_networks` on synthetic scan dumps of growing size and checks every
+    network is recovered, so regressions in correctness or linear scaling show up.
+
+    Returns:
+        {network_count: microseconds_per_network}
+    """
+    results = {}
+    for size in sizes:
+        output = _synthetic_networks(size)
+        started = time.perf_counter()
+        networks = parse_networks(output)
+        elapsed = time.perf_counter() - started
+        if len(networks) != size or networks[-1].ssid != f"net:{size - 1}":
+            raise AssertionError(f"Parsed {len(networks)} of {size} networks.")
+        results[size] = elapsed / size * 1e6
+    return results
+
+
+if __name__ == "__main__":
+    # Usage: python -m benchmarks.netsh_parser [network_count ...]
+    counts = tuple(int(arg) for arg in sys.argv[1:]) or (100, 1000, 10000)
+    for count, per_network in benchmark(counts).items():
+        print(f"{count:>7} networks: {per_network:.1f}us per network")
@@ -0,0 +1,40 @@
+"""Bulk provisioning benchmark for `core.services.profile_builder`."""
+import sys
+import time
+
+from core.services.profile_builder import ProfileStaging, WifiProfile, build_profile_xml
+
+
+def benchmark(count: int = 500) -> dict:
+    """
+    Measures bulk provisioning cost without touching the system: rendering `count`
+    profiles and staging them as files.
+
+    Returns:
+        {'build': seconds, 'stage': seconds, 'per_profile_ms': float}
+    """
+    profiles = [WifiProfile(f"Net & <{i}>", f"pass&word<{i}>", "wpa2") for i in range(count)]
+
+    started = time.perf_counter()
+    for profile in profiles:
+        build_profile_xml(profile)
+    built = time.perf_counter()
+
+    with ProfileStaging() as staging:
+        for profile in profiles:
+            staging.write(profile)
+    staged = time.perf_counter()
+
+    return {
+        'build': built - started,
+        'stage': staged - built,
+        'per_profile_ms': (staged - started) / count * 1000,
+    }
+
+
+if __name__ == "__main__":
+    # Usage: python -m benchmarks.profile_builder [count]
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    timings = benchmark(total)
+    print(f"{total} profiles: build {timings['build'] * 1000:.1f}ms, "
+          f"stage {timings['stage'] * 1000:.1f}ms, {timings['per_profile_ms']:.3f}ms per profile")
@@ -1,32 +1,46 @@
 from PyQt6 import QtWidgets, QtCore
 from core.view.main_window import Ui_Form
+from core.view.metrics_panel import MetricsPanel
 from core.model.log_model import LogListModel
+from core.model.metrics_model import MetricsModel
 from core.controller.wifi_list_controller import WifiListController
 from core.services.psiphon_monitor import *
 from core.services.network_manager import *
+from core.services.network_service import NetworkService
+from core.services.event_log import EventLog
+from core.services.recovery import RecoveryLadder
+from core.services.check_scheduler import CheckScheduler
+from core.services.network_watcher import NetworkWatcher
+from core.utils.deadline import Deadline
+from core.utils.logger_setup import create_model_log_handler, default_log_dir
 from core.utils.message_box import *
 import logging
+import os
 import time
-
-
-class QListWidgetHandler(logging.Handler):
-    """
-    A custom logging handler that sends log messages to a QListWidget
-    via a LogListModel.
-    """
-
-    def __init__(self, model):
-        super().__init__()
-        self.model = model
-
-    def emit(self, record):
-        # Format the log record and add it to the model.
-        level = record.levelname
-        message = self.format(record)
-        self.model.add_log(message, level)
+from concurrent.futures import ThreadPoolExecutor
 
 
 class MainController(QtWidgets.QMainWindow):
+    # Overruns of a tick's time budget up to this many seconds (final probes get a minimum
+    # timeout) are not counted.
+    TICK_OVERRUN_GRACE = 1.0
+
+    # (status check, interval in seconds, priority) of the auto-configuration; the interval
+    # of the HTTP internet probe is the one set in the UI. The Psiphon and tunnel statuses
+    # are not polled here: they are published from the PsiphonMonitor's status updates, so
+    # its adaptive interval decides how often processes are looked up.
+    CHECK_SCHEDULE = (
+        ('wifi', 5.0, 1),
+        ('internet', None, 2),
+    )
+    # Intervals used instead while the OS pushes network changes: link and address changes
+    # trigger the checks right away, so the association only needs an occasional safety check.
+    # The internet probe keeps its interval, as upstream outages cause no local change.
+    WATCHED_INTERVALS = {'wifi': 60.0}
+    # Network changes trigger the HTTP internet probe at most this often (seconds), so route
+    # and address churn cannot turn into a stream of probes on metered links.
+    INTERNET_TRIGGER_INTERVAL = 15.0
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -39,6 +53,7 @@ class MainController(QtWidgets.QMainWindow):
         # 2. Initialize application models and services
         self.model = WifiProfilesModel()
         self.network_manager = NetworkManager()
+        self.network_service = NetworkService(self)
         self.psiphon_monitor = PsiphonMonitor()
         self.log_model = LogListModel()
 
@@ -64,13 +79,53 @@ class MainController(QtWidgets.QMainWindow):
 
         self.psiphon_tunnel_path = resource_path("otherapps/psiphon-tunnel-core.exe")
 
-        self.startupinfo = subprocess.STARTUPINFO()
-        self.startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-        self.startupinfo.wShowWindow = subprocess.SW_HIDE
-
-        # Setup timer for auto-configuration
+        # Runs independent checks and repairs of one configuration tick concurrently.
+        self.tick_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tick")
+        # Auto-configuration ticks started, over their time budget, and skipped because the
+        # previous one was still running. Only updated on the GUI thread.
+        self.tick_stats = {'ticks': 0, 'overruns': 0, 'skipped': 0}
+
+        # Escalating repair of lost internet connectivity used by the auto-configuration.
+        self.recovery = RecoveryLadder(self.network_manager)
+
+        # Shared backend for external commands; its counters track spawn counts and latency.
+        self.command_runner = self.network_manager.runner
+
+        # Wi-Fi, internet and Psiphon state changes are appended to a JSON-lines event log.
+        self.event_log = self.create_event_log()
+        self.network_manager.events = self.event_log
+        self.psiphon_monitor.events = self.event_log
+
+        # History of availability, probe RTT and reconnect times, shown below the log.
+        self.metrics_model = MetricsModel(self.event_log, parent=self)
+        self.event_log.subscribe(self.metrics_model.on_event)
+        self.metrics_panel = MetricsPanel(self.metrics_model, parent=self.central_widget)
+        self.ui.gridLayout.addWidget(self.metrics_panel, 11, 0, 1, 4)
+
+        # Link, address and route changes reported by the OS trigger the status checks at once.
+        self.network_watcher = NetworkWatcher(parent=self)
+        self.network_watcher.changed.connect(self.on_network_changed)
+        # The Psiphon monitor keeps its own idle cap even when network changes poke it:
+        # Psiphon started outside the app in proxy mode causes no network change.
+        self._internet_triggered_at = None
+
+        # Status checks of the auto-configuration, each on its own schedule; a repair runs
+        # when a status changes to an unwanted value.
+        self.scheduler = self.create_scheduler()
+        self.scheduler.status_changed.connect(self.on_status_changed)
+        # Set while statuses observed by a configuration run are published.
+        self._publishing_config = False
+
+        # Retries the configuration while a status stays unwanted after a configuration run.
         self.autoconfig_timer = QtCore.QTimer(self)
-        self.autoconfig_timer.timeout.connect(self.run_once_config)
+        self.autoconfig_timer.setSingleShot(True)
+        self.autoconfig_timer.timeout.connect(self._retry_config)
+
+        # Blocking network work runs on the network service; dialogs it requests are shown here.
+        self.network_manager.error_handler = self.network_service.report_error
+        self.network_service.error_reported.connect(show_error)
+        self.network_service.job_failed.connect(self.on_job_failed)
+        self.network_service.start()
 
         # 5. Load initial data and states
         self.load_system_wifi_profiles()
@@ -80,10 +135,34 @@ class MainController(QtWidgets.QMainWindow):
         # Start the background thread for monitoring Psiphon
         self.psiphon_monitor.start()
         self.psiphon_monitor.status_updated.connect(self.update_psiphon_ui)
+        self.network_watcher.start()
 
         # 6. Connect UI signals to controller slots
         self.connect_signals()
 
+    def create_event_log(self):
+        """Opens the state event log next to the application logs (in memory only if unavailable)."""
+        try:
+            log_dir = default_log_dir()
+            os.makedirs(log_dir, exist_ok=True)
+            return EventLog(os.path.join(log_dir, "events.jsonl"))
+        except OSError as e:
+            self.logger.error(f"Cannot create the event log: {e}")
+            return EventLog()
+
+    def create_scheduler(self):
+        """Creates the check scheduler with the checks of CHECK_SCHEDULE."""
+        scheduler = CheckScheduler(parent=self)
+        checks = {
+            'wifi': lambda: self.network_manager.get_wifi_status()[0],
+            'internet': self.network_manager.get_internet_status,
+        }
+        intervals = self.WATCHED_INTERVALS if self.network_watcher.event_driven else {}
+        for name, interval, priority in self.CHECK_SCHEDULE:
+            interval = intervals.get(name, interval) or self.ui.intervalSpinBox.value()
+            scheduler.add(name, checks[name], interval, priority)
+        return scheduler
+
     def scroll_log_to_bottom(self):
         """Automatically scrolls the log view to the most recent entry."""
         self.ui.logListView.scrollToBottom()
@@ -91,29 +170,36 @@ class MainController(QtWidgets.QMainWindow):
     def setup_logging(self):
         """Configures log handlers for both console and the application's UI."""
         root_logger = logging.getLogger()
-        root_logger.setLevel(logging.INFO)
+        # Keep a lower level configured for the log file, if any.
+        if root_logger.level > logging.INFO:
+            root_logger.setLevel(logging.INFO)
 
         # Handler for console output
         console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.INFO)
         formatter = logging.Formatter('%(name)s - %(levelname)s - %(message)s')
         console_handler.setFormatter(formatter)
         root_logger.addHandler(console_handler)
 
-        # Handler for the UI's log view
-        ui_handler = QListWidgetHandler(self.log_model)
-        ui_handler.setFormatter(logging.Formatter('%(message)s'))
-        root_logger.addHandler(ui_handler)
+        # Handler for the UI's log view: records from any thread are queued and
+        # moved into the model on the GUI thread.
+        self.ui_log_handler, self.log_consumer = create_model_log_handler(self.log_model, parent=self)
+        self.ui_log_handler.setLevel(logging.INFO)
+        root_logger.addHandler(self.ui_log_handler)
 
     def connect_signals(self):
         """Connects all UI buttons and widgets to their corresponding methods."""
         self.ui.saveWifiProfileButton.clicked.connect(self.handle_save_profile)
         self.ui.chooseWifiButton.clicked.connect(self.handle_switch_wifi)
         self.ui.resetWifiButton.clicked.connect(self.reset_wifi)
-        self.ui.connectWifiButton.clicked.connect(self.network_manager.connect_wifi)
-        self.ui.disconnectWifiButton.clicked.connect(self.network_manager.disconnect_wifi)
+        self.ui.connectWifiButton.clicked.connect(
+            lambda: self.network_service.submit("connect_wifi", self.network_manager.connect_wifi, cancellable=True))
+        self.ui.disconnectWifiButton.clicked.connect(
+            lambda: self.network_service.submit("disconnect_wifi", self.network_manager.disconnect_wifi,
+                                                cancellable=True))
         self.ui.resetVPNButton.clicked.connect(self.reset_vpn)
-        self.ui.connectVPNButton.clicked.connect(self.network_manager.start_psiphon)
-        self.ui.disconnectVPNButton.clicked.connect(self.network_manager.stop_psiphon)
+        self.ui.connectVPNButton.clicked.connect(self.start_vpn)
+        self.ui.disconnectVPNButton.clicked.connect(self.stop_vpn)
         self.ui.checkNetButton.clicked.connect(self.check_all_statuses)
         self.ui.setOnceButton.clicked.connect(self.run_once_config)
         self.ui.autoConfigButton.clicked.connect(self.start_auto_config)
@@ -124,12 +210,19 @@ class MainController(QtWidgets.QMainWindow):
     def load_system_wifi_profiles(self):
         """Loads all existing WiFi profiles from the system and saves them to the application's database."""
         self.logger.info("Loading system WiFi profiles...")
-        wifi_profiles = self.network_manager.get_wifi_passwords()
-        self.model.collect_duplicate_profiles(wifi_profiles)
+        self.network_service.submit(
+            "load_profiles", self.network_manager.get_wifi_passwords,
+            on_done=self.model.collect_duplicate_profiles
+        )
 
     def set_current_wifi(self):
         """Retrieves the currently connected WiFi and sets its credentials in the NetworkManager."""
-        current_ssid = self.network_manager.get_current_wifi()
+        self.network_service.submit(
+            "current_wifi", self.network_manager.get_current_wifi, on_done=self._apply_current_wifi
+        )
+
+    def _apply_current_wifi(self, current_ssid):
+        """Stores the credentials of the connected WiFi once it has been detected."""
         if current_ssid:
             password = self.model.get_password(current_ssid)
             if password:
@@ -137,20 +230,55 @@ class MainController(QtWidgets.QMainWindow):
                 self.ui.currentWifiLabel.setText(current_ssid)
                 self.logger.info(f"Set current WiFi to: {current_ssid}")
 
-    def update_status_labels(self):
+    def collect_status(self, deadline=None):
+        """
+        Gathers the Wi-Fi, internet and Psiphon status. Runs on the network service thread.
+
+        Args:
+            deadline (Deadline, optional): Shortens the checks to the remaining time budget.
+                Once it has expired, Wi-Fi and internet are not probed and reported as None
+                (unknown), since a probe cut short would report a false outage.
+
+        Returns:
+            dict: The keys 'wifi', 'internet', 'psiphon' and 'tunnel' mapped to booleans
+                  (or None when unknown).
+        """
+        if deadline is not None and deadline.expired:
+            self.logger.info("Time budget exhausted; Wi-Fi and internet status left unknown until the next check.")
+            wifi_connected = internet_connected = None
+        else:
+            wifi_connected, _ = self.network_manager.get_wifi_status(deadline)
+            internet_connected = self.network_manager.get_internet_status(deadline=deadline)
+        is_psi_running, is_tunneling_running = self.psiphon_monitor.check_psiphone_ui()
+        reachability = self.network_manager.last_reachability
+        if reachability is not None and reachability.rtt is not None:
+            self.metrics_model.record('rtt', reachability.rtt * 1000)
+        return {
+            'wifi': wifi_connected,
+            'internet': internet_connected,
+            'psiphon': is_psi_running,
+            'tunnel': is_tunneling_running,
+        }
+
+    def update_status_labels(self, status):
         """
         Updates the UI labels to reflect the current status of Wi-Fi and internet connection.
         If conditions are not met, it prompts the user for action (e.g., reset Wi-Fi or start VPN).
+
+        Args:
+            status (dict): The result of `collect_status`.
         """
-        wifi_connected, wifi_message = self.network_manager.get_wifi_status()
-        internet_connected = self.network_manager.get_internet_status()
+        wifi_connected = status['wifi']
+        internet_connected = status['internet']
+        is_psi_runnig = status['psiphon']
+        is_tunneling_running = status['tunnel']
         vpn_use = self.ui.vpnUseCheckbox.isChecked() and internet_connected
         question = not self.ui.noQuestionCheckbox.isChecked()
-        is_psi_runnig, is_tunneling_running = self.psiphon_monitor.check_psiphone_ui()
-
-        self.ui.wifiStatusValue.setText("Connected" if wifi_connected else "Not Connected")
-        self.ui.netStatusValue.setText("Connected" if internet_connected else "Not Connected")
 
+        if wifi_connected is not None:
+            self.ui.wifiStatusValue.setText("Connected" if wifi_connected else "Not Connected")
+        if internet_connected is not None:
+            self.ui.netStatusValue.setText("Connected" if internet_connected else "Not Connected")
 
         if vpn_use:
             if not is_psi_runnig:
@@ -159,12 +287,10 @@ class MainController(QtWidgets.QMainWindow):
                     reply = show_question(f"VPN is not connected.\nConnect VPN?", timed=True)
                     if reply == QtWidgets.QMessageBox.StandardButton.Yes:
                         self.logger.info("User confirmed starting VPN.")
-                        self.network_manager.start_psiphon()
-                        time.sleep(2)
+                        self.start_vpn()
                 else:
                     self.logger.info("Starting vpn without question.")
-                    self.network_manager.start_psiphon()
-                    time.sleep(2)
+                    self.start_vpn()
             else:
                 if not is_tunneling_running:
                     if question:
@@ -173,13 +299,9 @@ class MainController(QtWidgets.QMainWindow):
                         if reply == QtWidgets.QMessageBox.StandardButton.Yes:
                             self.logger.info("User confirmed reset VPN.")
                             self.reset_vpn()
-                            time.sleep(2)
                     else:
                         self.logger.info("Reset VPN without question.")
                         self.reset_vpn()
-                        time.sleep(2)
-
-
 
         if is_psi_runnig:
             self.ui.vpnUseCheckbox.setChecked(True)
@@ -208,6 +330,9 @@ class MainController(QtWidgets.QMainWindow):
             tunneling_text = "Not Tunneling"
         self.ui.vpnTunnelingValue.setText(tunneling_text)
 
+        self.scheduler.publish('psiphon', ui_running)
+        self.scheduler.publish('tunnel', tunnel_running)
+
     def handle_save_profile(self):
         """Saves a new WiFi profile from the UI inputs and optionally connects to it."""
         ssid = self.ui.ssidInput.text()
@@ -223,12 +348,9 @@ class MainController(QtWidgets.QMainWindow):
             self.logger.info(f"Profile for '{ssid}' saved successfully.")
             reply = show_question(f"Profile for '{ssid}' saved successfully. Do you want to connect now?", timed=True)
             if reply == QtWidgets.QMessageBox.StandardButton.Yes:
-                if self.network_manager.is_psiphon_running():
-                    self.network_manager.stop_psiphon()
-
-                self.network_manager.set_wifi_credentials(ssid, password)
                 self.ui.currentWifiLabel.setText(ssid)
-                self.network_manager.connect_wifi()
+                self.network_service.submit("connect_wifi", self._switch_to_profile, ssid, password,
+                                            cancellable=True)
 
             self.ui.ssidInput.clear()
             self.ui.passwordInput.clear()
@@ -237,105 +359,294 @@ class MainController(QtWidgets.QMainWindow):
             self.logger.error(f"Failed to save profile for '{ssid}'.")
             show_error(f"Failed to save profile for '{ssid}'.")
 
+    def _switch_to_profile(self, ssid, password, deadline=None):
+        """Stops the VPN if needed and connects to a newly saved profile (worker thread)."""
+        if self.network_manager.is_psiphon_running(deadline):
+            self.network_manager.stop_psiphon(deadline)
+
+        self.network_manager.set_wifi_credentials(ssid, password)
+        return self.network_manager.connect_wifi(deadline)
+
     def handle_switch_wifi(self):
         """Opens a new dialog for the user to select and connect to a different WiFi network."""
         try:
             dialog = WifiListController(self)
             if dialog.exec() == QtWidgets.QDialog.DialogCode.Accepted:
                 self.network_manager.set_wifi_credentials(dialog.selected_ssid, dialog.selected_password)
-                if self.network_manager.connect_wifi():
-                    display_text = f"{self.network_manager.current_ssid}"
-                    self.ui.currentWifiLabel.setText(display_text)
-
-                    if self.ui.vpnUseCheckbox:
-                        self.reset_wifi()
-
-                    self.check_all_statuses()
+                self.network_service.submit(
+                    "connect_wifi", self.network_manager.connect_wifi, on_done=self._on_switched_wifi,
+                    cancellable=True
+                )
 
         except Exception as e:
             self.logger.exception("Error in handle_switch_wifi")
             show_error(f"An error occurred: {e}")
 
+    def _on_switched_wifi(self, connected):
+        """Refreshes the UI after connecting to the WiFi chosen in the list dialog."""
+        if connected:
+            display_text = f"{self.network_manager.current_ssid}"
+            self.ui.currentWifiLabel.setText(display_text)
+
+            if self.ui.vpnUseCheckbox:
+                self.reset_wifi()
+
+            self.check_all_statuses()
+
     def check_all_statuses(self):
         """Triggers an update of all network and VPN status labels."""
-        self.update_status_labels()
+        self.network_service.submit("status", self.collect_status, on_done=self.update_status_labels)
+
+    def _is_wanted(self, name, value):
+        """Returns True if a status value needs no repair under the current settings."""
+        if name in ('psiphon', 'tunnel'):
+            return bool(value) == self.ui.vpnUseCheckbox.isChecked()
+        return bool(value)
+
+    def _needs_config(self):
+        """Returns True if any stored status is unwanted."""
+        return any(not self._is_wanted(name, value) for name, value in self.scheduler.store.snapshot().items())
+
+    def on_status_changed(self, name, value):
+        """
+        Receives status changes from the check scheduler on the GUI thread. Repairs are only
+        started on a change to an unwanted value, not on every check.
+        """
+        self.logger.info(f"Status '{name}' changed to {value}.")
+        if name == 'wifi':
+            self.ui.wifiStatusValue.setText("Connected" if value else "Not Connected")
+        elif name == 'internet':
+            self.ui.netStatusValue.setText("Connected" if value else "Not Connected")
+        if self.scheduler.isRunning() and not self._is_wanted(name, value) and not self._publishing_config:
+            self.run_once_config()
+
+    def on_network_changed(self, changes):
+        """
+        Receives a burst of OS network changes on the GUI thread: drops the cached interface
+        state, pokes the Psiphon monitor and runs the Wi-Fi check immediately. The internet
+        probe is triggered at most every INTERNET_TRIGGER_INTERVAL seconds, and nothing is
+        triggered while a configuration run (whose own actions cause changes) is in progress.
+        """
+        shown = ", ".join(change.summary for change in changes[:5])
+        more = f" and {len(changes) - 5} more" if len(changes) > 5 else ""
+        self.logger.info(f"Network changed: {shown}{more}.")
+        self.network_manager.interfaces.invalidate()
+        self.psiphon_monitor.poke()
+        if not self.scheduler.isRunning() or self.network_service.is_pending("autoconfig"):
+            return
+        self.scheduler.trigger('wifi')
+        now = time.monotonic()
+        if self._internet_triggered_at is None or now - self._internet_triggered_at >= self.INTERNET_TRIGGER_INTERVAL:
+            self._internet_triggered_at = now
+            self.scheduler.trigger('internet')
+
+    def _retry_config(self):
+        """Runs the configuration again if a status is still unwanted."""
+        if self.scheduler.isRunning() and self._needs_config():
+            self.run_once_config()
+
+    def _schedule_retry(self):
+        """
+        Arms the retry timer while a status stays unwanted. Called after every configuration
+        run, whether it finished, failed or was skipped, since a status that stays bad
+        without changing triggers no further repair by itself.
+        """
+        if self.scheduler.isRunning() and self._needs_config() and not self.autoconfig_timer.isActive():
+            self.autoconfig_timer.start(self.ui.intervalSpinBox.value() * 1000)
+
+    def _publish_config_status(self, status):
+        """Feeds the statuses observed by a configuration run into the shared status store."""
+        # Changes published here update the UI but start no new run; `_schedule_retry` covers them.
+        self._publishing_config = True
+        try:
+            for name, value in status.items():
+                if value is not None:
+                    self.scheduler.publish(name, value)
+        finally:
+            self._publishing_config = False
 
     def run_once_config(self):
         """
         Performs a one-time check and configuration of Wi-Fi and VPN connections based on
-        the current network status and UI settings.
+        the current network status and UI settings. The work runs on the network service;
+        a tick arriving while the previous one is still running is skipped.
+
+        Each tick gets the check interval as its time budget, so it normally ends before
+        the next one is due.
         """
-        try:
-            self.logger.info("Starting one-time network configuration...")
-            wifi_status, wifi_message = self.network_manager.get_wifi_status()
-            psiphon_status = self.network_manager.is_psiphon_running()
-            use_vpn = self.ui.vpnUseCheckbox.isChecked()
+        use_vpn = self.ui.vpnUseCheckbox.isChecked()
+        budget = self.ui.intervalSpinBox.value() or None
+        self.tick_stats['ticks'] += 1
+        if not self.network_service.submit("autoconfig", self.configure_network, use_vpn, budget,
+                                           on_done=self._on_config_done, cancellable=True):
+            self.tick_stats['skipped'] += 1
+            self.logger.warning(
+                f"Previous network configuration is still running; tick skipped "
+                f"({self.tick_stats['skipped']} of {self.tick_stats['ticks']} ticks skipped)."
+            )
+            self._schedule_retry()
+
+    def configure_network(self, use_vpn, budget=None, deadline=None):
+        """
+        Checks and repairs the Wi-Fi, internet and VPN connections. Runs on the network service thread.
+
+        Independent actions overlap: the Wi-Fi and Psiphon checks run together, and a
+        Psiphon that is needed but not running is launched while Wi-Fi reassociates and the
+        internet is recovered. Nothing here waits for reachability before that launch:
+        Psiphon keeps retrying its tunnel on its own, and PsiphonMonitor reports when the
+        tunnel comes up.
+
+        All calls share one Deadline: each waits at most for what is left of `budget`, and
+        repairs that would start after it expired are left to the next tick.
+
+        Args:
+            use_vpn (bool): Whether the VPN should be running.
+            budget (float, optional): The time budget of the tick in seconds.
+            deadline (Deadline, optional): A deadline of the job (e.g. tied to its cancellation)
+                that the tick's budget is taken from.
+
+        Returns:
+            dict: 'status' (see `collect_status`, or None if aborted), 'error'/'warning'
+                  messages to show to the user, if any, and 'timings': the critical path,
+                  the budget and its overrun, and the duration of each step in seconds.
+        """
+        result = {'status': None, 'error': None, 'warning': None, 'timings': {}}
+        deadline = deadline.child(budget) if deadline is not None else Deadline(budget)
+        self.logger.info(f"Starting one-time network configuration ({deadline})...")
+        steps = {}
+
+        def timed(name, fn, *args, **kwargs):
+            step_started = time.monotonic()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                steps[name] = time.monotonic() - step_started
+
+        manager = self.network_manager
+        wifi_future = self.tick_executor.submit(timed, 'wifi_check', manager.get_wifi_status, deadline)
+        psiphon_status = timed('psiphon_check', manager.is_psiphon_running, deadline)
+        wifi_status, wifi_message = wifi_future.result()
+
+        # Pre-launch Psiphon in parallel with the Wi-Fi and internet repair.
+        vpn_future = None
+        if use_vpn and not psiphon_status:
+            self.logger.info("VPN is not connected. Starting it alongside the connection checks...")
+            vpn_future = self.tick_executor.submit(timed, 'vpn_start', manager.start_psiphon, deadline)
 
+        try:
+            self._repair_connection(result, timed, deadline, wifi_status, use_vpn and psiphon_status)
+
+            if vpn_future is not None:
+                if not vpn_future.result():
+                    self.logger.warning("Failed to connect to VPN.")
+                    result['warning'] = "Failed to connect to VPN."
+            elif not use_vpn and psiphon_status:
+                self.logger.info("VPN is running, but 'Use VPN' is unchecked. Disconnecting VPN...")
+                timed('vpn_stop', manager.stop_psiphon, deadline)
+        finally:
+            if vpn_future is not None:
+                vpn_future.result()
+            critical_path = deadline.elapsed()
+            result['timings'] = {'critical_path': critical_path, 'budget': budget,
+                                 'overrun': deadline.overrun(), 'steps': dict(steps)}
+            self.logger.info(
+                f"Configuration tick took {critical_path:.1f}s for {sum(steps.values()):.1f}s of work ("
+                + ", ".join(f"{name} {seconds:.1f}s" for name, seconds in steps.items()) + ")."
+            )
+
+        if result['error']:
+            return result
+        self.logger.info("Network configuration completed successfully.")
+        result['status'] = self.collect_status(deadline)
+        return result
+
+    def _repair_connection(self, result, timed, deadline, wifi_status, restart_vpn):
+        """Connects Wi-Fi and recovers the internet; sets result['error'] on failure."""
+        if not wifi_status:
+            self.logger.info("Wi-Fi is not connected. Attempting to connect...")
+            timed('wifi_connect', self.network_manager.connect_wifi, deadline)
+            wifi_status, wifi_message = self.network_manager.get_wifi_status(deadline)
             if not wifi_status:
-                self.logger.info("Wi-Fi is not connected. Attempting to connect...")
-                self.network_manager.connect_wifi()
-                time.sleep(3)
-                wifi_status, wifi_message = self.network_manager.get_wifi_status()
-                if not wifi_status:
-                    self.logger.warning("Failed to connect to Wi-Fi.")
-                    show_error("Failed to connect to Wi-Fi. Please check credentials or try again.", "Error")
-                    return
-
-            internet_status = self.network_manager.get_internet_status()
-            if not internet_status:
-                self.logger.warning("Internet connection is down. Attempting to fix...")
-                self.network_manager.disconnect_wifi()
-                self.network_manager.connect_wifi()
-                internet_status = self.network_manager.get_internet_status()
-                if not internet_status:
-                    self.logger.error("Failed to restore internet connection.")
-                    show_error("Failed to restore internet connection.", "Error")
-                    return
-
-            if use_vpn:
-                if not psiphon_status:
-                    self.logger.info("VPN is not connected. Attempting to connect...")
-                    self.network_manager.start_psiphon()
-                    time.sleep(5)
-                    if not self.network_manager.is_psiphon_running():
-                        self.logger.warning("Failed to connect to VPN.")
-                        show_warning("Failed to connect to VPN.", "Warning")
-            else:
-                if self.network_manager.is_psiphon_running():
-                    self.logger.info("VPN is running, but 'Use VPN' is unchecked. Disconnecting VPN...")
-                    self.network_manager.stop_psiphon()
+                self.logger.warning("Failed to connect to Wi-Fi.")
+                result['error'] = "Failed to connect to Wi-Fi. Please check credentials or try again."
+                return
 
-            self.logger.info("Network configuration completed successfully.")
-            self.update_status_labels()
+        internet_status = timed('internet_check', self.network_manager.get_internet_status, deadline=deadline)
+        if internet_status:
+            self.recovery.reset()
+        else:
+            self.logger.warning("Internet connection is down. Attempting to fix...")
+            incident = timed('recovery', self.recovery.recover, restart_vpn, deadline)
+            if incident.paused:
+                self.logger.info("Recovery continues with the next step on the next configuration run.")
+            elif not incident.recovered:
+                self.logger.error("Failed to restore internet connection.")
+                result['error'] = "Failed to restore internet connection."
+
+    def _on_config_done(self, result):
+        """Shows the outcome of `configure_network` on the GUI thread."""
+        timings = result['timings']
+        if timings.get('overrun', 0.0) > self.TICK_OVERRUN_GRACE:
+            self.tick_stats['overruns'] += 1
+            self.logger.warning(
+                f"Configuration tick overran its {timings['budget']:.0f}s budget by {timings['overrun']:.1f}s "
+                f"({self.tick_stats['overruns']} of {self.tick_stats['ticks']} ticks over budget)."
+            )
+        if result['status']:
+            self._publish_config_status(result['status'])
+        self._schedule_retry()
+        if result['error']:
+            show_error(result['error'], "Error")
+            return
+        if result['warning']:
+            show_warning(result['warning'], "Warning")
+        self.update_status_labels(result['status'])
 
-        except Exception as e:
-            self.logger.exception("An unexpected error occurred during auto-config.")
-            show_error(f"An unexpected error occurred: {e}", "Error")
+    def on_job_failed(self, name, error):
+        """Reports a network job that raised an unexpected exception."""
+        self.logger.error(f"An unexpected error occurred in '{name}': {error}")
+        if name == "autoconfig":
+            self._schedule_retry()
+        show_error(f"An unexpected error occurred: {error}", "Error")
 
     def start_auto_config(self):
-        """Starts a repeating timer to automatically check and manage network connections."""
+        """
+        Starts the check scheduler to automatically check and manage network connections.
+        Every status is checked at its own interval (the internet probe at the one set in
+        the UI), and the configuration runs when a status changes to an unwanted value.
+        """
         interval = self.ui.intervalSpinBox.value()
         if interval <= 0:
             self.logger.warning("Check interval must be greater than 0.")
             show_error("Check interval must be greater than 0.", "Error")
             return
 
-        interval_ms = interval * 1000
-
-        # Disable UI elements to prevent user from interfering with the timer.
+        # Disable UI elements to prevent user from interfering with the scheduler.
         self.ui.intervalSpinBox.setReadOnly(True)
         self.ui.autoConfigButton.setEnabled(False)
         self.ui.stopAutoConfigButton.setEnabled(True)
         self.ui.vpnUseCheckbox.setEnabled(False)
         self.ui.noQuestionCheckbox.setEnabled(False)
 
-        self.autoconfig_timer.start(interval_ms)
-        self.logger.info(f"Auto-configuration started with an interval of {interval} seconds.")
-        show_info(f"Auto-configuration started. Checking every {interval} seconds.", "Success")
+        # Forget earlier results so the first result of every check is acted on.
+        self.scheduler.store.clear()
+        self.scheduler.set_interval('internet', interval)
+        self.scheduler.trigger()
+        self.scheduler.start()
+        # The Psiphon statuses are only published on change, so seed them from the monitor.
+        ui_running, tunnel_running, _ = self.psiphon_monitor.last_snapshot()
+        self.scheduler.publish('psiphon', ui_running)
+        self.scheduler.publish('tunnel', tunnel_running)
+        self.logger.info(
+            "Auto-configuration started with check intervals: "
+            + ", ".join(f"{name} {check['interval']:g}s" for name, check in self.scheduler.stats().items())
+        )
+        show_info(f"Auto-configuration started. Checking the internet every {interval} seconds.", "Success")
 
     def stop_auto_config(self):
-        """Stops the automatic network configuration timer and re-enables UI elements."""
+        """Stops the automatic network configuration and re-enables UI elements."""
         self.autoconfig_timer.stop()
+        self.scheduler.stop()
 
         self.ui.intervalSpinBox.setReadOnly(False)
         self.ui.autoConfigButton.setEnabled(True)
@@ -347,16 +658,33 @@ class MainController(QtWidgets.QMainWindow):
 
     def reset_wifi(self):
         """Disconnects and then reconnects to the current WiFi network."""
+        self.network_service.submit("reset_wifi", self._reset_wifi, cancellable=True)
+
+    def _reset_wifi(self, deadline=None):
         self.logger.info("Starting Wi-Fi restart...")
-        self.network_manager.disconnect_wifi()
-        self.network_manager.connect_wifi()
+        self.network_manager.disconnect_wifi(deadline)
+        self.network_manager.connect_wifi(deadline)
         self.logger.info("Wi-Fi reset completed.")
 
+    def start_vpn(self):
+        """Starts the VPN on the network service."""
+        self.network_service.submit("start_vpn", self.network_manager.start_psiphon,
+                                    on_done=lambda _: self.psiphon_monitor.poke(), cancellable=True)
+
+    def stop_vpn(self):
+        """Stops the VPN on the network service."""
+        self.network_service.submit("stop_vpn", self.network_manager.stop_psiphon,
+                                    on_done=lambda _: self.psiphon_monitor.poke(), cancellable=True)
+
     def reset_vpn(self):
         """Stops and then restarts the VPN connection."""
+        self.network_service.submit("reset_vpn", self._reset_vpn,
+                                    on_done=lambda _: self.psiphon_monitor.poke(), cancellable=True)
+
+    def _reset_vpn(self, deadline=None):
         self.logger.info("Starting VPN restart...")
-        self.network_manager.stop_psiphon()
-        self.network_manager.start_psiphon()
+        self.network_manager.stop_psiphon(deadline)
+        self.network_manager.start_psiphon(deadline)
         self.logger.info("VPN reset completed.")
 
     def handle_copy_log(self):
@@ -373,7 +701,23 @@ class MainController(QtWidgets.QMainWindow):
 
     def closeEvent(self, event):
         """This method is called when the application window is closing.
-        It ensures that the Psiphon monitoring thread is gracefully stopped."""
+        It ensures that the Psiphon monitoring and network service threads are gracefully stopped."""
+        self.autoconfig_timer.stop()
+        self.scheduler.stop()
+        self.network_watcher.stop()
+        self.metrics_model.stop()
         self.psiphon_monitor.stop()
+        self.network_service.stop()
+        self.tick_executor.shutdown(wait=False)
+        self.logger.info(f"Command statistics: {self.command_runner.stats.summary()}")
+        self.logger.info(f"Reachability probe statistics: {self.network_manager.reachability.stats()}")
+        self.logger.info(f"System profile cache: {self.network_manager.system_profiles.summary()}")
+        self.logger.info(f"Recoveries by final step (count, mean seconds): {self.recovery.summary()}")
+        self.logger.info(f"Auto-configuration ticks: {self.tick_stats}")
+        self.logger.info(f"Status checks: {self.scheduler.stats()}")
+        self.network_manager.reachability.close()
+        self.event_log.close()
+        logging.getLogger().removeHandler(self.ui_log_handler)
+        self.log_consumer.stop()
         event.accept()
 
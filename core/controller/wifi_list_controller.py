@@ -11,6 +11,9 @@ class WifiListController(QtWidgets.QDialog):
     Manages displaying and interacting with a list of saved Wi-Fi profiles.
     """
 
+    # Name of the Qt SQL connection used by the table view.
+    CONNECTION_NAME = "wifi_list"
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -26,9 +29,15 @@ class WifiListController(QtWidgets.QDialog):
         self.selected_password = None
 
         # 1. Initialize database connection and model
-        db = QtSql.QSqlDatabase.addDatabase("QSQLITE")
-        db.setDatabaseName(resource_path("core/model/data/wifi_profiles.db"))
-        if not db.open():
+        # Reuse the named connection across dialog openings; the database runs in WAL
+        # mode, so this reader does not block writes from WifiProfilesModel.
+        if QtSql.QSqlDatabase.contains(self.CONNECTION_NAME):
+            db = QtSql.QSqlDatabase.database(self.CONNECTION_NAME)
+        else:
+            db = QtSql.QSqlDatabase.addDatabase("QSQLITE", self.CONNECTION_NAME)
+            db.setDatabaseName(DB_FILE)
+            db.setConnectOptions("QSQLITE_BUSY_TIMEOUT=5000")
+        if not db.isOpen() and not db.open():
             self.logger.error("Unable to establish a database connection.")
             show_error("Unable to establish a database connection.", "Could not open database")
             return
@@ -0,0 +1,101 @@
+import sqlite3
+import logging
+
+logger = logging.getLogger("Database")
+
+# Ordered schema migrations: (version, [statements]). Append new versions at the end;
+# never edit a migration that has already shipped.
+MIGRATIONS = [
+    (1, [
+        '''
+        CREATE TABLE IF NOT EXISTS profiles
+        (
+            ssid TEXT PRIMARY KEY,
+            password TEXT NOT NULL
+        )
+        ''',
+    ]),
+    (2, [
+        '''
+        CREATE TABLE IF NOT EXISTS connection_history
+        (
+            ssid TEXT PRIMARY KEY,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            successes INTEGER NOT NULL DEFAULT 0,
+            total_connect_time REAL NOT NULL DEFAULT 0,
+            last_success REAL
+        )
+        ''',
+    ]),
+]
+
+# Allowed values for PRAGMA synchronous, from safest to fastest.
+SYNCHRONOUS_LEVELS = ("EXTRA", "FULL", "NORMAL", "OFF")
+# Allowed values for PRAGMA journal_mode.
+JOURNAL_MODES = ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF")
+
+
+def open_database(path: str, journal_mode: str = "WAL", synchronous: str = "NORMAL") -> sqlite3.Connection:
+    """
+    Opens the profiles database tuned for removable media.
+
+    WAL journaling lets readers (e.g. the Wi-Fi list dialog) proceed while another
+    connection writes, and with `synchronous=NORMAL` a commit no longer fsyncs the
+    database file, only the WAL at checkpoints.
+
+    Args:
+        path: The database file path.
+        journal_mode: One of JOURNAL_MODES; falls back with a warning if unsupported by the file system.
+        synchronous: One of SYNCHRONOUS_LEVELS.
+
+    Returns:
+        The open connection, migrated to the latest schema version.
+
+    Raises:
+        ValueError: If `journal_mode` or `synchronous` is not a known value.
+    """
+    synchronous = synchronous.upper()
+    if synchronous not in SYNCHRONOUS_LEVELS:
+        raise ValueError(f"Invalid synchronous level: {synchronous}")
+    journal_mode = journal_mode.upper()
+    if journal_mode not in JOURNAL_MODES:
+        raise ValueError(f"Invalid journal mode: {journal_mode}")
+
+    # Each connection may be created on the GUI thread and then used exclusively
+    # from the network service thread.
+    conn = sqlite3.connect(path, check_same_thread=False)
+    mode = conn.execute(f"PRAGMA journal_mode={journal_mode}").fetchone()[0]
+    if mode.upper() != journal_mode:
+        logger.warning(f"Journal mode {journal_mode} not available, using {mode}.")
+    conn.execute(f"PRAGMA synchronous={synchronous}")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA busy_timeout=5000")
+    migrate(conn)
+    return conn
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    """Returns the schema version recorded in the database (0 for a new database)."""
+    conn.execute("CREATE TABLE IF NOT EXISTS schema_version (version INTEGER NOT NULL)")
+    row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+    return row[0] or 0
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """
+    Applies all pending migrations, each in its own transaction.
+
+    Returns:
+        The schema version after migrating.
+    """
+    current = schema_version(conn)
+    for version, statements in MIGRATIONS:
+        if version <= current:
+            continue
+        with conn:
+            for statement in statements:
+                conn.execute(statement)
+            conn.execute("INSERT INTO schema_version (version) VALUES (?)", (version,))
+        logger.info(f"Database migrated to schema version {version}.")
+        current = version
+    return current
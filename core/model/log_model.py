@@ -5,15 +5,32 @@ from PyQt6.QtGui import QColor
 class LogListModel(QAbstractListModel):
     """
     A custom QAbstractListModel to manage log messages for a Qt view (e.g., QListView).
+
+    Messages are kept in a fixed-capacity ring buffer; once it is full, the oldest rows
+    are evicted (signalled with rowsRemoved). Incoming messages are collected and
+    inserted as a single batch on `flush()`, so the view repaints once per batch instead
+    of once per line. The model is only touched on the GUI thread: records from other
+    threads arrive through the LogQueueConsumer, which flushes after every drain.
     """
 
-    # Custom signal emitted when a new log message is added.
+    # Custom signal emitted after a batch of log messages has been added.
     log_added = pyqtSignal()
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, capacity=5000):
+        """
+        Args:
+            capacity (int): The maximum number of messages kept.
+        """
         super().__init__(parent)
-        self._logs = []  # List to store the log messages (strings).
-        self._log_levels = []  # List to store the log levels (e.g., "INFO", "ERROR").
+        self.capacity = capacity
+        self._buffer = [None] * capacity  # Ring buffer of (message, level) tuples.
+        self._start = 0  # Buffer position of row 0.
+        self._count = 0
+        self._pending = []  # Messages waiting for the next flush.
+        self.evicted = 0  # Total messages dropped because the buffer was full.
+
+    def _entry(self, row):
+        return self._buffer[(self._start + row) % self.capacity]
 
     def data(self, index, role=Qt.ItemDataRole.DisplayRole):
         """
@@ -24,23 +41,48 @@ class LogListModel(QAbstractListModel):
 
         # Return the log message for the DisplayRole.
         if role == Qt.ItemDataRole.DisplayRole:
-            return self._logs[index.row()]
+            return self._entry(index.row())[0]
 
         return QVariant()  # Return an invalid QVariant for unsupported roles.
 
     def rowCount(self, parent=None):
         """Returns the number of rows in the model, which is the number of logs."""
-        return len(self._logs)
+        return self._count
 
     def add_log(self, message, level="INFO"):
         """
-        Adds a new log message to the model.
+        Queues a new log message; it is inserted with the next `flush()`.
         """
-        self.beginInsertRows(QModelIndex(), self.rowCount(), self.rowCount())
+        self._pending.append((message, level))
+
+    def add_logs(self, entries):
+        """Queues several (message, level) tuples at once."""
+        self._pending.extend(entries)
+
+    def flush(self):
+        """Inserts all queued messages as one batch, evicting the oldest rows if needed."""
+        if not self._pending:
+            return
+        # Messages that would be evicted within this same batch are never shown.
+        batch = self._pending[-self.capacity:]
+        self.evicted += len(self._pending) - len(batch)
+        self._pending = []
 
-        self._logs.append(message)  # Add the log message.
-        self._log_levels.append(level)  # Add the corresponding log level.
+        overflow = self._count + len(batch) - self.capacity
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            for row in range(overflow):
+                self._buffer[(self._start + row) % self.capacity] = None
+            self._start = (self._start + overflow) % self.capacity
+            self._count -= overflow
+            self.evicted += overflow
+            self.endRemoveRows()
 
+        first = self._count
+        self.beginInsertRows(QModelIndex(), first, first + len(batch) - 1)
+        for offset, entry in enumerate(batch):
+            self._buffer[(self._start + first + offset) % self.capacity] = entry
+        self._count += len(batch)
         self.endInsertRows()
 
         self.log_added.emit()
@@ -48,12 +90,15 @@ class LogListModel(QAbstractListModel):
     def clear(self):
         """Clears all log messages from the model."""
         self.beginResetModel()
-        self._logs.clear()
-        self._log_levels.clear()
+        self._buffer = [None] * self.capacity
+        self._start = 0
+        self._count = 0
+        self._pending.clear()
         self.endResetModel()
 
     def all_logs(self):
         """
         Returns all log messages as a single string.
         """
-        return "\n".join(self._logs)
\ No newline at end of file
+        self.flush()
+        return "\n".join(self._entry(row)[0] for row in range(self._count))
@@ -0,0 +1,131 @@
+import time
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+
+class DownsampledSeries:
+    """
+    A time series stored in at most `capacity` buckets. Samples falling into the same
+    bucket are aggregated (count, sum, min, max); when the buffer is full, the bucket width
+    doubles and buckets falling into the same wider bucket are merged. Buckets separated by
+    a gap (e.g. while the app was suspended) are kept apart, so no average spans the gap.
+    Memory therefore stays constant however long the app runs, while the whole history
+    stays visible at a coarser resolution.
+    """
+
+    def __init__(self, capacity=120, resolution=5.0):
+        """
+        Args:
+            capacity (int): The maximum number of buckets (must be even).
+            resolution (float): The initial bucket width in seconds.
+        """
+        self.capacity = capacity
+        self.resolution = resolution
+        self._buckets = []  # [start, count, total, minimum, maximum]
+        self.count = 0
+        self.total = 0.0
+        self.last = None
+        # Incremented on every change so views can skip redrawing unchanged series.
+        self.version = 0
+
+    def add(self, value, timestamp=None):
+        timestamp = time.time() if timestamp is None else timestamp
+        last = self._buckets[-1] if self._buckets else None
+        if last is not None and timestamp < last[0] + self.resolution:
+            last[1] += 1
+            last[2] += value
+            last[3] = min(last[3], value)
+            last[4] = max(last[4], value)
+        else:
+            start = timestamp - timestamp % self.resolution
+            self._buckets.append([start, 1, value, value, value])
+            if len(self._buckets) > self.capacity:
+                self._compact()
+        self.count += 1
+        self.total += value
+        self.last = value
+        self.version += 1
+
+    def _compact(self):
+        # Sparse series may need several doublings before enough buckets coincide.
+        while len(self._buckets) > self.capacity:
+            self.resolution *= 2
+            merged = []
+            for start, count, total, minimum, maximum in self._buckets:
+                start -= start % self.resolution
+                last = merged[-1] if merged else None
+                if last is not None and last[0] == start:
+                    last[1] += count
+                    last[2] += total
+                    last[3] = min(last[3], minimum)
+                    last[4] = max(last[4], maximum)
+                else:
+                    merged.append([start, count, total, minimum, maximum])
+            self._buckets = merged
+
+    def points(self):
+        """Returns [(bucket_start, mean)] in time order."""
+        return [(start, total / count) for start, count, total, _, _ in self._buckets]
+
+    @property
+    def mean(self):
+        """The mean of all samples ever added, or None."""
+        return self.total / self.count if self.count else None
+
+    def __len__(self):
+        return len(self._buckets)
+
+
+class MetricsModel(QObject):
+    """
+    Aggregates connection metrics into DownsampledSeries for the metrics panel:
+
+    - 'internet', 'wifi', 'tunnel': availability in percent, sampled every `sample_interval` seconds
+      from the shared EventLog state.
+    - 'rtt': latency (ms) of the winning reachability probe of each status check.
+    - 'reconnect': Wi-Fi connect durations (s).
+
+    `record` may be called from any thread; series are only modified on the model's thread.
+    """
+
+    # Emitted with the series name after it changed.
+    changed = pyqtSignal(str)
+    # Carries samples recorded on other threads to the model's thread.
+    _sample = pyqtSignal(str, float)
+
+    AVAILABILITY = ('internet', 'wifi', 'tunnel')
+
+    def __init__(self, event_log, sample_interval=5.0, capacity=120, parent=None):
+        super().__init__(parent)
+        self.event_log = event_log
+        self.series = {name: DownsampledSeries(capacity, sample_interval) for name in self.AVAILABILITY}
+        self.series['rtt'] = DownsampledSeries(capacity, sample_interval)
+        self.series['reconnect'] = DownsampledSeries(capacity, 60.0)
+        self._sample.connect(self.add_sample)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(int(sample_interval * 1000))
+        self._timer.timeout.connect(self.sample_states)
+        self._timer.start()
+
+    def add_sample(self, name, value):
+        self.series[name].add(value)
+        self.changed.emit(name)
+
+    def record(self, name, value):
+        """Thread-safe: queues a sample for the series `name`."""
+        self._sample.emit(name, float(value))
+
+    def sample_states(self):
+        """Adds one availability sample per component whose state is known."""
+        for name in self.AVAILABILITY:
+            state = self.event_log.state(name)
+            if state is not None:
+                self.add_sample(name, 100.0 if state else 0.0)
+
+    def on_event(self, event):
+        """EventLog listener: collects Wi-Fi reconnect durations. Called on any thread."""
+        if event.component == 'wifi' and event.new and event.latency is not None:
+            self.record('reconnect', event.latency)
+
+    def stop(self):
+        self._timer.stop()
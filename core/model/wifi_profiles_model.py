@@ -1,27 +1,47 @@
 import sqlite3
 import os
+import time
 import logging
+from typing import NamedTuple
 from PyQt6 import QtWidgets
 from core.view.duplicate_profiles_dialog import DuplicateProfilesDialog
+from core.model.database import open_database, schema_version
 from core.utils.paths import resource_path
 
 # Path to the SQLite database file.
 DB_FILE = resource_path('core/model/data/wifi_profiles.db')
 
 
+class ProfileImportResult(NamedTuple):
+    """The structured diff produced by `WifiProfilesModel.import_profiles`."""
+    new: list
+    same: list
+    conflicting: list
+    timings: dict
+
+
 class WifiProfilesModel:
     """
     Manages all database operations related to Wi-Fi profiles, including
     connecting to the database, creating tables, and handling profile data.
     """
-    def __init__(self):
+    def __init__(self, synchronous="NORMAL", journal_mode="WAL"):
+        """
+        Args:
+            synchronous (str): The SQLite synchronous level (see `database.SYNCHRONOUS_LEVELS`).
+            journal_mode (str): The SQLite journal mode (see `database.JOURNAL_MODES`).
+        """
         self.logger = logging.getLogger(self.__class__.__name__)
         self.db_path = DB_FILE
+        self.synchronous = synchronous
+        self.journal_mode = journal_mode
         self.ensure_db_directory()
         self.conn = None
         self.cursor = None
+        # In-memory {ssid: password} index and the PRAGMA data_version it was built at.
+        self._index = None
+        self._index_version = None
         self.connect()
-        self.create_table()
 
     def ensure_db_directory(self):
         """Creates the directory for the database file if it doesn't exist."""
@@ -34,31 +54,19 @@ class WifiProfilesModel:
                 self.logger.error(f"Failed to create data directory: {e}")
 
     def connect(self):
-        """Establishes a connection to the SQLite database."""
+        """Establishes a tuned connection to the SQLite database and applies pending migrations."""
         try:
-            self.conn = sqlite3.connect(self.db_path)
+            try:
+                self.conn = open_database(self.db_path, journal_mode=self.journal_mode, synchronous=self.synchronous)
+            except ValueError as e:
+                self.logger.warning(f"{e}. Using the default database settings.")
+                self.conn = open_database(self.db_path)
             self.cursor = self.conn.cursor()
-            self.logger.info("Database connection established.")
+            self.logger.info(f"Database connection established (schema version {schema_version(self.conn)}).")
         except sqlite3.Error as e:
             self.logger.error(f"Failed to connect to the database: {e}")
             self.conn = None
 
-    def create_table(self):
-        """Creates the 'profiles' table if it does not already exist."""
-        if self.conn:
-            try:
-                self.cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS profiles
-                    (
-                        ssid TEXT PRIMARY KEY,
-                        password TEXT NOT NULL
-                    )
-                ''')
-                self.conn.commit()
-                self.logger.info("Database table 'profiles' is ready.")
-            except sqlite3.Error as e:
-                self.logger.error(f"Error creating table: {e}")
-
     def collect_duplicate_profiles(self, profiles):
         """
         Checks a list of Wi-Fi profiles for duplicates in the database.
@@ -67,37 +75,23 @@ class WifiProfilesModel:
         if not self.conn:
             return False
 
-        duplicate_profiles = []
-        new_profiles = []
-
         try:
-            for ssid, password in profiles:
-                self.cursor.execute('SELECT password FROM profiles WHERE ssid = ?', (ssid,))
-                existing_profile = self.cursor.fetchone()
-
-                if existing_profile:
-                    # If a profile with the same SSID exists, check if the password is different.
-                    if existing_profile[0] != password:
-                        self.logger.info(f"Duplicate profile '{ssid}' found with a different password.")
-                        duplicate_profiles.append((ssid, password))
-                    else:
-                        self.logger.info(f"Profile '{ssid}' already exists with same password. Skipping.")
-                else:
-                    self.logger.info(f"Adding Wi-Fi '{ssid}' as a new profile.")
-                    new_profiles.append((ssid, password))
-
-            # Save all new profiles.
-            for ssid, password in new_profiles:
-                self.save_profile(ssid, password)
+            # New profiles are inserted in bulk; existing ones are only compared.
+            result = self.import_profiles(profiles)
+            for ssid, _ in result.new:
+                self.logger.debug(f"Added Wi-Fi '{ssid}' as a new profile.")
+            for ssid, _ in result.same:
+                self.logger.debug(f"Profile '{ssid}' already exists with same password. Skipping.")
+            for ssid, _ in result.conflicting:
+                self.logger.info(f"Duplicate profile '{ssid}' found with a different password.")
 
             # Handle duplicates by showing a dialog to the user.
-            if duplicate_profiles:
-                success = self.handle_duplicate_profiles(duplicate_profiles)
+            if result.conflicting:
+                success = self.handle_duplicate_profiles(result.conflicting)
                 if not success:
                     self.logger.warning("User cancelled duplicate profile handling.")
 
-            self.conn.commit()
-            total_processed = len(new_profiles) + len(duplicate_profiles)
+            total_processed = len(result.new) + len(result.conflicting)
             self.logger.info(f"Successfully processed {total_processed} profiles.")
             return True
 
@@ -106,6 +100,67 @@ class WifiProfilesModel:
             self.conn.rollback()
             return False
 
+    def import_profiles(self, profiles):
+        """
+        Imports many Wi-Fi profiles with set-based queries: existing rows are matched in
+        one join against a temporary table and all new rows are inserted with a single
+        `executemany` in one transaction. Existing rows are never modified here.
+
+        Args:
+            profiles: An iterable of (ssid, password) tuples. Later duplicates of an SSID are ignored.
+
+        Returns:
+            ProfileImportResult: The new, unchanged and conflicting profiles plus timings
+            (seconds) of the lookup and insert phases.
+
+        Raises:
+            sqlite3.Error: If the import failed; the transaction is rolled back.
+        """
+        started = time.perf_counter()
+        incoming = {}
+        for ssid, password in profiles:
+            incoming.setdefault(ssid, password)
+
+        with self.conn:
+            self.cursor.execute(
+                'CREATE TEMP TABLE IF NOT EXISTS incoming_profiles (ssid TEXT PRIMARY KEY, password TEXT)'
+            )
+            self.cursor.execute('DELETE FROM incoming_profiles')
+            self.cursor.executemany('INSERT INTO incoming_profiles (ssid, password) VALUES (?, ?)', incoming.items())
+            self.cursor.execute('''
+                SELECT i.ssid, p.password
+                FROM incoming_profiles AS i
+                JOIN profiles AS p ON p.ssid = i.ssid
+            ''')
+            existing = dict(self.cursor.fetchall())
+            self.cursor.execute('DELETE FROM incoming_profiles')
+            lookup_done = time.perf_counter()
+
+            new_profiles, same_profiles, conflicting_profiles = [], [], []
+            for ssid, password in incoming.items():
+                if ssid not in existing:
+                    new_profiles.append((ssid, password))
+                elif existing[ssid] == password:
+                    same_profiles.append((ssid, password))
+                else:
+                    conflicting_profiles.append((ssid, password))
+
+            self.cursor.executemany('INSERT INTO profiles (ssid, password) VALUES (?, ?)', new_profiles)
+            if new_profiles:
+                self._index = None
+
+        finished = time.perf_counter()
+        timings = {
+            'lookup': lookup_done - started,
+            'insert': finished - lookup_done,
+            'total': finished - started,
+        }
+        self.logger.info(
+            f"Imported {len(incoming)} profiles in {timings['total'] * 1000:.1f}ms: "
+            f"{len(new_profiles)} new, {len(same_profiles)} unchanged, {len(conflicting_profiles)} conflicting."
+        )
+        return ProfileImportResult(new_profiles, same_profiles, conflicting_profiles, timings)
+
     def save_profile(self, ssid, password):
         """Saves a single Wi-Fi profile to the database."""
         if not self.conn:
@@ -113,6 +168,7 @@ class WifiProfilesModel:
         try:
             self.cursor.execute('INSERT INTO profiles (ssid, password) VALUES (?, ?)', (ssid, password))
             self.conn.commit()
+            self._index = None
             self.logger.info(f"Profile for '{ssid}' saved successfully.")
             return True
         except sqlite3.Error as e:
@@ -156,6 +212,7 @@ class WifiProfilesModel:
 
             if success_count > 0:
                 self.conn.commit()
+                self._index = None
                 self.logger.info(f"Successfully updated {success_count} duplicate profiles.")
                 return True
 
@@ -178,6 +235,75 @@ class WifiProfilesModel:
             self.logger.error(f"Database error retrieving profiles: {e}")
             return []
 
+    def get_profiles_index(self):
+        """
+        Returns an in-memory {ssid: password} index of all saved profiles.
+        The table is only re-read after this model wrote to it or another connection
+        committed a change (detected cheaply through PRAGMA data_version).
+        """
+        if not self.conn:
+            return {}
+        try:
+            version = self.cursor.execute('PRAGMA data_version').fetchone()[0]
+            if self._index is None or version != self._index_version:
+                self.cursor.execute('SELECT ssid, password FROM profiles')
+                self._index = dict(self.cursor.fetchall())
+                self._index_version = version
+                self.logger.debug(f"Profile index rebuilt with {len(self._index)} profiles.")
+            return self._index
+        except sqlite3.Error as e:
+            self.logger.error(f"Database error building profile index: {e}")
+            return {}
+
+    def record_connection(self, ssid, success, elapsed=None):
+        """
+        Records the outcome of a connection attempt for auto-selection ranking.
+
+        Args:
+            ssid (str): The network the connection was attempted to.
+            success (bool): Whether the connection was established.
+            elapsed (float): Time to connect in seconds, if successful.
+        """
+        if not self.conn:
+            return
+        try:
+            with self.conn:
+                self.cursor.execute('''
+                    INSERT INTO connection_history (ssid, attempts, successes, total_connect_time, last_success)
+                    VALUES (?, 1, ?, ?, ?)
+                    ON CONFLICT(ssid) DO UPDATE SET
+                        attempts = attempts + 1,
+                        successes = successes + excluded.successes,
+                        total_connect_time = total_connect_time + excluded.total_connect_time,
+                        last_success = COALESCE(excluded.last_success, last_success)
+                ''', (
+                    ssid,
+                    1 if success else 0,
+                    elapsed if success and elapsed else 0.0,
+                    time.time() if success else None,
+                ))
+        except sqlite3.Error as e:
+            self.logger.error(f"Database error recording connection for '{ssid}': {e}")
+
+    def get_connection_history(self):
+        """
+        Returns the connection history of all networks.
+
+        Returns:
+            dict: {ssid: (attempts, successes, average_connect_time or None)}.
+        """
+        if not self.conn:
+            return {}
+        try:
+            self.cursor.execute('SELECT ssid, attempts, successes, total_connect_time FROM connection_history')
+            return {
+                ssid: (attempts, successes, total / successes if successes else None)
+                for ssid, attempts, successes, total in self.cursor.fetchall()
+            }
+        except sqlite3.Error as e:
+            self.logger.error(f"Database error retrieving connection history: {e}")
+            return {}
+
     def get_password(self, ssid):
         """Retrieves the password for a given SSID."""
         if not self.conn:
@@ -203,6 +329,7 @@ class WifiProfilesModel:
             self.cursor.execute('DELETE FROM profiles WHERE ssid = ?', (ssid,))
             if self.cursor.rowcount > 0:
                 self.conn.commit()
+                self._index = None
                 self.logger.info(f"Profile for '{ssid}' deleted successfully.")
                 return True
             else:
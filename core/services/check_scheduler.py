@@ -0,0 +1,227 @@
+import threading
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from PyQt6.QtCore import QThread, pyqtSignal, QObject
+
+
+class StatusStore:
+    """
+    The latest value of every status check ('wifi', 'internet', 'psiphon', 'tunnel'),
+    shared by the scheduler, the auto-configuration and the UI. Safe to use from any thread.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values = {}
+        self._updated = {}
+
+    def update(self, name: str, value) -> bool:
+        """
+        Stores the value of a check.
+
+        Returns:
+            bool: True if the value changed (or is the first one seen).
+        """
+        with self._lock:
+            changed = name not in self._values or self._values[name] != value
+            self._values[name] = value
+            self._updated[name] = time.monotonic()
+            return changed
+
+    def get(self, name: str, default=None):
+        with self._lock:
+            return self._values.get(name, default)
+
+    def age(self, name: str):
+        """Returns the seconds since `name` was last updated, or None if never."""
+        with self._lock:
+            updated = self._updated.get(name)
+        return time.monotonic() - updated if updated is not None else None
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return dict(self._values)
+
+    def clear(self):
+        """Forgets all values, so the next result of every check counts as a change."""
+        with self._lock:
+            self._values.clear()
+            self._updated.clear()
+
+
+class ScheduledCheck:
+    """A status check run by the CheckScheduler every `interval` seconds."""
+
+    def __init__(self, name, fn, interval, priority=0):
+        self.name = name
+        self.fn = fn
+        self.interval = interval
+        # Lower values run first when several checks are due together.
+        self.priority = priority
+        self.next_due = 0.0
+        self.running = False
+        self.runs = 0
+        self.failures = 0
+        self.total_time = 0.0
+
+
+class CheckScheduler(QThread):
+    """
+    Runs each status check at its own interval instead of all of them on one timer:
+    cheap checks (association state) can poll every few seconds while the HTTP
+    reachability probe only runs every half minute. Statuses observed elsewhere (e.g. by
+    the Psiphon monitor) are fed in with `publish`.
+
+    Due checks are started in priority order on a small worker pool, so a slow probe does
+    not hold back the others; a check still running when it is due again is not started
+    twice. Results go to a shared StatusStore, and `status_changed` is emitted only when
+    a value changed.
+    """
+
+    # How long `stop()` waits for the scheduling loop by default (milliseconds).
+    STOP_TIMEOUT_MS = 1000
+
+    # Emitted with (check name, new value) when the stored value of a check changed.
+    status_changed = pyqtSignal(str, object)
+
+    def __init__(self, store: StatusStore = None, max_workers: int = 2, parent: QObject = None):
+        """
+        Args:
+            store: The status store to update; a new one is created if omitted.
+            max_workers: The number of checks that may run at the same time.
+            parent: The parent QObject.
+        """
+        super().__init__(parent)
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.store = store or StatusStore()
+        self.max_workers = max_workers
+        self.running = False
+        self._checks = {}
+        self._lock = threading.Lock()
+        # Set to re-evaluate the schedule (see `trigger`, `stop` and finished checks).
+        self._wake = threading.Event()
+
+    def add(self, name: str, fn, interval: float, priority: int = 0):
+        """
+        Registers a check. `fn()` returns the value stored under `name`.
+
+        Args:
+            name: The check and status name.
+            fn: The blocking callable performing the check.
+            interval: Seconds between the end of one run and the start of the next.
+            priority: Lower values run first.
+        """
+        with self._lock:
+            self._checks[name] = ScheduledCheck(name, fn, interval, priority)
+        self._wake.set()
+
+    def set_interval(self, name: str, interval: float):
+        """Changes the interval of a check; the next run is rescheduled accordingly."""
+        with self._lock:
+            check = self._checks[name]
+            check.next_due += interval - check.interval
+            check.interval = interval
+        self._wake.set()
+
+    def trigger(self, *names):
+        """Makes the given checks (all checks if none are given) due immediately."""
+        with self._lock:
+            for check in self._checks.values():
+                if not names or check.name in names:
+                    check.next_due = 0.0
+        self._wake.set()
+
+    def publish(self, name: str, value) -> bool:
+        """
+        Stores a value observed outside the scheduler (e.g. by a configuration run) and
+        emits `status_changed` if it changed.
+
+        Returns:
+            bool: True if the value changed.
+        """
+        changed = self.store.update(name, value)
+        if changed:
+            self.status_changed.emit(name, value)
+        return changed
+
+    def _execute(self, check):
+        started = time.monotonic()
+        failed = False
+        try:
+            value = check.fn()
+        except Exception as e:
+            self.logger.error(f"Check '{check.name}' failed: {e}")
+            value = None
+            failed = True
+        finished = time.monotonic()
+        with self._lock:
+            check.runs += 1
+            check.failures += failed
+            check.total_time += finished - started
+            check.next_due = finished + check.interval
+            check.running = False
+        # A check finishing after `stop()` must not report into a stopped configuration.
+        if value is not None and self.running:
+            self.publish(check.name, value)
+        self._wake.set()
+
+    def run(self):
+        """The scheduling loop: starts due checks and sleeps until the next one is due."""
+        self.running = True
+        self.logger.info("Check scheduler started.")
+        pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="check")
+        submitted = []
+        try:
+            while self.running:
+                now = time.monotonic()
+                with self._lock:
+                    due = sorted((c for c in self._checks.values() if not c.running and c.next_due <= now),
+                                 key=lambda c: (c.priority, c.next_due))
+                    for check in due:
+                        check.running = True
+                    waiting = [c.next_due for c in self._checks.values() if not c.running]
+                submitted = [(c, f) for c, f in submitted if not f.done()]
+                for check in due:
+                    submitted.append((check, pool.submit(self._execute, check)))
+
+                timeout = max(0.0, min(waiting) - now) if waiting else None
+                self._wake.wait(timeout)
+                self._wake.clear()
+        finally:
+            # Checks still running (e.g. an HTTP probe) finish on their own; nobody waits for them.
+            pool.shutdown(wait=False, cancel_futures=True)
+            with self._lock:
+                # Checks that never started are free to run again after a restart.
+                for check, future in submitted:
+                    if future.cancelled():
+                        check.running = False
+        self.logger.info("Check scheduler stopped.")
+
+    def stats(self) -> dict:
+        """Returns {check: {'interval', 'runs', 'failures', 'mean_ms'}}."""
+        with self._lock:
+            return {
+                check.name: {
+                    'interval': check.interval,
+                    'runs': check.runs,
+                    'failures': check.failures,
+                    'mean_ms': round(check.total_time / check.runs * 1000, 1) if check.runs else None,
+                }
+                for check in self._checks.values()
+            }
+
+    def stop(self, timeout_ms: int = STOP_TIMEOUT_MS) -> bool:
+        """
+        Stops scheduling without waiting for running checks, whose results are discarded.
+        The scheduler can be restarted.
+
+        Returns:
+            bool: True if the scheduling loop ended within `timeout_ms`.
+        """
+        self.running = False
+        self._wake.set()
+        stopped = self.wait(timeout_ms)
+        if not stopped:
+            self.logger.warning(f"Check scheduler did not stop within {timeout_ms} ms.")
+        return stopped
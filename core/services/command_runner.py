@@ -0,0 +1,217 @@
+import os
+import re
+import subprocess
+import threading
+import time
+import logging
+from abc import ABC, abstractmethod
+from typing import NamedTuple, Optional
+
+
+class CommandResult(NamedTuple):
+    """The outcome of a single command execution."""
+    args: list
+    returncode: int
+    stdout: str
+    stderr: str
+    elapsed: float
+
+
+def command_key(args) -> str:
+    """
+    Returns the stable part of a command used to group latency counters,
+    e.g. `netsh wlan show profile` for `netsh wlan show profile name="x" key=clear`.
+    """
+    key = []
+    for arg in args:
+        if '=' in arg or '"' in arg:
+            break
+        key.append(os.path.basename(arg) if not key else arg)
+    return " ".join(key)
+
+
+def fixture_name(args) -> str:
+    """Returns the file name used to store the captured output of a command."""
+    return re.sub(r'[^A-Za-z0-9]+', '_', " ".join(args)).strip('_').lower() + ".txt"
+
+
+class CommandStats:
+    """Thread-safe per-command counters: number of spawns, total and worst latency."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def record(self, key: str, elapsed: float):
+        with self._lock:
+            count, total, worst = self._stats.get(key, (0, 0.0, 0.0))
+            self._stats[key] = (count + 1, total + elapsed, max(worst, elapsed))
+
+    def snapshot(self) -> dict:
+        """Returns {command: {'count', 'total', 'mean', 'max'}}."""
+        with self._lock:
+            return {
+                key: {'count': count, 'total': total, 'mean': total / count, 'max': worst}
+                for key, (count, total, worst) in self._stats.items()
+            }
+
+    @property
+    def spawn_count(self) -> int:
+        with self._lock:
+            return sum(count for count, _, _ in self._stats.values())
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def summary(self) -> str:
+        """Returns a one-line human-readable summary for the log."""
+        parts = [
+            f"{key}: {s['count']}x avg {s['mean'] * 1000:.0f}ms max {s['max'] * 1000:.0f}ms"
+            for key, s in sorted(self.snapshot().items())
+        ]
+        return f"{self.spawn_count} commands run" + (f" ({'; '.join(parts)})" if parts else "")
+
+
+class CommandRunner(ABC):
+    """
+    Base class for running external commands (`netsh`, `tasklist`, ...).
+    Subclasses implement `_execute` and `popen`; this class adds latency counters and `check` handling.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.stats = CommandStats()
+
+    def run(self, args, check: bool = False, timeout: Optional[float] = None) -> CommandResult:
+        """
+        Runs a command to completion and returns its captured output.
+
+        Raises:
+            subprocess.CalledProcessError: If `check` is set and the command failed.
+            subprocess.TimeoutExpired: If the command did not finish within `timeout`.
+        """
+        started = time.perf_counter()
+        try:
+            returncode, stdout, stderr = self._execute(list(args), timeout)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.stats.record(command_key(args), elapsed)
+
+        result = CommandResult(list(args), returncode, stdout or "", stderr or "", elapsed)
+        if check and returncode != 0:
+            raise subprocess.CalledProcessError(returncode, args, result.stdout, result.stderr)
+        return result
+
+    @abstractmethod
+    def popen(self, args):
+        """Starts a long-running process without waiting for it."""
+
+    @abstractmethod
+    def _execute(self, args, timeout):
+        """Returns (returncode, stdout, stderr) for the given command."""
+
+
+class SubprocessRunner(CommandRunner):
+    """
+    Runs commands with `subprocess`, hiding the console window on Windows.
+    If `record_dir` is given, every output is also saved there for later replay.
+
+    Console tools such as `netsh` write in the OEM code page (e.g. cp850, cp866), not
+    UTF-8, so their output is decoded with the 'oem' codec on Windows; decoding it as
+    UTF-8 would turn every localized label into replacement characters.
+    """
+
+    def __init__(self, record_dir: Optional[str] = None, encoding: Optional[str] = None):
+        """
+        Args:
+            record_dir: Directory to save every command output to, for later replay.
+            encoding: The codec of command output; defaults to the OEM code page on Windows.
+        """
+        super().__init__()
+        self.record_dir = record_dir
+        self.encoding = encoding or ('oem' if os.name == 'nt' else 'utf-8')
+
+        # Define startupinfo to hide the console window for subprocess calls (Windows only)
+        self.startupinfo = None
+        if os.name == 'nt':
+            self.startupinfo = subprocess.STARTUPINFO()
+            self.startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+            self.startupinfo.wShowWindow = subprocess.SW_HIDE
+
+    def _execute(self, args, timeout):
+        completed = subprocess.run(
+            args,
+            capture_output=True,
+            text=True,
+            encoding=self.encoding,
+            errors='replace',
+            timeout=timeout,
+            startupinfo=self.startupinfo
+        )
+        if self.record_dir:
+            self._record(args, completed.stdout)
+        return completed.returncode, completed.stdout, completed.stderr
+
+    def _record(self, args, stdout):
+        try:
+            os.makedirs(self.record_dir, exist_ok=True)
+            with open(os.path.join(self.record_dir, fixture_name(args)), "w", encoding="utf-8") as f:
+                f.write(stdout or "")
+        except OSError as e:
+            self.logger.error(f"Failed to record command output: {e}")
+
+    def popen(self, args):
+        return subprocess.Popen(args, startupinfo=self.startupinfo)
+
+
+class ReplayRunner(CommandRunner):
+    """
+    Replays captured command outputs instead of spawning processes, so the
+    network code can be profiled and load-tested on any platform.
+
+    Outputs are looked up by the exact command first and then by its `command_key`.
+    Unknown commands fail with return code 1.
+    """
+
+    def __init__(self, fixtures: Optional[dict] = None, fixture_dir: Optional[str] = None, latency: float = 0.0):
+        """
+        Args:
+            fixtures: Mapping of command (string or argument list) to captured stdout.
+            fixture_dir: Directory of outputs captured by `SubprocessRunner(record_dir=...)`.
+            latency: Simulated per-command spawn latency in seconds.
+        """
+        super().__init__()
+        self.latency = latency
+        self.launched = []
+        self._fixtures = {}
+        for command, stdout in (fixtures or {}).items():
+            self.add(command, stdout)
+        if fixture_dir:
+            self.load_dir(fixture_dir)
+
+    def add(self, command, stdout: str, returncode: int = 0):
+        """Registers the output for a command given as a string or an argument list."""
+        args = command.split() if isinstance(command, str) else list(command)
+        self._fixtures[fixture_name(args)] = (returncode, stdout)
+
+    def load_dir(self, fixture_dir: str):
+        """Loads every captured `*.txt` output from a directory."""
+        for name in os.listdir(fixture_dir):
+            if name.endswith(".txt"):
+                with open(os.path.join(fixture_dir, name), encoding="utf-8") as f:
+                    self._fixtures[name] = (0, f.read())
+
+    def _execute(self, args, timeout):
+        if self.latency:
+            time.sleep(self.latency)
+        fixture = self._fixtures.get(fixture_name(args)) or self._fixtures.get(fixture_name(command_key(args).split()))
+        if fixture is None:
+            return 1, "", f"No recorded output for: {' '.join(args)}"
+        returncode, stdout = fixture
+        return returncode, stdout, ""
+
+    def popen(self, args):
+        self.stats.record(command_key(args), 0.0)
+        self.launched.append(list(args))
+        return None
@@ -0,0 +1,165 @@
+import json
+import sys
+import threading
+import time
+import logging
+from typing import NamedTuple, Optional
+
+
+# Components whose state is up (truthy) or down; other components (e.g. 'recovery') log outcomes.
+STATE_COMPONENTS = ('wifi', 'internet', 'psiphon', 'tunnel')
+
+
+class StateEvent(NamedTuple):
+    """One state transition of a component ('wifi', 'internet', 'psiphon', 'tunnel')."""
+    ts: float
+    component: str
+    old: object
+    new: object
+    latency: Optional[float] = None
+    cause: Optional[str] = None
+
+
+class EventLog:
+    """
+    Records state transitions as compact JSON lines:
+
+        {"ts": 1760000000.0, "component": "wifi", "old": false, "new": true, "latency": 2.41, "cause": "connect_wifi"}
+
+    Only changes are written; the first observation of a component is written with
+    `old` set to null as a baseline. `latency` is the time the transition took when
+    known (e.g. connecting), `cause` the operation that observed it. Safe to call from
+    any thread. Without a path, states are tracked in memory only.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        self._states = {}
+        self._file = None
+        self._listeners = []
+
+    def subscribe(self, callback):
+        """Calls `callback(event)` for every recorded event, on the recording thread."""
+        self._listeners.append(callback)
+
+    def record(self, component: str, state, cause: Optional[str] = None,
+               latency: Optional[float] = None, always: bool = False) -> Optional[StateEvent]:
+        """
+        Records the current state of a component.
+
+        Args:
+            always: Write the event even if the state did not change (e.g. for incidents).
+
+        Returns:
+            The StateEvent written, or None if the state did not change.
+        """
+        with self._lock:
+            old = self._states.get(component)
+            if component in self._states and old == state and not always:
+                return None
+            self._states[component] = state
+            event = StateEvent(time.time(), component, old, state,
+                               round(latency, 3) if latency is not None else None, cause)
+            if self.path:
+                try:
+                    if self._file is None:
+                        self._file = open(self.path, "a", encoding="utf-8")
+                    self._file.write(json.dumps(event._asdict(), separators=(",", ":")) + "\n")
+                    self._file.flush()
+                except OSError as e:
+                    self.logger.error(f"Failed to write state event: {e}")
+        self.logger.debug(f"State event: {event}")
+        for callback in self._listeners:
+            callback(event)
+        return event
+
+    def state(self, component: str):
+        """Returns the last recorded state of a component, or None."""
+        with self._lock:
+            return self._states.get(component)
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def load_events(path: str, component: Optional[str] = None, since: Optional[float] = None) -> list:
+    """
+    Reads the events of a JSONL event log, skipping malformed lines.
+
+    Args:
+        path: The event log file.
+        component: Only return events of this component.
+        since: Only return events at or after this UNIX timestamp.
+    """
+    events = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                event = StateEvent(**json.loads(line))
+            except (ValueError, TypeError):
+                continue
+            if component and event.component != component:
+                continue
+            if since is not None and event.ts < since:
+                continue
+            events.append(event)
+    return events
+
+
+def summarize(events, now: Optional[float] = None, components=STATE_COMPONENTS) -> dict:
+    """
+    Computes availability figures per component from a time-ordered event list.
+    A truthy state counts as up.
+
+    Returns:
+        dict: {component: {'uptime': fraction of observed time up, 'outages': count,
+               'mttr': mean seconds from down to up (None if never recovered),
+               'mean_latency': mean reported transition latency to up (None if unknown)}}
+    """
+    now = now if now is not None else time.time()
+    by_component = {}
+    for event in events:
+        if event.component in components:
+            by_component.setdefault(event.component, []).append(event)
+
+    summary = {}
+    for component, items in by_component.items():
+        up_time = observed = 0.0
+        outages = 0
+        repairs = []
+        latencies = []
+        down_since = None
+        for event, following in zip(items, items[1:] + [None]):
+            span = (following.ts if following else now) - event.ts
+            observed += span
+            if event.new:
+                up_time += span
+                if down_since is not None:
+                    repairs.append(event.ts - down_since)
+                    down_since = None
+                if event.latency is not None:
+                    latencies.append(event.latency)
+            elif down_since is None and event.old is not None:
+                # A component first observed down (at startup) is not an outage.
+                down_since = event.ts
+                outages += 1
+        summary[component] = {
+            'uptime': up_time / observed if observed else None,
+            'outages': outages,
+            'mttr': sum(repairs) / len(repairs) if repairs else None,
+            'mean_latency': sum(latencies) / len(latencies) if latencies else None,
+        }
+    return summary
+
+
+if __name__ == "__main__":
+    # Usage: python -m core.services.event_log <events.jsonl> [hours]
+    hours = float(sys.argv[2]) if len(sys.argv) > 2 else None
+    start = time.time() - hours * 3600 if hours else None
+    for name, figures in summarize(load_events(sys.argv[1], since=start)).items():
+        print(name, json.dumps(figures))
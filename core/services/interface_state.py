@@ -0,0 +1,49 @@
+import threading
+import time
+import logging
+from core.services.netsh_parser import InterfaceState, parse_interfaces
+
+
+class InterfaceSnapshot:
+    """
+    A short-lived, shared snapshot of `netsh wlan show interfaces`.
+    All status queries within `ttl` seconds reuse one parsed result; callers that
+    change the link (connect/disconnect) must call `invalidate()`.
+    """
+
+    def __init__(self, runner, ttl: float = 2.0):
+        self.runner = runner
+        self.ttl = ttl
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        self._state = None
+        self._taken_at = 0.0
+
+    def get(self, timeout=None) -> InterfaceState:
+        """
+        Returns the current interface state, refreshing it if the snapshot expired.
+        The connected interface is preferred when several are present.
+
+        Args:
+            timeout (float, optional): Upper bound (seconds) for the `netsh` query.
+
+        Raises:
+            subprocess.CalledProcessError: If `netsh` failed.
+            subprocess.TimeoutExpired: If `netsh` did not answer within `timeout`.
+        """
+        with self._lock:
+            if self._state is not None and time.monotonic() - self._taken_at < self.ttl:
+                return self._state
+
+            result = self.runner.run(["netsh", "wlan", "show", "interfaces"], check=True, timeout=timeout)
+            interfaces = parse_interfaces(result.stdout)
+            connected = [i for i in interfaces if i.connected]
+            self._state = (connected or interfaces or [InterfaceState()])[0]
+            self._taken_at = time.monotonic()
+            self.logger.debug(f"Interface snapshot refreshed: {self._state}")
+            return self._state
+
+    def invalidate(self):
+        """Drops the cached snapshot so the next `get()` queries the system again."""
+        with self._lock:
+            self._state = None
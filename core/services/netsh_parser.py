@@ -0,0 +1,277 @@
+import re
+from typing import NamedTuple, Optional
+
+# Localized netsh labels, by locale: {canonical_key: (label, ...)}.
+# SSID/BSSID are not translated by Windows and are matched separately.
+LABELS = {
+    'en': {
+        'profile': ("All User Profile", "Current User Profile"),
+        'key_content': ("Key Content",),
+        'name': ("Name",),
+        'state': ("State",),
+        'signal': ("Signal",),
+        'radio_type': ("Radio type",),
+        'channel': ("Channel",),
+        'band': ("Band",),
+        'authentication': ("Authentication",),
+        'cipher': ("Encryption", "Cipher"),
+    },
+    'de': {
+        'profile': ("Profil für alle Benutzer", "Profil für aktuellen Benutzer"),
+        'key_content': ("Schlüsselinhalt",),
+        'name': ("Name",),
+        'state': ("Status",),
+        'signal': ("Signal",),
+        'radio_type': ("Funktyp",),
+        'channel': ("Kanal",),
+        'band': ("Band",),
+        'authentication': ("Authentifizierung",),
+        'cipher': ("Verschlüsselung",),
+    },
+    'fr': {
+        'profile': ("Profil Tous les utilisateurs", "Profil de l'utilisateur actuel"),
+        'key_content': ("Contenu de la clé",),
+        'name': ("Nom",),
+        'state': ("État",),
+        'signal': ("Signal",),
+        'radio_type': ("Type de radio",),
+        'channel': ("Canal",),
+        'band': ("Bande",),
+        'authentication': ("Authentification",),
+        'cipher': ("Chiffrement",),
+    },
+    'es': {
+        'profile': ("Perfil de todos los usuarios", "Perfil de usuario actual"),
+        'key_content': ("Contenido de la clave",),
+        'name': ("Nombre",),
+        'state': ("Estado",),
+        'signal': ("Señal",),
+        'radio_type': ("Tipo de radio",),
+        'channel': ("Canal",),
+        'band': ("Banda",),
+        'authentication': ("Autenticación",),
+        'cipher': ("Cifrado",),
+    },
+    'ru': {
+        'profile': ("Все профили пользователей", "Профиль текущего пользователя"),
+        'key_content': ("Содержимое ключа",),
+        'name': ("Имя",),
+        'state': ("Состояние",),
+        'signal': ("Сигнал",),
+        'radio_type': ("Тип радио",),
+        'channel': ("Канал",),
+        'band': ("Диапазон",),
+        'authentication': ("Проверка подлинности",),
+        'cipher': ("Шифрование", "Шифр"),
+    },
+}
+
+# Flattened, case-insensitive lookup of every known label: {label: canonical_key}.
+_LABEL_INDEX = {
+    label.casefold(): key
+    for table in LABELS.values()
+    for key, labels in table.items()
+    for label in labels
+}
+
+# "  Label   : value" -- the label ends at the first colon, so values may contain colons.
+_LINE_RE = re.compile(r'^\s*([^:\r\n]+?)\s*:[ \t]*(.*?)\s*$')
+# "SSID 1", "BSSID 2" (networks), "SSID", "BSSID", "AP BSSID" (interfaces).
+_SSID_RE = re.compile(r'^(?:ap\s+)?(b?ssid)(?:\s+\d+)?$', re.IGNORECASE)
+_INT_RE = re.compile(r'^(\d+)')
+
+# Localized values of the interface state "connected".
+CONNECTED_STATES = {"connected", "verbunden", "connecté", "conectado", "подключено"}
+
+
+class InterfaceState(NamedTuple):
+    """Structured view of one wireless interface from `netsh wlan show interfaces`."""
+    name: Optional[str] = None
+    state: Optional[str] = None
+    ssid: Optional[str] = None
+    bssid: Optional[str] = None
+    signal: Optional[int] = None
+    radio_type: Optional[str] = None
+
+    @property
+    def connected(self) -> bool:
+        # The state value is localized as well; "connected" is matched in any known locale.
+        return (self.state or "").casefold() in CONNECTED_STATES
+
+
+class BssidInfo(NamedTuple):
+    """One access point (BSSID) advertising a network."""
+    bssid: str
+    signal: Optional[int] = None
+    channel: Optional[int] = None
+    band: Optional[str] = None
+    radio_type: Optional[str] = None
+
+
+class WifiNetwork(NamedTuple):
+    """A visible network from `netsh wlan show networks mode=bssid`."""
+    ssid: str
+    authentication: Optional[str] = None
+    cipher: Optional[str] = None
+    bssids: tuple = ()
+
+    @property
+    def signal(self) -> Optional[int]:
+        """The best signal quality (percent) across all access points."""
+        signals = [b.signal for b in self.bssids if b.signal is not None]
+        return max(signals) if signals else None
+
+
+def canonical_label(label: str) -> str:
+    """
+    Maps a (possibly localized) netsh label to its canonical key, e.g. "Schlüsselinhalt"
+    to "key_content". Unknown labels are returned lowercased.
+    """
+    folded = label.casefold()
+    match = _SSID_RE.match(folded)
+    if match:
+        return match.group(1)
+    return _LABEL_INDEX.get(folded, folded)
+
+
+def iter_fields(output: str):
+    """
+    Yields (canonical_key, value) for every "label : value" line of a netsh output.
+    Lines without a colon (headings, separators) are skipped.
+    """
+    for line in output.splitlines():
+        match = _LINE_RE.match(line)
+        if match:
+            yield canonical_label(match.group(1)), match.group(2)
+
+
+def parse_fields(output: str) -> dict:
+    """
+    Parses a flat netsh output (e.g. `netsh wlan show profile name=... key=clear`) into
+    {canonical_key: value}. The first occurrence of a repeated label wins.
+    """
+    fields = {}
+    for key, value in iter_fields(output):
+        fields.setdefault(key, value)
+    return fields
+
+
+def parse_profiles(output: str) -> list:
+    """Returns the profile names listed by `netsh wlan show profiles`, in order."""
+    return [value for key, value in iter_fields(output) if key == 'profile' and value]
+
+
+def parse_key_content(output: str) -> Optional[str]:
+    """Returns the clear-text key of `netsh wlan show profile ... key=clear`, or None if absent."""
+    for key, value in iter_fields(output):
+        if key == 'key_content':
+            return value
+    return None
+
+
+def _to_int(value: str) -> Optional[int]:
+    match = _INT_RE.match(value)
+    return int(match.group(1)) if match else None
+
+
+def band_for_channel(channel: Optional[int]) -> Optional[str]:
+    """
+    Derives the band from the channel number when netsh does not report it (Windows 10
+    does not, Windows 11 prints a "Band" line). 6 GHz channel numbers overlap the other
+    bands, so only those above the 5 GHz range are attributed to 6 GHz; older netsh
+    versions cannot show 6 GHz networks at all.
+    """
+    if channel is None:
+        return None
+    if 1 <= channel <= 14:
+        return "2.4 GHz"
+    if 32 <= channel <= 177:
+        return "5 GHz"
+    if 181 <= channel <= 233:
+        return "6 GHz"
+    return None
+
+
+def parse_interfaces(output: str) -> list:
+    """
+    Parses the output of `netsh wlan show interfaces` into a list of InterfaceState,
+    one per interface block.
+    """
+    interfaces = []
+    fields = None
+    for key, value in iter_fields(output):
+        if key == 'name':
+            if fields is not None:
+                interfaces.append(_build_state(fields))
+            fields = {}
+        elif fields is None:
+            # Skip the header lines preceding the first interface block.
+            continue
+        fields.setdefault(key, value)
+
+    if fields is not None:
+        interfaces.append(_build_state(fields))
+    return interfaces
+
+
+def _build_state(fields: dict) -> InterfaceState:
+    return InterfaceState(
+        name=fields.get('name'),
+        state=fields.get('state'),
+        ssid=fields.get('ssid') or None,
+        bssid=fields.get('bssid') or None,
+        signal=_to_int(fields.get('signal', "")),
+        radio_type=fields.get('radio_type'),
+    )
+
+
+def parse_networks(output: str) -> list:
+    """
+    Parses `netsh wlan show networks mode=bssid` in a single pass.
+
+    Only the first colon of a line separates label and value, so SSIDs and BSSIDs
+    containing colons are kept intact. Hidden networks (empty SSID) are skipped.
+
+    Returns:
+        A list of WifiNetwork records in scan order.
+    """
+    networks = []
+    network = None
+    bssids = []
+    bssid = None
+
+    def flush_bssid():
+        nonlocal bssid
+        if bssid is not None:
+            if bssid.get('band') is None:
+                bssid['band'] = band_for_channel(bssid.get('channel'))
+            bssids.append(BssidInfo(**bssid))
+            bssid = None
+
+    def flush_network():
+        nonlocal network, bssids
+        flush_bssid()
+        if network is not None and network['ssid']:
+            networks.append(WifiNetwork(bssids=tuple(bssids), **network))
+        network = None
+        bssids = []
+
+    for key, value in iter_fields(output):
+        if key == 'ssid':
+            flush_network()
+            network = {'ssid': value, 'authentication': None, 'cipher': None}
+        elif network is None:
+            continue
+        elif key == 'bssid':
+            flush_bssid()
+            bssid = {'bssid': value}
+        elif key in ('authentication', 'cipher'):
+            network[key] = value
+        elif bssid is not None:
+            if key in ('signal', 'channel'):
+                bssid[key] = _to_int(value)
+            elif key in ('band', 'radio_type'):
+                bssid[key] = value
+
+    flush_network()
+    return networks
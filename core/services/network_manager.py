@@ -1,12 +1,20 @@
-import os
 import subprocess
 import time
-import requests
 import logging
-import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from core.model.wifi_profiles_model import WifiProfilesModel
+from core.services.command_runner import SubprocessRunner
+from core.services.event_log import EventLog
+from core.services.interface_state import InterfaceSnapshot
+from core.services.profile_cache import SystemProfileCache
+from core.services.profile_builder import ProfileStaging, WifiProfile, security_for
+from core.services.reachability import ReachabilityChecker
+from core.services.network_selection import rank_networks
+from core.services.netsh_parser import parse_key_content, parse_networks, parse_profiles
 from core.utils.message_box import *
 from core.utils.paths import resource_path
+from core.utils.deadline import Deadline
+from core.utils.waiting import wait_until
 
 
 class NetworkManager:
@@ -15,7 +23,25 @@ class NetworkManager:
     checks, and Psiphon VPN control.
     """
 
-    def __init__(self):
+    # Upper bounds (in seconds) for waiting on state transitions; the waits end as soon
+    # as the target state is observed.
+    CONNECT_TIMEOUT = 10.0
+    DISCONNECT_TIMEOUT = 5.0
+    PSIPHON_START_TIMEOUT = 10.0
+    PSIPHON_STOP_TIMEOUT = 5.0
+    # Upper bound (in seconds) for a single query command (netsh, tasklist), and the least
+    # time such a command gets when a deadline is almost used up.
+    COMMAND_TIMEOUT = 10.0
+    MIN_COMMAND_TIMEOUT = 1.0
+
+    def __init__(self, runner=None, max_workers=8):
+        """
+        Args:
+            runner (CommandRunner, optional): Backend used for every external command.
+                Defaults to `SubprocessRunner`; a `ReplayRunner` can be injected to
+                profile or benchmark the network code off Windows.
+            max_workers (int): Upper bound on concurrent `netsh` queries.
+        """
         # Initialize instance variables and a dedicated logger
         self.current_ssid = None
         self.current_password = None
@@ -23,66 +49,113 @@ class NetworkManager:
         self.logger = logging.getLogger(self.__class__.__name__)
         self.model = WifiProfilesModel()
         self.available_networks = []
+        # Signal quality (percent) of visible networks by SSID, when the scan provides it.
+        self.available_signals = {}
+        # Full records (BSSIDs, signal, channel, band, auth/cipher) from the last scan.
+        self.scan_results = []
+        self.max_workers = max_workers
+        self.runner = runner or SubprocessRunner()
+        # Called with (message, title) to report errors to the user; replaced with a
+        # thread-safe reporter when the manager runs on a background thread.
+        self.error_handler = show_error
+        # Shared, short-lived snapshot of 'netsh wlan show interfaces' used by all status queries.
+        self.interfaces = InterfaceSnapshot(self.runner)
+        # Names of the profiles stored in Windows, so connecting does not list them every time.
+        self.system_profiles = SystemProfileCache(self.runner)
+        # Races several internet probes over a pooled session.
+        self.reachability = ReachabilityChecker()
+        # The result of the most recent internet check (see `get_internet_status`).
+        self.last_reachability = None
+        # Timings (in seconds) of the last profile harvest: {'total': float, 'profiles': {ssid: float}}
+        self.last_harvest_timings = {'total': 0.0, 'profiles': {}}
+        # Measured duration (in seconds) of the last transition of each kind:
+        # 'connect', 'disconnect', 'psiphon_start' and 'psiphon_stop'. None if it timed out.
+        self.transition_times = {}
+        # Structured record of Wi-Fi and internet state changes; replaced with a
+        # file-backed log by the controller.
+        self.events = EventLog()
+
+    def _fetch_profile_password(self, ssid):
+        """
+        Queries the stored key of a single Wi-Fi profile.
+
+        Returns:
+            tuple: (ssid, password, elapsed_seconds).
+        """
+        started = time.perf_counter()
+        try:
+            self.logger.debug(f"Attempting to get password for profile: {ssid}")
+            password_result = self.runner.run(
+                ['netsh', 'wlan', 'show', 'profile', f'name="{ssid}"', 'key=clear']
+            )
+
+            password = parse_key_content(password_result.stdout) or "Not Available"
+
+            self.logger.debug(f"Found profile '{ssid}' with password status: '{password}'")
+        except Exception as e:
+            self.logger.error(f"Error getting password for {ssid}: {e}")
+            password = "Error"
+        return ssid, password, time.perf_counter() - started
 
-        # Define startupinfo to hide the console window for subprocess calls
-        self.startupinfo = subprocess.STARTUPINFO()
-        self.startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-        self.startupinfo.wShowWindow = subprocess.SW_HIDE
+    def iter_wifi_passwords(self):
+        """
+        Harvests all saved Wi-Fi profiles and their passwords using a bounded pool of
+        concurrent `netsh` queries, yielding results as soon as each query completes.
+
+        Yields:
+            tuple: (ssid, password) in completion order.
+
+        Raises:
+            RuntimeError: If the profile list could not be retrieved.
+        """
+        started = time.perf_counter()
+        self.logger.info("Retrieving all Wi-Fi profiles from the system.")
+
+        # Run 'netsh' command to get a list of all user profiles.
+        profile_result = self.runner.run(['netsh', 'wlan', 'show', 'profiles'])
+        if profile_result.returncode != 0:
+            raise RuntimeError("Error running 'netsh' command to get profiles.")
+
+        profiles = parse_profiles(profile_result.stdout)
+        self.system_profiles.prime(profiles)
+        timings = {}
+        self.last_harvest_timings = {'total': 0.0, 'profiles': timings}
+
+        if profiles:
+            # Fan out one password query per profile over a bounded worker pool.
+            workers = max(1, min(self.max_workers, len(profiles)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="netsh") as executor:
+                futures = [executor.submit(self._fetch_profile_password, ssid) for ssid in profiles]
+                for future in as_completed(futures):
+                    ssid, password, elapsed = future.result()
+                    timings[ssid] = elapsed
+                    yield ssid, password
+
+        total = time.perf_counter() - started
+        self.last_harvest_timings['total'] = total
+        slowest = max(timings.values(), default=0.0)
+        self.logger.info(
+            f"Harvested {len(profiles)} Wi-Fi profiles in {total:.3f}s "
+            f"(slowest profile query: {slowest:.3f}s)."
+        )
 
     def get_wifi_passwords(self):
         """
         Retrieves a list of all saved Wi-Fi profiles and their passwords from the system.
-        This method uses 'netsh' commands to gather the information.
+        This method uses 'netsh' commands to gather the information; the per-profile
+        queries run concurrently (see `iter_wifi_passwords`).
 
         Returns:
             list: A list of tuples, where each tuple contains (ssid, password).
                   Returns an empty list on failure.
         """
         try:
-            self.logger.info("Retrieving all Wi-Fi profiles from the system.")
-
-            # Run 'netsh' command to get a list of all user profiles.
-            profile_result = subprocess.run(
-                ['netsh', 'wlan', 'show', 'profiles'],
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                startupinfo=self.startupinfo
-            )
-
-            if profile_result.returncode != 0:
-                self.logger.error("Error running 'netsh' command to get profiles.")
-                return []
-
-            profiles = re.findall(r'All User Profile\s*:\s*(.+)', profile_result.stdout)
-            wifi_list = []
-
-            # For each profile, run another command to get the password.
-            for ssid in profiles:
-                try:
-                    self.logger.debug(f"Attempting to get password for profile: {ssid}")
-                    password_result = subprocess.run(
-                        ['netsh', 'wlan', 'show', 'profile', f'name="{ssid}"', 'key=clear'],
-                        capture_output=True,
-                        text=True,
-                        encoding='utf-8',
-                        startupinfo=self.startupinfo
-                    )
-
-                    password = "Not Available"
-                    match = re.search(r'Key Content\s*:\s*(.+)', password_result.stdout)
-                    if match:
-                        password = match.group(1).strip()
-
-                    wifi_list.append((ssid, password))
-                    self.logger.debug(f"Found profile '{ssid}' with password status: '{password}'")
-                except Exception as e:
-                    self.logger.error(f"Error getting password for {ssid}: {e}")
-                    wifi_list.append((ssid, "Error"))
-
+            wifi_list = list(self.iter_wifi_passwords())
             self.logger.info(f"Successfully retrieved {len(wifi_list)} Wi-Fi profiles.")
             return wifi_list
-
+        except RuntimeError as e:
+            self.logger.error(str(e))
+            return []
         except Exception as e:
             self.logger.exception(f"General error retrieving Wi-Fi profiles: {e}")
             return []
@@ -96,19 +169,11 @@ class NetworkManager:
         """
         try:
             self.logger.debug("Checking for the currently connected Wi-Fi network.")
-            result = subprocess.run(
-                ["netsh", "wlan", "show", "interfaces"],
-                capture_output=True,
-                text=True,
-                check=True,
-                startupinfo=self.startupinfo
-            )
+            state = self.interfaces.get()
 
-            match = re.search(r'SSID\s*:\s*(.+)', result.stdout)
-            if match:
-                ssid = match.group(1).strip()
-                self.logger.info(f"Currently connected to: {ssid}")
-                return ssid
+            if state.connected and state.ssid:
+                self.logger.info(f"Currently connected to: {state.ssid}")
+                return state.ssid
 
             self.logger.info("Not connected to any Wi-Fi network.")
             return None
@@ -119,6 +184,20 @@ class NetworkManager:
             self.logger.exception(f"Unexpected error in get_current_wifi: {e}")
             return None
 
+    def get_interface_state(self):
+        """
+        Returns the structured state (SSID, BSSID, signal, state, radio type) of the
+        wireless interface from the shared snapshot.
+
+        Returns:
+            InterfaceState: The current state, or None on failure.
+        """
+        try:
+            return self.interfaces.get()
+        except subprocess.CalledProcessError as e:
+            self.logger.error(f"Error reading Wi-Fi interface state: {e}")
+            return None
+
     def set_wifi_credentials(self, ssid, password):
         """
         Sets the Wi-Fi credentials to be used for future connection attempts.
@@ -131,10 +210,48 @@ class NetworkManager:
         self.current_password = password
         self.logger.info(f"Wi-Fi credentials set for SSID: {ssid}")
 
-    def get_wifi_status(self):
+    def _is_on_current_ssid(self):
+        """Re-reads the interface state and checks that it is connected to `current_ssid`."""
+        self.interfaces.invalidate()
+        state = self.interfaces.get(timeout=self.COMMAND_TIMEOUT)
+        return state.connected and state.ssid == self.current_ssid
+
+    def _command_timeout(self, deadline):
+        """Returns the timeout for one query command within `deadline`."""
+        return deadline.timeout(self.COMMAND_TIMEOUT, minimum=self.MIN_COMMAND_TIMEOUT)
+
+    def _budget_exhausted(self, deadline, operation):
+        """Returns True (and logs it) if `deadline` leaves no time to start `operation`."""
+        if deadline.expired:
+            self.logger.warning(f"Skipping {operation}: time budget exhausted.")
+            return True
+        return False
+
+    def _wait_for(self, transition, predicate, timeout, deadline=None):
+        """
+        Waits for `predicate` to become true and records the measured time under `transition`.
+        The wait ends at `timeout` or at the deadline, whichever comes first.
+
+        Returns:
+            bool: True if the target state was observed before the timeout.
+        """
+        deadline = deadline or Deadline()
+        timeout = deadline.timeout(timeout)
+        result = wait_until(predicate, timeout, cancel_event=deadline.cancel_event)
+        self.transition_times[transition] = result.elapsed if result.satisfied else None
+        if result.satisfied:
+            self.logger.info(f"'{transition}' completed in {result.elapsed:.2f}s ({result.attempts} checks).")
+        else:
+            self.logger.warning(f"'{transition}' not observed within {timeout:.0f}s.")
+        return result.satisfied
+
+    def get_wifi_status(self, deadline=None):
         """
         Checks if the device is currently connected to the specified Wi-Fi network.
 
+        Args:
+            deadline (Deadline, optional): Bounds the time spent on the check.
+
         Returns:
             tuple: A tuple containing (bool, str). The boolean indicates if
                    the connection is active, and the string provides a status message.
@@ -144,21 +261,17 @@ class NetworkManager:
             return False, "Wi-Fi not selected"
 
         try:
-            result = subprocess.run(
-                ["netsh", "wlan", "show", "interfaces"],
-                capture_output=True,
-                text=True,
-                check=True,
-                startupinfo=self.startupinfo
-            )
+            state = self.interfaces.get(timeout=self._command_timeout(deadline or Deadline()))
 
-            if self.current_ssid in result.stdout:
+            if state.connected and state.ssid == self.current_ssid:
                 self.logger.info(f"Connected to Wi-Fi: {self.current_ssid}")
+                self.events.record('wifi', True, cause='status')
                 return True, f"Connected to {self.current_ssid}"
             else:
                 self.logger.info(f"Not connected to Wi-Fi: {self.current_ssid}")
+                self.events.record('wifi', False, cause='status')
                 return False, "Not Connected"
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
             self.logger.error(f"Error checking Wi-Fi status: {e}")
             return False, "Error"
         except Exception as e:
@@ -167,57 +280,77 @@ class NetworkManager:
 
     def get_available_wifi(self):
         """
-        Scans and updates the list of available Wi-Fi networks.
-        The list is stored in the `self.available_networks` attribute.
+        Scans and updates the list of available Wi-Fi networks with a single
+        `netsh wlan show networks mode=bssid` call.
+        The SSIDs are stored in `self.available_networks`, their best signal in
+        `self.available_signals` and the full records in `self.scan_results`.
+
+        Returns:
+            list: WifiNetwork records of the visible (non-hidden) networks.
         """
+        networks = []
         try:
             self.logger.info("Scanning for available Wi-Fi networks.")
-            result = subprocess.check_output(
-                ['netsh', 'wlan', 'show', 'networks'],
-                startupinfo=self.startupinfo
-            ).decode('utf-8')
-
-            if result:
-                self.available_networks = [
-                    line.split(':')[1].strip()
-                    for line in result.split('\n')
-                    if 'SSID' in line and 'BSSID' not in line
-                ]
-                self.logger.info(f"Found {len(self.available_networks)} available Wi-Fi networks.")
+            result = self.runner.run(['netsh', 'wlan', 'show', 'networks', 'mode=bssid'], check=True).stdout
+
+            networks = parse_networks(result)
+            if networks:
+                self.logger.info(f"Found {len(networks)} available Wi-Fi networks.")
             else:
                 self.logger.warning("No Wi-Fi networks found.")
-                self.available_networks = []
         except subprocess.CalledProcessError as e:
             self.logger.error(f"Error scanning for Wi-Fi networks: {e}")
-            self.available_networks = []
         except Exception as e:
             self.logger.exception(f"Unexpected error in get_available_wifi: {e}")
-            self.available_networks = []
 
-    def connect_wifi(self):
+        self.scan_results = networks
+        self.available_networks = list(dict.fromkeys(network.ssid for network in networks))
+        self.available_signals = {}
+        for network in networks:
+            signal = network.signal
+            if signal is not None and signal > self.available_signals.get(network.ssid, -1):
+                self.available_signals[network.ssid] = signal
+        return networks
+
+    def rank_available_networks(self):
+        """
+        Ranks the visible networks that have a stored profile by signal strength and
+        past connection success and speed (see `network_selection.rank_networks`).
+
+        Returns:
+            list: RankedNetwork entries, best first.
+        """
+        available = {ssid: self.available_signals.get(ssid) for ssid in self.available_networks}
+        return rank_networks(available, self.model.get_profiles_index(), self.model.get_connection_history())
+
+    def connect_wifi(self, deadline=None):
         """
         Attempts to connect to the configured Wi-Fi network.
         If no network is set, it tries to connect to a known available network.
 
+        Args:
+            deadline (Deadline, optional): Bounds the time spent connecting.
+
         Returns:
             bool: True if the connection is successful, False otherwise.
         """
-        is_connected, _ = self.get_wifi_status()
+        deadline = deadline or Deadline()
+        is_connected, _ = self.get_wifi_status(deadline)
         if is_connected:
             self.logger.info("Wi-Fi is already connected.")
             return True
+        if self._budget_exhausted(deadline, "Wi-Fi connection"):
+            return False
 
         if not self.current_ssid or not self.current_password:
             self.logger.warning("Wi-Fi credentials are missing. Trying to auto-select from known profiles.")
             self.get_available_wifi()
-            known_profiles = self.model.get_all_profiles_details()
-
-            for ssid, password in known_profiles:
-                if ssid in self.available_networks:
-                    self.current_ssid = ssid
-                    self.current_password = password
-                    self.logger.info(f"Auto-selected known network: {ssid}")
-                    break
+            ranked = self.rank_available_networks()
+            if ranked:
+                best = ranked[0]
+                self.current_ssid = best.ssid
+                self.current_password = best.password
+                self.logger.info(f"Auto-selected known network: {best.ssid} (score {best.score:.2f}).")
 
         if not self.current_ssid:
             self.logger.error("No Wi-Fi network selected for connection.")
@@ -225,139 +358,202 @@ class NetworkManager:
 
         try:
             # Check if a profile for the SSID exists and create it if not.
-            profile_result = subprocess.run(
-                ["netsh", "wlan", "show", "profiles"],
-                capture_output=True,
-                text=True,
-                check=True,
-                startupinfo=self.startupinfo
-            )
-            if self.current_ssid not in profile_result.stdout:
+            if not self.system_profiles.contains(self.current_ssid):
                 self.logger.info(f"Creating Wi-Fi profile for: {self.current_ssid}.")
-                self.create_wifi_profile()
+                self.create_wifi_profile(deadline)
 
             self.logger.info(f"Attempting to connect to Wi-Fi: {self.current_ssid}.")
-            subprocess.run(
-                f'netsh wlan connect name="{self.current_ssid}"',
-                shell=True,
-                startupinfo=self.startupinfo
-            )
-            time.sleep(5)  # Wait for the connection to establish.
-
-            # Verify the connection status.
-            new_status, status_message = self.get_wifi_status()
-            if new_status:
+            self.runner.run(['netsh', 'wlan', 'connect', f'name={self.current_ssid}'],
+                            timeout=self._command_timeout(deadline))
+
+            # Wait until the interface reports the connection, or give up at the deadline.
+            connected = self._wait_for('connect', self._is_on_current_ssid, self.CONNECT_TIMEOUT, deadline)
+            self.model.record_connection(self.current_ssid, connected, self.transition_times.get('connect'))
+            self.events.record('wifi', connected, cause='connect_wifi', latency=self.transition_times.get('connect'))
+            if connected:
                 self.logger.info("Wi-Fi connected successfully.")
-            else:
-                self.logger.warning(f"Failed to connect to Wi-Fi: {status_message}.")
-            return new_status
+                return True
+            self.logger.warning(f"Failed to connect to Wi-Fi: {self.current_ssid}.")
+            # The cached profile name may be stale (e.g. deleted outside the app): re-read it next time.
+            self.system_profiles.invalidate()
+            return False
 
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
             self.logger.error(f"Error connecting to Wi-Fi: {e}")
+            self.system_profiles.invalidate()
             return False
         except Exception as e:
             self.logger.exception(f"Unexpected error in connect_wifi: {e}")
             return False
 
-    def disconnect_wifi(self):
+    def disconnect_wifi(self, deadline=None):
         """
         Disconnects from the current Wi-Fi network.
 
+        Args:
+            deadline (Deadline, optional): Bounds the time spent disconnecting.
+
         Returns:
             bool: True if disconnection is successful, False otherwise.
         """
-        is_connected, _ = self.get_wifi_status()
+        deadline = deadline or Deadline()
+        is_connected, _ = self.get_wifi_status(deadline)
         if not is_connected:
             self.logger.info("Wi-Fi is already disconnected.")
             return True
+        if self._budget_exhausted(deadline, "Wi-Fi disconnection"):
+            return False
 
         try:
             self.logger.info("Disconnecting from Wi-Fi.")
-            subprocess.run(
-                'netsh wlan disconnect',
-                shell=True,
-                startupinfo=self.startupinfo
-            )
-            time.sleep(2)  # Wait for disconnection.
+            self.runner.run(['netsh', 'wlan', 'disconnect'], timeout=self._command_timeout(deadline))
 
-            new_status, _ = self.get_wifi_status()
-            if not new_status:
+            disconnected = self._wait_for(
+                'disconnect', lambda: not self._is_on_current_ssid(), self.DISCONNECT_TIMEOUT, deadline
+            )
+            if disconnected:
                 self.logger.info("Wi-Fi disconnected successfully.")
+                self.events.record('wifi', False, cause='disconnect_wifi',
+                                   latency=self.transition_times.get('disconnect'))
             else:
                 self.logger.warning("Failed to disconnect from Wi-Fi.")
-            return not new_status
+            return disconnected
         except Exception as e:
             self.logger.exception(f"Error disconnecting from Wi-Fi: {e}")
             return False
 
-    def get_internet_status(self):
+    def get_internet_status(self, timeout=None, deadline=None):
         """
-        Checks for an active internet connection by making a request to a well-known URL.
+        Checks for an active internet connection by racing several probes (HTTP 204
+        endpoints, TCP connect) and taking the first successful answer.
+
+        Args:
+            timeout (float, optional): Overrides the probe timeout (seconds).
+            deadline (Deadline, optional): Shrinks the probe timeout to the remaining budget.
 
         Returns:
             bool: True if internet is active, False otherwise.
         """
         try:
             self.logger.debug("Checking for an active internet connection.")
-            # Use a reliable endpoint that returns a 204 No Content status.
-            response = requests.get("http://connectivitycheck.gstatic.com/generate_204", timeout=5)
-            status = response.status_code == 204
+            timeout = (deadline or Deadline()).timeout(
+                timeout or self.reachability.timeout, minimum=self.MIN_COMMAND_TIMEOUT
+            )
+            result = self.reachability.check(timeout)
+            self.last_reachability = result
+            self.events.record('internet', result.reachable, cause=result.probe or 'probe')
 
-            if status:
-                self.logger.info("Internet connection is active.")
+            if result.reachable:
+                self.logger.info(f"Internet connection is active ({result.probe} in {result.rtt * 1000:.0f}ms).")
             else:
-                self.logger.warning("Internet connection is inactive.")
-            return status
-        except requests.exceptions.RequestException:
-            self.logger.error("Internet check failed.")
-            return False
+                self.logger.warning(f"Internet connection is inactive (no probe answered in {result.elapsed:.1f}s).")
+            return result.reachable
         except Exception as e:
             self.logger.exception(f"Unexpected error in get_internet_status: {e}")
             return False
 
-    def is_psiphon_running(self):
+    def renew_ip(self, timeout=15.0, deadline=None, interface=None):
+        """
+        Flushes the DNS cache and renews the DHCP lease of the Wi-Fi adapter only, so
+        VPN (TAP) and Ethernet adapters are left alone.
+
+        Args:
+            timeout (float): Upper bound (seconds) for each command.
+            deadline (Deadline, optional): Bounds the time spent on both commands.
+            interface (str, optional): The adapter to renew; the Wi-Fi interface if omitted.
+
+        Returns:
+            bool: True if both commands succeeded, False otherwise.
+        """
+        deadline = deadline or Deadline()
+        if self._budget_exhausted(deadline, "IP renewal"):
+            return False
+        try:
+            interface = interface or self.interfaces.get(timeout=self._command_timeout(deadline)).name
+            if not interface:
+                self.logger.warning("No Wi-Fi interface found; IP renewal skipped.")
+                return False
+            self.logger.info(f"Flushing DNS cache and renewing the IP address of '{interface}'.")
+            self.runner.run(['ipconfig', '/flushdns'], check=True,
+                            timeout=deadline.timeout(timeout, minimum=self.MIN_COMMAND_TIMEOUT))
+            self.runner.run(['ipconfig', '/renew', interface], check=True,
+                            timeout=deadline.timeout(timeout, minimum=self.MIN_COMMAND_TIMEOUT))
+            self.interfaces.invalidate()
+            return True
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+            self.logger.error(f"Error renewing IP address: {e}")
+            return False
+
+    def delete_wifi_profile(self, ssid, deadline=None):
+        """
+        Removes a Wi-Fi profile from the system.
+
+        Args:
+            ssid (str): The profile to delete.
+            deadline (Deadline, optional): Bounds the time spent on the command.
+
+        Returns:
+            bool: True if the profile was deleted, False otherwise.
+        """
+        deadline = deadline or Deadline()
+        if self._budget_exhausted(deadline, "Wi-Fi profile deletion"):
+            return False
+        try:
+            self.logger.info(f"Deleting system Wi-Fi profile: {ssid}.")
+            self.runner.run(['netsh', 'wlan', 'delete', 'profile', f'name={ssid}'], check=True,
+                            timeout=self._command_timeout(deadline))
+            return True
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+            self.logger.error(f"Error deleting Wi-Fi profile '{ssid}': {e}")
+            return False
+        finally:
+            self.system_profiles.invalidate()
+
+    def is_psiphon_running(self, deadline=None):
         """
         Checks if the Psiphon executable is currently running in the background.
 
+        Args:
+            deadline (Deadline, optional): Bounds the time spent on the check.
+
         Returns:
             bool: True if psiphon3.exe is running, False otherwise.
         """
         try:
             self.logger.debug("Checking if Psiphon is running.")
-            result = subprocess.run(
-                ["tasklist"],
-                capture_output=True,
-                text=True,
-                check=True,
-                startupinfo=self.startupinfo
-            )
+            result = self.runner.run(["tasklist"], check=True, timeout=self._command_timeout(deadline or Deadline()))
             is_running = "psiphon3.exe" in result.stdout.lower()
             self.logger.debug(f"Psiphon is running: {is_running}")
             return is_running
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
             self.logger.error(f"Error checking Psiphon status: {e}")
             return False
         except Exception as e:
             self.logger.exception(f"Unexpected error in is_psiphon_running: {e}")
             return False
 
-    def start_psiphon(self):
+    def start_psiphon(self, deadline=None):
         """
         Starts the Psiphon VPN application.
 
+        Args:
+            deadline (Deadline, optional): Bounds the time spent waiting for the start.
+
         Returns:
             bool: True if Psiphon starts successfully, False otherwise.
         """
-        if self.is_psiphon_running():
+        deadline = deadline or Deadline()
+        if self.is_psiphon_running(deadline):
             self.logger.info("Psiphon is already running.")
             return True
+        if self._budget_exhausted(deadline, "Psiphon start"):
+            return False
 
         try:
             self.logger.info("Attempting to start Psiphon.")
-            subprocess.Popen(self.psiphon_path, startupinfo=self.startupinfo)
-            time.sleep(5)  # Wait for the application to initialize.
+            self.runner.popen([self.psiphon_path])
 
-            if self.is_psiphon_running():
+            if self._wait_for('psiphon_start', self.is_psiphon_running, self.PSIPHON_START_TIMEOUT, deadline):
                 self.logger.info("Psiphon started successfully.")
                 return True
             else:
@@ -365,33 +561,34 @@ class NetworkManager:
                 return False
         except FileNotFoundError:
             self.logger.error(f"Psiphon executable not found at {self.psiphon_path}.")
-            show_error("Psiphon3.exe file not found. Please check the path.", "Error")
+            self.error_handler("Psiphon3.exe file not found. Please check the path.", "Error")
             return False
         except Exception as e:
             self.logger.exception(f"Error starting Psiphon: {e}")
             return False
 
-    def stop_psiphon(self):
+    def stop_psiphon(self, deadline=None):
         """
         Stops the Psiphon VPN process using `taskkill`.
 
+        Args:
+            deadline (Deadline, optional): Bounds the time spent stopping.
+
         Returns:
             bool: True if Psiphon is stopped successfully, False otherwise.
         """
-        if not self.is_psiphon_running():
+        deadline = deadline or Deadline()
+        if not self.is_psiphon_running(deadline):
             self.logger.info("Psiphon is already stopped.")
             return True
 
         try:
             self.logger.info("Attempting to stop Psiphon.")
-            subprocess.run(
-                'taskkill /IM psiphon3.exe /F',
-                shell=True,
-                startupinfo=self.startupinfo
-            )
-            time.sleep(2)  # Wait for the process to terminate.
+            # Stopping is always attempted, even past the deadline, but bounded by the command timeout.
+            self.runner.run(['taskkill', '/IM', 'psiphon3.exe', '/F'], timeout=self._command_timeout(deadline))
 
-            if not self.is_psiphon_running():
+            if self._wait_for('psiphon_stop', lambda: not self.is_psiphon_running(), self.PSIPHON_STOP_TIMEOUT,
+                              deadline):
                 self.logger.info("Psiphon stopped successfully.")
                 return True
             else:
@@ -401,65 +598,100 @@ class NetworkManager:
             self.logger.exception(f"Error stopping Psiphon: {e}")
             return False
 
-    def create_wifi_profile(self):
+    def _scan_security(self, ssid):
+        """Returns the security mode of `ssid` from the last scan, or None if it was not seen."""
+        for network in self.scan_results:
+            if network.ssid == ssid:
+                return network.authentication
+        return None
+
+    def import_wifi_profiles(self, profiles, deadline=None):
+        """
+        Adds many Wi-Fi profiles to the system in one pass. All profiles are staged
+        in a single private temporary directory and imported concurrently.
+
+        Args:
+            profiles: An iterable of WifiProfile.
+            deadline (Deadline, optional): Bounds the time spent on each import command.
+
+        Returns:
+            dict: {ssid: True if imported, else False}.
+
+        Raises:
+            ValueError: If a profile has invalid credentials; nothing is imported then.
+        """
+        started = time.perf_counter()
+        profiles = list(profiles)
+        results = {}
+        if not profiles:
+            return results
+
+        deadline = deadline or Deadline()
+
+        def add(profile, path):
+            try:
+                result = self.runner.run(["netsh", "wlan", "add", "profile", f"filename={path}"],
+                                         timeout=self._command_timeout(deadline))
+            except subprocess.TimeoutExpired as e:
+                self.logger.error(f"Timed out adding Wi-Fi profile '{profile.ssid}': {e}")
+                return profile.ssid, False
+            if result.returncode != 0:
+                self.logger.error(f"Failed to add Wi-Fi profile '{profile.ssid}': {result.stdout.strip()}")
+            return profile.ssid, result.returncode == 0
+
+        try:
+            with ProfileStaging() as staging:
+                staged = [(profile, staging.write(profile)) for profile in profiles]
+                workers = max(1, min(self.max_workers, len(staged)))
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="netsh") as executor:
+                    for ssid, ok in executor.map(lambda item: add(*item), staged):
+                        results[ssid] = ok
+        finally:
+            self.system_profiles.invalidate()
+
+        imported = sum(results.values())
+        self.logger.info(
+            f"Imported {imported} of {len(profiles)} Wi-Fi profiles in {time.perf_counter() - started:.3f}s."
+        )
+        return results
+
+    def create_wifi_profile(self, deadline=None):
         """
-        Creates a temporary Wi-Fi profile XML file and imports it to the system.
+        Adds a Wi-Fi profile for the current credentials to the system.
         This is necessary for connecting to a new network programmatically.
+        The security mode (open, WPA2, WPA3) is taken from the last scan when available.
+
+        Args:
+            deadline (Deadline, optional): Bounds the time spent adding the profile.
 
         Returns:
             bool: True if the profile is created and added successfully, False otherwise.
         """
-        if not self.current_ssid or not self.current_password:
+        deadline = deadline or Deadline()
+        if self._budget_exhausted(deadline, "Wi-Fi profile creation"):
+            return False
+        if not self.current_ssid:
+            self.logger.error("Wi-Fi credentials are required to create a profile.")
+            return False
+
+        security = security_for(self._scan_security(self.current_ssid), self.current_password)
+        if security != "open" and not self.current_password:
             self.logger.error("Wi-Fi credentials are required to create a profile.")
             return False
 
         try:
-            self.logger.info(f"Creating a Wi-Fi profile for: {self.current_ssid}.")
-            profile_content = f"""<?xml version="1.0"?>
-<WLANProfile xmlns="http://www.microsoft.com/networking/WLAN/profile/v1">
-    <name>{self.current_ssid}</name>
-    <SSIDConfig>
-        <SSID>
-            <name>{self.current_ssid}</name>
-        </SSID>
-    </SSIDConfig>
-    <connectionType>ESS</connectionType>
-    <connectionMode>auto</connectionMode>
-    <MSM>
-        <security>
-            <authEncryption>
-                <authentication>WPA2PSK</authentication>
-                <encryption>AES</encryption>
-                <useOneX>false</useOneX>
-            </authEncryption>
-            <sharedKey>
-                <keyType>passPhrase</keyType>
-                <protected>false</protected>
-                <keyMaterial>{self.current_password}</keyMaterial>
-            </sharedKey>
-        </security>
-    </MSM>
-</WLANProfile>"""
-
-            # Save the profile content to a temporary XML file.
-            file_path = resource_path(f"{self.current_ssid}.xml")
-            with open(file_path, "w") as f:
-                f.write(profile_content)
-
-            # Add the profile to the system using 'netsh'.
-            subprocess.run(
-                ["netsh", "wlan", "add", "profile", f"filename={file_path}"],
-                check=True,
-                startupinfo=self.startupinfo
-            )
-            os.remove(file_path)  # Clean up the temporary file.
-            self.logger.info("Wi-Fi profile created successfully.")
-            return True
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"Error creating Wi-Fi profile: {e}")
-            show_error("Failed to create Wi-Fi profile. Check credentials.", "Error")
+            self.logger.info(f"Creating a {security} Wi-Fi profile for: {self.current_ssid}.")
+            profile = WifiProfile(self.current_ssid, self.current_password, security)
+            if self.import_wifi_profiles([profile], deadline).get(self.current_ssid):
+                self.logger.info("Wi-Fi profile created successfully.")
+                return True
+            self.error_handler("Failed to create Wi-Fi profile. Check credentials.", "Error")
+            return False
+        except ValueError as e:
+            self.logger.error(f"Invalid Wi-Fi profile: {e}")
+            self.error_handler(f"Failed to create Wi-Fi profile: {e}", "Error")
             return False
         except Exception as e:
             self.logger.exception(f"Unexpected error in create_wifi_profile: {e}")
-            show_error(f"Failed to create Wi-Fi profile: {e}", "Error")
-            return False
\ No newline at end of file
+            self.error_handler(f"Failed to create Wi-Fi profile: {e}", "Error")
+            return False
@@ -0,0 +1,57 @@
+from typing import NamedTuple, Optional
+
+# Weights of the ranking components; they sum to 1.
+SIGNAL_WEIGHT = 0.5
+SUCCESS_WEIGHT = 0.35
+SPEED_WEIGHT = 0.15
+
+# Connect time (seconds) at which the speed component drops to one half.
+REFERENCE_CONNECT_TIME = 5.0
+
+
+class RankedNetwork(NamedTuple):
+    """A known, currently visible network with its auto-selection score."""
+    ssid: str
+    password: str
+    score: float
+    signal: Optional[int]
+
+
+def score_network(signal: Optional[int], history: Optional[tuple]) -> float:
+    """
+    Scores a candidate network between 0 and 1.
+
+    Args:
+        signal: Signal quality in percent, or None if unknown (treated as average).
+        history: (attempts, successes, average_connect_time) or None for a network never tried.
+    """
+    signal_score = signal / 100 if signal is not None else 0.5
+
+    attempts, successes, avg_time = history or (0, 0, None)
+    # Laplace smoothing keeps untried networks at 0.5 instead of 0 or 1.
+    success_score = (successes + 1) / (attempts + 2)
+    speed_score = 0.5 if avg_time is None else REFERENCE_CONNECT_TIME / (REFERENCE_CONNECT_TIME + avg_time)
+
+    return SIGNAL_WEIGHT * signal_score + SUCCESS_WEIGHT * success_score + SPEED_WEIGHT * speed_score
+
+
+def rank_networks(available: dict, known: dict, history: dict) -> list:
+    """
+    Joins the visible networks with the stored profiles and orders them so the
+    network most likely to be usable fastest comes first.
+
+    Args:
+        available: {ssid: signal_percent or None} from the latest scan.
+        known: {ssid: password} from the profile index.
+        history: {ssid: (attempts, successes, average_connect_time)}.
+
+    Returns:
+        A list of RankedNetwork, best first.
+    """
+    candidates = [
+        RankedNetwork(ssid, known[ssid], score_network(signal, history.get(ssid)), signal)
+        for ssid, signal in available.items()
+        if ssid in known
+    ]
+    candidates.sort(key=lambda network: network.score, reverse=True)
+    return candidates
@@ -0,0 +1,160 @@
+import queue
+import threading
+import logging
+from PyQt6.QtCore import QThread, pyqtSignal, QObject
+from core.utils.deadline import Deadline
+
+
+class NetworkJob:
+    """A unit of blocking network work queued on the NetworkService."""
+
+    def __init__(self, name, fn, args, kwargs, on_done=None, cancellable=False):
+        self.name = name
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.on_done = on_done
+        self.cancel_event = threading.Event()
+        if cancellable:
+            self.kwargs['deadline'] = Deadline(cancel_event=self.cancel_event)
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+
+class NetworkService(QThread):
+    """
+    A background thread that executes blocking network jobs (netsh calls, HTTP probes,
+    Psiphon control) one after another so the GUI thread never waits on them.
+
+    Jobs are identified by name: submitting a job whose name is already queued or
+    running is coalesced (dropped) instead of stacking up. Results are delivered
+    on the GUI thread through `on_done` callbacks and the `job_finished` signal.
+
+    Cancelling a queued job skips it. A running job only stops early if it was submitted
+    as `cancellable`: it then receives a Deadline that expires when the job is cancelled.
+    """
+
+    # How long `stop()` waits for the running job by default (milliseconds).
+    STOP_TIMEOUT_MS = 3000
+
+    # Emitted on the GUI thread when a job completes: (job_name, result)
+    job_finished = pyqtSignal(str, object)
+    # Emitted on the GUI thread when a job raises: (job_name, error_message)
+    job_failed = pyqtSignal(str, str)
+    # Emitted when a job asks to show an error to the user: (message, title)
+    error_reported = pyqtSignal(str, str)
+
+    # Internal signal carrying (job, result, error) from the worker to the GUI thread.
+    _completed = pyqtSignal(object, object, object)
+
+    def __init__(self, parent: QObject = None):
+        super().__init__(parent)
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending = {}
+        self.coalesced_count = 0
+        self._completed.connect(self._dispatch)
+
+    def submit(self, name: str, fn, *args, on_done=None, cancellable=False, **kwargs) -> bool:
+        """
+        Queues `fn(*args, **kwargs)` for execution on the worker thread.
+
+        Args:
+            name: The job name used for coalescing and in signals.
+            fn: The blocking callable to run.
+            on_done: Optional callable invoked on the GUI thread with the result.
+            cancellable: If True, `fn` is also passed `deadline=`, a Deadline that expires
+                when the job is cancelled, so it can stop between (and during) its steps.
+
+        Returns:
+            bool: False if a job with the same name was already pending and this one was dropped.
+        """
+        with self._lock:
+            if name in self._pending:
+                self.coalesced_count += 1
+                self.logger.debug(f"Job '{name}' is already pending; request coalesced.")
+                return False
+            job = NetworkJob(name, fn, args, kwargs, on_done, cancellable)
+            self._pending[name] = job
+
+        self._queue.put(job)
+        return True
+
+    def is_pending(self, name: str) -> bool:
+        """Returns True if a job with this name is queued or running."""
+        with self._lock:
+            return name in self._pending
+
+    def cancel(self, name: str) -> bool:
+        """
+        Cancels a job: a queued job is skipped, a running job's result is discarded and,
+        if it is cancellable, its deadline expires.
+
+        Returns:
+            bool: True if a matching job was found.
+        """
+        with self._lock:
+            job = self._pending.get(name)
+        if job is None:
+            return False
+        job.cancel_event.set()
+        self.logger.info(f"Job '{name}' cancelled.")
+        return True
+
+    def report_error(self, message: str, title: str = "Error"):
+        """Thread-safe replacement for `show_error` used by code running on the worker."""
+        self.error_reported.emit(message, title)
+
+    def run(self):
+        """The worker loop: executes queued jobs until `stop()` is called."""
+        self.logger.info("Network service started.")
+        while True:
+            job = self._queue.get()
+            if job is None:
+                break
+            if job.cancelled:
+                self._completed.emit(job, None, None)
+                continue
+
+            try:
+                result = job.fn(*job.args, **job.kwargs)
+                self._completed.emit(job, result, None)
+            except Exception as e:
+                self.logger.exception(f"Job '{job.name}' failed: {e}")
+                self._completed.emit(job, None, e)
+
+    def _dispatch(self, job, result, error):
+        """Delivers a job's outcome on the GUI thread."""
+        with self._lock:
+            if self._pending.get(job.name) is job:
+                del self._pending[job.name]
+
+        if job.cancelled:
+            return
+        if error is not None:
+            self.job_failed.emit(job.name, str(error))
+            return
+        if job.on_done is not None:
+            job.on_done(result)
+        self.job_finished.emit(job.name, result)
+
+    def stop(self, timeout_ms: int = STOP_TIMEOUT_MS) -> bool:
+        """
+        Cancels all jobs and stops the worker after the current job returns, waiting at
+        most `timeout_ms` so closing the window is not held up by a job that cannot stop.
+
+        Returns:
+            bool: True if the worker stopped in time.
+        """
+        self.logger.info("Stopping network service.")
+        with self._lock:
+            for job in self._pending.values():
+                job.cancel_event.set()
+        self._queue.put(None)
+        stopped = self.wait(timeout_ms)
+        if not stopped:
+            self.logger.warning(f"Network service did not stop within {timeout_ms} ms.")
+        return stopped
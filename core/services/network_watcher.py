@@ -0,0 +1,344 @@
+import errno
+import select
+import socket
+import struct
+import sys
+import time
+import logging
+from typing import NamedTuple, Optional
+
+import psutil
+from PyQt6.QtCore import QThread, pyqtSignal, QObject
+
+
+class NetworkChange(NamedTuple):
+    """One link, address or route change reported by the operating system."""
+    ts: float
+    kind: str                        # 'link', 'address', 'route' or 'overflow'
+    action: str                      # 'new' or 'del'
+    interface: Optional[str] = None
+    detail: Optional[str] = None
+
+    @property
+    def summary(self) -> str:
+        return " ".join(part for part in (self.kind, self.action, self.interface, self.detail) if part)
+
+
+class NetlinkBackend:
+    """
+    Receives link, address and route changes from the Linux kernel over an rtnetlink
+    socket. Nothing is polled: the socket only becomes readable when something changed.
+    """
+
+    event_driven = True
+
+    RTMGRP_LINK = 0x1
+    RTMGRP_IPV4_IFADDR = 0x10
+    RTMGRP_IPV4_ROUTE = 0x40
+    RTMGRP_IPV6_IFADDR = 0x100
+    RTMGRP_IPV6_ROUTE = 0x400
+
+    # rtnetlink message type -> (kind, action)
+    MESSAGES = {
+        16: ('link', 'new'), 17: ('link', 'del'),
+        20: ('address', 'new'), 21: ('address', 'del'),
+        24: ('route', 'new'), 25: ('route', 'del'),
+    }
+
+    _NLMSGHDR = struct.Struct('=IHHII')    # length, type, flags, seq, pid
+    _IFINFOMSG = struct.Struct('=BxHiII')  # family, type, index, flags, change
+    _IFADDRMSG = struct.Struct('=BBBBi')   # family, prefix length, flags, scope, index
+    _RTMSG = struct.Struct('=BBBBBBBBI')   # family, dst/src length, tos, table, protocol, scope, type, flags
+    _RTATTR = struct.Struct('=HH')         # length, type
+    IFLA_IFNAME = 3
+    RTA_OIF = 4
+    IFF_UP = 0x1
+    IFF_RUNNING = 0x40
+
+    def __init__(self):
+        self._socket = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE)
+        groups = (self.RTMGRP_LINK | self.RTMGRP_IPV4_IFADDR | self.RTMGRP_IPV6_IFADDR
+                  | self.RTMGRP_IPV4_ROUTE | self.RTMGRP_IPV6_ROUTE)
+        self._socket.bind((0, groups))
+        self._socket.setblocking(False)
+
+    def wait(self, timeout: float) -> list:
+        """Returns the changes received within `timeout` seconds (empty if none)."""
+        changes = []
+        readable, _, _ = select.select([self._socket], [], [], timeout)
+        while readable:
+            try:
+                data = self._socket.recv(65536)
+            except BlockingIOError:
+                break
+            except OSError as e:
+                if e.errno != errno.ENOBUFS:
+                    raise
+                # The kernel dropped messages because the receive buffer was full: what
+                # changed is unknown, but something did. Keep reading what is still queued.
+                changes.append(NetworkChange(time.time(), 'overflow', 'new', None, "events lost"))
+                readable, _, _ = select.select([self._socket], [], [], 0)
+                continue
+            changes.extend(self.parse(data))
+            readable, _, _ = select.select([self._socket], [], [], 0)
+        return changes
+
+    @classmethod
+    def parse(cls, data: bytes) -> list:
+        """Decodes the rtnetlink messages of one datagram into NetworkChange records."""
+        changes = []
+        now = time.time()
+        offset = 0
+        while offset + cls._NLMSGHDR.size <= len(data):
+            length, msg_type, _, _, _ = cls._NLMSGHDR.unpack_from(data, offset)
+            if length < cls._NLMSGHDR.size:
+                break
+            payload = offset + cls._NLMSGHDR.size
+            kind_action = cls.MESSAGES.get(msg_type)
+            if kind_action:
+                kind, action = kind_action
+                interface = detail = None
+                if kind == 'link' and payload + cls._IFINFOMSG.size <= offset + length:
+                    _, _, index, flags, _ = cls._IFINFOMSG.unpack_from(data, payload)
+                    name = cls._attribute(data, payload + cls._IFINFOMSG.size, offset + length, cls.IFLA_IFNAME)
+                    interface = name.split(b'\0', 1)[0].decode(errors='replace') if name else str(index)
+                    detail = "up" if flags & cls.IFF_UP and flags & cls.IFF_RUNNING else "down"
+                elif kind == 'address' and payload + cls._IFADDRMSG.size <= offset + length:
+                    family, _, _, _, index = cls._IFADDRMSG.unpack_from(data, payload)
+                    interface = cls._index_name(index)
+                    detail = "ipv6" if family == socket.AF_INET6 else "ipv4"
+                elif kind == 'route' and payload + cls._RTMSG.size <= offset + length:
+                    family = cls._RTMSG.unpack_from(data, payload)[0]
+                    oif = cls._attribute(data, payload + cls._RTMSG.size, offset + length, cls.RTA_OIF)
+                    interface = cls._index_name(struct.unpack_from('=i', oif)[0]) if oif and len(oif) >= 4 else None
+                    detail = "ipv6" if family == socket.AF_INET6 else "ipv4"
+                changes.append(NetworkChange(now, kind, action, interface, detail))
+            # Messages are aligned to 4 bytes.
+            offset += (length + 3) & ~3
+        return changes
+
+    @classmethod
+    def _attribute(cls, data, offset, end, wanted) -> Optional[bytes]:
+        """Returns the payload of the first attribute of type `wanted` in data[offset:end], if present."""
+        while offset + cls._RTATTR.size <= end:
+            length, attr_type = cls._RTATTR.unpack_from(data, offset)
+            if length < cls._RTATTR.size:
+                break
+            if attr_type == wanted:
+                return data[offset + cls._RTATTR.size:offset + length]
+            offset += (length + 3) & ~3
+        return None
+
+    @staticmethod
+    def _index_name(index) -> str:
+        try:
+            return socket.if_indextoname(index)
+        except OSError:
+            # The interface is already gone (e.g. a removed USB adapter).
+            return str(index)
+
+    def close(self):
+        self._socket.close()
+
+
+class WindowsAddrChangeBackend:
+    """
+    Waits for IP address and route table changes with the IP Helper API
+    (`NotifyAddrChange` / `NotifyRouteChange`) in overlapped mode. Windows does not say
+    what changed, only that something did, so the interface is not reported.
+    """
+
+    event_driven = True
+
+    ERROR_IO_PENDING = 997
+    WAIT_TIMEOUT = 0x102
+    WAIT_FAILED = 0xFFFFFFFF
+
+    def __init__(self):
+        import ctypes
+        from ctypes import wintypes
+
+        class Overlapped(ctypes.Structure):
+            _fields_ = [('Internal', ctypes.c_void_p), ('InternalHigh', ctypes.c_void_p),
+                        ('Offset', wintypes.DWORD), ('OffsetHigh', wintypes.DWORD),
+                        ('hEvent', wintypes.HANDLE)]
+
+        self._ctypes = ctypes
+        self._kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        self._iphlpapi = ctypes.WinDLL('iphlpapi', use_last_error=True)
+        self._kernel32.CreateEventW.restype = wintypes.HANDLE
+        self._kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+        self._kernel32.WaitForMultipleObjects.argtypes = [wintypes.DWORD, ctypes.POINTER(wintypes.HANDLE),
+                                                          wintypes.BOOL, wintypes.DWORD]
+        self._kernel32.WaitForMultipleObjects.restype = wintypes.DWORD
+        # kind -> (notify function, OVERLAPPED, handle)
+        self._requests = {}
+        for kind, notify in (('address', self._iphlpapi.NotifyAddrChange),
+                             ('route', self._iphlpapi.NotifyRouteChange)):
+            overlapped = Overlapped()
+            overlapped.hEvent = self._kernel32.CreateEventW(None, False, False, None)
+            if not overlapped.hEvent:
+                raise OSError(ctypes.get_last_error(), "CreateEventW failed")
+            self._requests[kind] = (notify, overlapped, wintypes.HANDLE())
+            self._arm(kind)
+        self._events = (wintypes.HANDLE * len(self._requests))(
+            *(overlapped.hEvent for _, overlapped, _ in self._requests.values())
+        )
+
+    def _arm(self, kind):
+        """Registers for the next change notification of `kind`."""
+        notify, overlapped, handle = self._requests[kind]
+        result = notify(self._ctypes.byref(handle), self._ctypes.byref(overlapped))
+        if result != self.ERROR_IO_PENDING:
+            raise OSError(result, f"Registering for {kind} changes failed")
+
+    def wait(self, timeout: float) -> list:
+        """Returns the changes signalled within `timeout` seconds (empty if none)."""
+        result = self._kernel32.WaitForMultipleObjects(len(self._events), self._events, False, int(timeout * 1000))
+        if result == self.WAIT_FAILED:
+            raise OSError(self._ctypes.get_last_error(), "WaitForMultipleObjects failed")
+        if result == self.WAIT_TIMEOUT or result >= len(self._events):
+            return []
+        kind = list(self._requests)[result]
+        self._arm(kind)
+        return [NetworkChange(time.time(), kind, 'new')]
+
+    def close(self):
+        for _, overlapped, _ in self._requests.values():
+            self._iphlpapi.CancelIPChangeNotify(self._ctypes.byref(overlapped))
+            self._kernel32.CloseHandle(overlapped.hEvent)
+        self._requests = {}
+
+
+class PollingBackend:
+    """
+    Fallback for platforms without change notifications: compares the interface states
+    and addresses reported by psutil every `interval` seconds.
+    """
+
+    event_driven = False
+
+    def __init__(self, interval: float = 5.0):
+        self.interval = interval
+        self._last = self._fingerprint()
+        self._polled_at = time.monotonic()
+
+    @staticmethod
+    def _fingerprint() -> dict:
+        stats = psutil.net_if_stats()
+        addresses = psutil.net_if_addrs()
+        return {
+            name: (stats[name].isup if name in stats else False,
+                   frozenset(address.address for address in addresses.get(name, ())))
+            for name in set(stats) | set(addresses)
+        }
+
+    def wait(self, timeout: float) -> list:
+        time.sleep(max(0.0, min(timeout, self._polled_at + self.interval - time.monotonic())))
+        if time.monotonic() - self._polled_at < self.interval:
+            return []
+        self._polled_at = time.monotonic()
+        current = self._fingerprint()
+        changes = []
+        now = time.time()
+        for name in set(current) | set(self._last):
+            old_up, old_addresses = self._last.get(name, (False, frozenset()))
+            new_up, new_addresses = current.get(name, (False, frozenset()))
+            if old_up != new_up:
+                changes.append(NetworkChange(now, 'link', 'new' if name in current else 'del', name,
+                                             "up" if new_up else "down"))
+            if new_addresses - old_addresses:
+                changes.append(NetworkChange(now, 'address', 'new', name))
+            if old_addresses - new_addresses:
+                changes.append(NetworkChange(now, 'address', 'del', name))
+        self._last = current
+        return changes
+
+    def close(self):
+        pass
+
+
+def create_backend():
+    """Returns the change notification backend of this platform, falling back to polling."""
+    logger = logging.getLogger("NetworkWatcher")
+    try:
+        if sys.platform.startswith("linux"):
+            return NetlinkBackend()
+        if sys.platform == "win32":
+            return WindowsAddrChangeBackend()
+    except (OSError, AttributeError) as e:
+        logger.warning(f"Network change notifications unavailable ({e}); polling instead.")
+    return PollingBackend()
+
+
+class NetworkWatcher(QThread):
+    """
+    Pushes operating-system network changes (link up/down, address and route changes)
+    to the application, so checks run right after a change instead of at the next poll.
+    Changes arriving in a burst (e.g. a DHCP lease adding an address and several routes)
+    are delivered together once the burst settled.
+    """
+
+    # Emitted with the list of NetworkChange records of one burst.
+    changed = pyqtSignal(object)
+
+    # How often (in seconds) the thread checks whether it should stop.
+    POLL_TIMEOUT = 0.5
+
+    def __init__(self, backend=None, settle: float = 0.1, parent: QObject = None):
+        """
+        Args:
+            backend: The change notification backend; the platform's one if omitted.
+            settle: Seconds to wait for further changes before delivering a burst.
+            parent: The parent QObject.
+        """
+        super().__init__(parent)
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.backend = backend or create_backend()
+        self.settle = settle
+        self.running = False
+        self.stats = {'changes': 0, 'bursts': 0}
+
+    @property
+    def event_driven(self) -> bool:
+        """True if changes are pushed by the OS rather than found by polling."""
+        return self.backend.event_driven
+
+    def run(self):
+        self.running = True
+        self.logger.info(f"Network change watcher started ({self.backend.__class__.__name__}).")
+        while self.running:
+            try:
+                changes = self.backend.wait(self.POLL_TIMEOUT)
+                if not changes:
+                    continue
+                settle_until = time.monotonic() + self.settle
+                while (left := settle_until - time.monotonic()) > 0:
+                    changes.extend(self.backend.wait(left))
+            except OSError as e:
+                self.logger.error(f"Error waiting for network changes: {e}")
+                time.sleep(self.POLL_TIMEOUT)
+                continue
+            self.stats['changes'] += len(changes)
+            self.stats['bursts'] += 1
+            self.changed.emit(changes)
+
+    def stop(self):
+        """Stops the watcher thread and releases the backend."""
+        self.running = False
+        self.wait()
+        self.backend.close()
+        self.logger.info(f"Network change watcher stopped ({self.stats['changes']} changes "
+                         f"in {self.stats['bursts']} bursts).")
+
+
+if __name__ == "__main__":
+    # Usage: python -m core.services.network_watcher  (prints changes until interrupted)
+    watch_backend = create_backend()
+    print(f"Watching with {watch_backend.__class__.__name__}...")
+    try:
+        while True:
+            for change in watch_backend.wait(1.0):
+                print(time.strftime("%H:%M:%S", time.localtime(change.ts)), change.summary)
+    except KeyboardInterrupt:
+        watch_backend.close()
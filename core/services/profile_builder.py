@@ -0,0 +1,120 @@
+import os
+import shutil
+import tempfile
+from typing import NamedTuple, Optional
+from xml.sax.saxutils import escape
+
+# Supported security modes: (authentication, encryption) as named in WLAN profile XML.
+SECURITY_MODES = {
+    "open": ("open", "none"),
+    "wpa2": ("WPA2PSK", "AES"),
+    "wpa3": ("WPA3SAE", "AES"),
+}
+
+PROFILE_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<WLANProfile xmlns="http://www.microsoft.com/networking/WLAN/profile/v1">
+    <name>{name}</name>
+    <SSIDConfig>
+        <SSID>
+            <hex>{hex}</hex>
+            <name>{name}</name>
+        </SSID>
+    </SSIDConfig>
+    <connectionType>ESS</connectionType>
+    <connectionMode>auto</connectionMode>
+    <MSM>
+        <security>
+            <authEncryption>
+                <authentication>{authentication}</authentication>
+                <encryption>{encryption}</encryption>
+                <useOneX>false</useOneX>
+            </authEncryption>{shared_key}
+        </security>
+    </MSM>
+</WLANProfile>"""
+
+SHARED_KEY_TEMPLATE = """
+            <sharedKey>
+                <keyType>{key_type}</keyType>
+                <protected>false</protected>
+                <keyMaterial>{key}</keyMaterial>
+            </sharedKey>"""
+
+
+class WifiProfile(NamedTuple):
+    """The credentials needed to provision one Wi-Fi profile."""
+    ssid: str
+    password: Optional[str] = None
+    security: str = "wpa2"
+
+
+def security_for(authentication: Optional[str], password: Optional[str] = None) -> str:
+    """
+    Picks the security mode for a network from the authentication reported by a scan
+    (e.g. "WPA3-Personal", "Open"). Without scan data, a password implies WPA2.
+    """
+    auth = (authentication or "").casefold()
+    if "wpa3" in auth:
+        return "wpa3"
+    if auth.startswith("open") or (not auth and not password):
+        return "open"
+    return "wpa2"
+
+
+def build_profile_xml(profile: WifiProfile) -> str:
+    """
+    Renders a WLAN profile XML document with all values XML-escaped.
+
+    Raises:
+        ValueError: If the security mode is unknown or the key is not a valid passphrase.
+    """
+    if profile.security not in SECURITY_MODES:
+        raise ValueError(f"Unsupported security mode: {profile.security}")
+    authentication, encryption = SECURITY_MODES[profile.security]
+
+    shared_key = ""
+    if profile.security != "open":
+        key = profile.password or ""
+        if len(key) == 64 and all(c in "0123456789abcdefABCDEF" for c in key):
+            key_type = "networkKey"
+        elif 8 <= len(key) <= 63:
+            key_type = "passPhrase"
+        else:
+            raise ValueError(f"Invalid key for '{profile.ssid}': a passphrase must have 8 to 63 characters.")
+        shared_key = SHARED_KEY_TEMPLATE.format(key_type=key_type, key=escape(key))
+
+    return PROFILE_TEMPLATE.format(
+        name=escape(profile.ssid),
+        hex=profile.ssid.encode("utf-8").hex().upper(),
+        authentication=authentication,
+        encryption=encryption,
+        shared_key=shared_key,
+    )
+
+
+class ProfileStaging:
+    """
+    A private temporary directory holding profile XML files for `netsh wlan add profile`,
+    which only accepts a file name. The directory is created with owner-only permissions
+    and removed, including the keys written to it, when the context exits.
+    """
+
+    def __init__(self):
+        self.directory = None
+        self._count = 0
+
+    def __enter__(self):
+        self.directory = tempfile.mkdtemp(prefix="wifi-profiles-")
+        return self
+
+    def write(self, profile: WifiProfile) -> str:
+        """Writes one profile and returns its file path. File names never depend on the SSID."""
+        self._count += 1
+        path = os.path.join(self.directory, f"profile-{self._count}.xml")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(build_profile_xml(profile))
+        return path
+
+    def __exit__(self, exc_type, exc, tb):
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self.directory = None
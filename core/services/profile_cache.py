@@ -0,0 +1,70 @@
+import threading
+import time
+import logging
+from core.services.netsh_parser import parse_profiles
+
+
+class SystemProfileCache:
+    """
+    A persistent, exactly-matched set of the Wi-Fi profile names stored in Windows
+    (`netsh wlan show profiles`).
+
+    The list is loaded on first use and reloaded once it is older than `max_age` seconds,
+    so profiles added or deleted outside the app are noticed; `invalidate()` forces a
+    reload (e.g. after a profile was added, or when connecting with a cached name failed).
+    """
+
+    def __init__(self, runner, max_age: float = 300.0):
+        self.runner = runner
+        self.max_age = max_age
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        self._names = None
+        self._loaded_at = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+
+    def _load(self):
+        result = self.runner.run(["netsh", "wlan", "show", "profiles"], check=True)
+        self._names = frozenset(parse_profiles(result.stdout))
+        self._loaded_at = time.monotonic()
+        self.loads += 1
+        self.logger.debug(f"Loaded {len(self._names)} system profile names.")
+
+    def contains(self, name: str) -> bool:
+        """
+        Returns True if a system profile with exactly this name exists.
+
+        Raises:
+            subprocess.CalledProcessError: If the profile list had to be reloaded and `netsh` failed.
+        """
+        with self._lock:
+            cached = self._names is not None and time.monotonic() - self._loaded_at < self.max_age
+            if not cached:
+                self._load()
+            found = name in self._names
+            # Only a name found without reloading is a hit.
+            if cached and found:
+                self.hits += 1
+            else:
+                self.misses += 1
+        self.logger.debug(f"Profile '{name}' exists: {found} ({self.summary()}).")
+        return found
+
+    def prime(self, names):
+        """Replaces the cached set with names that were just read from the system elsewhere."""
+        with self._lock:
+            self._names = frozenset(names)
+            self._loaded_at = time.monotonic()
+
+    def invalidate(self):
+        """Drops the cached set so the next lookup reloads it."""
+        with self._lock:
+            self._names = None
+
+    def summary(self) -> str:
+        """Returns the hit/miss/load counters as a log-friendly string."""
+        total = self.hits + self.misses
+        rate = self.hits / total * 100 if total else 0.0
+        return f"{self.hits} hits, {self.misses} misses, {self.loads} loads, {rate:.0f}% hit rate"
@@ -1,7 +1,9 @@
 import time
+import threading
 import psutil
 import logging
 from PyQt6.QtCore import QThread, pyqtSignal, QObject
+from core.services.event_log import EventLog
 
 
 class PsiphonMonitor(QThread):
@@ -14,11 +16,149 @@ class PsiphonMonitor(QThread):
     # Parameters: ui_running, tunnel_running, tunnel_active, established_connections
     status_updated = pyqtSignal(bool, bool, bool, bool)
 
-    def __init__(self, parent: QObject = None):
-        """Initializes the monitor with a logger and status flags."""
+    # Process names tracked by the monitor.
+    UI_PROCESS = 'psiphon3.exe'
+    TUNNEL_PROCESS = 'psiphon-tunnel-core.exe'
+
+    # Snapshots younger than this (in seconds) are reused by on-demand checks.
+    SNAPSHOT_MAX_AGE = 1.0
+    # While a Psiphon process is not tracked, full scans to discover it run at most this
+    # often (seconds); `poke` forces the next tick to scan.
+    DISCOVERY_INTERVAL = 5.0
+
+    def __init__(self, parent: QObject = None, min_interval: float = 1.0, max_interval: float = 8.0,
+                 backoff: float = 2.0):
+        """
+        Initializes the monitor with a logger and status flags.
+
+        Args:
+            parent: The parent QObject.
+            min_interval: Polling interval (seconds) while the tunnel is changing state.
+            max_interval: Upper bound (seconds) for the interval while the state is stable; a
+                Psiphon started outside the app is noticed within this time (plus the
+                discovery interval when it was not tracked yet).
+            backoff: Factor applied to the interval after every unchanged tick.
+        """
         super().__init__(parent)
         self.logger = logging.getLogger(self.__class__.__name__)
         self.monitoring = False
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.interval = min_interval
+        # Set to interrupt the current wait (see `poke` and `stop`).
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        # Cached {process_name: (pid, create_time)} of the Psiphon processes.
+        self._tracked = {}
+        self._snapshot = (False, False, False)
+        self._snapshot_time = 0.0
+        self._last_scan = None
+        self._force_scan = False
+        # Cost accounting for process lookups, logged periodically.
+        self.scan_stats = {'full_scans': 0, 'revalidations': 0, 'total_cost': 0.0, 'ticks': 0}
+        # Structured record of Psiphon state changes; replaced with a file-backed log by the controller.
+        self.events = EventLog()
+
+    def _revalidate(self) -> bool:
+        """
+        Checks that every cached PID still belongs to the same process (same create time).
+
+        Returns:
+            True if all tracked processes are still alive, False if one vanished.
+        """
+        for pid, create_time in self._tracked.values():
+            try:
+                if psutil.Process(pid).create_time() != create_time:
+                    return False
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                return False
+        return True
+
+    def _scan(self):
+        """Performs one full process scan and caches the PIDs of the Psiphon processes."""
+        tracked = {}
+        for proc in psutil.process_iter(['name', 'create_time']):
+            name = (proc.info.get('name') or '').lower()
+            if self.UI_PROCESS in name:
+                tracked[self.UI_PROCESS] = (proc.pid, proc.info.get('create_time'))
+            elif self.TUNNEL_PROCESS in name:
+                tracked[self.TUNNEL_PROCESS] = (proc.pid, proc.info.get('create_time'))
+        self._tracked = tracked
+        self._last_scan = time.monotonic()
+        self._force_scan = False
+
+    def _needs_scan(self) -> bool:
+        """
+        Decides whether a full process scan is needed: a tracked process vanished, or a
+        process is not tracked yet and the discovery interval has passed (or `poke` asked).
+        """
+        if not self._revalidate():
+            return True
+        if len(self._tracked) == 2:
+            return False
+        return (self._force_scan or self._last_scan is None
+                or time.monotonic() - self._last_scan >= self.DISCOVERY_INTERVAL)
+
+    def _tunnel_has_connection(self) -> bool:
+        """Checks whether the cached tunnel process has an established connection."""
+        tunnel = self._tracked.get(self.TUNNEL_PROCESS)
+        if not tunnel:
+            return False
+        try:
+            for conn in psutil.Process(tunnel[0]).net_connections():
+                if conn.status == psutil.CONN_ESTABLISHED:
+                    return True
+        except (psutil.AccessDenied, psutil.NoSuchProcess):
+            pass
+        return False
+
+    def take_snapshot(self) -> tuple[bool, bool, bool]:
+        """
+        Determines the Psiphon state with as little process enumeration as possible:
+        cached PIDs are re-validated by PID and create time, and a full scan only
+        happens when a tracked process has vanished or, while a process is not tracked,
+        every DISCOVERY_INTERVAL seconds (sooner after `poke`).
+
+        Returns:
+            A tuple (is_ui_running, is_tunnel_running, is_tunnel_active).
+        """
+        with self._lock:
+            started = time.perf_counter()
+            try:
+                if self._needs_scan():
+                    self._scan()
+                    self.scan_stats['full_scans'] += 1
+                else:
+                    self.scan_stats['revalidations'] += 1
+
+                self._snapshot = (
+                    self.UI_PROCESS in self._tracked,
+                    self.TUNNEL_PROCESS in self._tracked,
+                    self._tunnel_has_connection(),
+                )
+            except Exception as e:
+                self.logger.error(f"Error checking processes: {e}")
+                self._tracked = {}
+                self._force_scan = True
+                self._snapshot = (False, False, False)
+
+            self.scan_stats['ticks'] += 1
+            self.scan_stats['total_cost'] += time.perf_counter() - started
+            self._snapshot_time = time.monotonic()
+            return self._snapshot
+
+    def last_snapshot(self) -> tuple[bool, bool, bool]:
+        """Returns the most recent snapshot without refreshing it (no process lookup)."""
+        with self._lock:
+            return self._snapshot
+
+    def _current_snapshot(self) -> tuple[bool, bool, bool]:
+        """Returns the latest snapshot, refreshing it if it is older than SNAPSHOT_MAX_AGE."""
+        with self._lock:
+            if time.monotonic() - self._snapshot_time < self.SNAPSHOT_MAX_AGE:
+                return self._snapshot
+        return self.take_snapshot()
 
     def _check_psiphon_processes(self) -> tuple[bool, bool]:
         """
@@ -27,19 +167,8 @@ class PsiphonMonitor(QThread):
         Returns:
             A tuple containing two booleans: (is_ui_running, is_tunnel_running).
         """
-        is_ui_running = False
-        is_tunnel_running = False
-        try:
-            for proc in psutil.process_iter(['name']):
-                name = proc.info.get('name', '')
-                if 'psiphon3.exe' in name.lower():
-                    is_ui_running = True
-                elif 'psiphon-tunnel-core.exe' in name.lower():
-                    is_tunnel_running = True
-            return is_ui_running, is_tunnel_running
-        except Exception as e:
-            self.logger.error(f"Error checking processes: {e}")
-            return False, False
+        ui_running, tunnel_running, _ = self._current_snapshot()
+        return ui_running, tunnel_running
 
     def _check_tunnel_status(self) -> bool:
         """
@@ -48,20 +177,7 @@ class PsiphonMonitor(QThread):
         Returns:
             A boolean indicating if the tunnel is active.
         """
-        try:
-            for proc in psutil.process_iter(['name']):
-                if proc.info.get('name') and 'psiphon-tunnel-core.exe' in proc.info.get('name').lower():
-                    try:
-                        connections = proc.net_connections()
-                        for conn in connections:
-                            if conn.status == psutil.CONN_ESTABLISHED:
-                                return True
-                    except (psutil.AccessDenied, psutil.NoSuchProcess):
-                        continue
-            return False
-        except Exception as e:
-            self.logger.error(f"Error checking tunnel status: {e}")
-            return False
+        return self._current_snapshot()[2]
 
     def check_tunnel_status(self):
         return self._check_tunnel_status()
@@ -69,22 +185,42 @@ class PsiphonMonitor(QThread):
     def check_psiphone_ui(self):
         return self._check_psiphon_processes()
 
+    def scan_cost_summary(self) -> str:
+        """Returns the average process-lookup cost per tick for the log."""
+        stats = self.scan_stats
+        ticks = stats['ticks'] or 1
+        return (f"{stats['ticks']} ticks, {stats['full_scans']} full scans, "
+                f"{stats['revalidations']} PID revalidations, "
+                f"avg {stats['total_cost'] / ticks * 1000:.2f}ms per tick")
+
     def run(self):
         """The main loop for the monitoring thread."""
         self.monitoring = True
         self.logger.info("Psiphon monitoring started.")
 
         last_connected_status = None
+        last_status = None
+        # Since when Psiphon has been running without a tunnel, to measure how long connecting takes.
+        connecting_since = None
 
         while self.monitoring:
             try:
                 # Check the basic status of Psiphon processes and tunnel
-                ui_running, tunnel_running = self._check_psiphon_processes()
-                tunnel_active = self._check_tunnel_status()
+                ui_running, tunnel_running, tunnel_active = self.take_snapshot()
 
                 # Determine the overall connected status.
                 psiphon_connected = ui_running and tunnel_running and tunnel_active
 
+                tunnel_latency = None
+                if ui_running and not psiphon_connected:
+                    connecting_since = connecting_since or time.monotonic()
+                else:
+                    if psiphon_connected and connecting_since:
+                        tunnel_latency = time.monotonic() - connecting_since
+                    connecting_since = None
+                self.events.record('psiphon', ui_running, cause='monitor')
+                self.events.record('tunnel', psiphon_connected, cause='monitor', latency=tunnel_latency)
+
                 # Log status changes for a clearer history.
                 if psiphon_connected != last_connected_status:
                     if psiphon_connected:
@@ -95,22 +231,39 @@ class PsiphonMonitor(QThread):
                         self.logger.info("Psiphon initial status: Not connected.")
                     last_connected_status = psiphon_connected
 
-                # Emit the signal with the latest status.
-                self.status_updated.emit(
-                    ui_running,
-                    tunnel_running,
-                    tunnel_active,
-                    psiphon_connected
-                )
+                status = (ui_running, tunnel_running, tunnel_active, psiphon_connected)
+                if status != last_status:
+                    # Emit the signal only when the status changed.
+                    self.status_updated.emit(*status)
+                    last_status = status
+                    self.interval = self.min_interval
+                elif ui_running and not psiphon_connected:
+                    # The tunnel is starting or recovering: keep polling quickly.
+                    self.interval = self.min_interval
+                else:
+                    # Stable state: back off to save wakeups.
+                    self.interval = min(self.interval * self.backoff, self.max_interval)
 
             except Exception as e:
                 self.logger.error(f"Error in monitoring loop: {e}")
+                self.interval = self.min_interval
+
+            # Sleep until the next tick, or until poked.
+            self._wake.wait(self.interval)
+            self._wake.clear()
 
-            # Sleep to prevent high CPU usage.
-            time.sleep(1)
+    def poke(self):
+        """
+        Forces an immediate check, e.g. right after Psiphon was started or stopped or the
+        network changed, and restarts the backoff from `min_interval`.
+        """
+        self._force_scan = True
+        self.interval = self.min_interval
+        self._wake.set()
 
     def stop(self):
         """Stops the monitoring thread gracefully."""
-        self.logger.info("Stopping Psiphon monitoring.")
+        self.logger.info(f"Stopping Psiphon monitoring ({self.scan_cost_summary()}).")
         self.monitoring = False
+        self._wake.set()
         self.wait()
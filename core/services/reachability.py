@@ -0,0 +1,217 @@
+import bisect
+import socket
+import threading
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
+from typing import NamedTuple, Optional
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class HttpProbe:
+    """
+    Succeeds when `url` answers with `expected_status` (a captive-portal style 204 check).
+    Any other answer (a portal login page, a redirect) means no internet access, so the
+    answer of an HTTP probe is authoritative.
+    """
+
+    authoritative = True
+
+    def __init__(self, url: str, expected_status: int = 204):
+        self.url = url
+        self.expected_status = expected_status
+        self.name = f"http:{url}"
+
+    def check(self, session: requests.Session, timeout: float) -> bool:
+        response = session.get(self.url, timeout=timeout, allow_redirects=False)
+        return response.status_code == self.expected_status
+
+
+class DnsProbe:
+    """
+    Succeeds when `hostname` resolves. Note that answers may come from the local
+    resolver cache, so this is a weaker signal than the HTTP and TCP probes.
+    """
+
+    authoritative = False
+
+    def __init__(self, hostname: str):
+        self.hostname = hostname
+        self.name = f"dns:{hostname}"
+
+    def check(self, session: requests.Session, timeout: float) -> bool:
+        return bool(socket.getaddrinfo(self.hostname, None))
+
+
+class TcpProbe:
+    """
+    Succeeds when a TCP connection to `host:port` can be opened. Captive portals and walled
+    gardens often accept such connections, so this only counts when no HTTP probe answered.
+    """
+
+    authoritative = False
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.name = f"tcp:{host}:{port}"
+
+    def check(self, session: requests.Session, timeout: float) -> bool:
+        with socket.create_connection((self.host, self.port), timeout=timeout):
+            return True
+
+
+DEFAULT_PROBES = (
+    HttpProbe("http://connectivitycheck.gstatic.com/generate_204"),
+    HttpProbe("http://cp.cloudflare.com/generate_204"),
+    TcpProbe("1.1.1.1", 443),
+)
+
+
+class LatencyHistogram:
+    """A fixed-bucket RTT histogram (milliseconds) with constant memory."""
+
+    BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+
+    def record(self, rtt: float):
+        rtt_ms = rtt * 1000
+        self.counts[bisect.bisect_left(self.BUCKETS_MS, rtt_ms)] += 1
+        self.total += 1
+        self.sum_ms += rtt_ms
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Returns the upper bound (ms) of the bucket holding the given percentile."""
+        if not self.total:
+            return None
+        threshold = fraction * self.total
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= threshold:
+                return self.BUCKETS_MS[index] if index < len(self.BUCKETS_MS) else float('inf')
+        return float('inf')
+
+    def summary(self) -> dict:
+        return {
+            'count': self.total,
+            'mean_ms': self.sum_ms / self.total if self.total else None,
+            'p50_ms': self.percentile(0.5),
+            'p95_ms': self.percentile(0.95),
+        }
+
+
+class ReachabilityResult(NamedTuple):
+    """The outcome of one reachability check."""
+    reachable: bool
+    probe: Optional[str]
+    rtt: Optional[float]
+    elapsed: float
+    # True if an HTTP probe got an unexpected answer, e.g. from a captive portal.
+    captive: bool = False
+
+
+class ReachabilityChecker:
+    """
+    Races several reachability probes in parallel. The first HTTP 204 from an authoritative
+    probe means up. Any other status means a captive portal or walled garden, but since a
+    single host may be blocked, that only decides once every authoritative probe answered
+    without a 204 or failed. Other probes (TCP, DNS) only break the tie when no authoritative
+    probe answered at all before the timeout. HTTP probes share one pooled session, and
+    per-probe RTTs are kept in histograms.
+    """
+
+    def __init__(self, probes=None, timeout: float = 5.0):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.probes = list(probes or DEFAULT_PROBES)
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=len(self.probes), pool_maxsize=len(self.probes))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._executor = ThreadPoolExecutor(max_workers=len(self.probes), thread_name_prefix="probe")
+        self._lock = threading.Lock()
+        self.histograms = {probe.name: LatencyHistogram() for probe in self.probes}
+        self.failures = {probe.name: 0 for probe in self.probes}
+        # Probes still running from an earlier check are joined rather than restarted,
+        # so slow probes never pile up in the pool.
+        self._inflight = {}
+
+    def _run_probe(self, probe, timeout):
+        """Returns (probe, ok, rtt); `ok` is None if the probe got no answer at all."""
+        started = time.perf_counter()
+        try:
+            ok = bool(probe.check(self.session, timeout))
+        except Exception as e:
+            self.logger.debug(f"Probe {probe.name} failed: {e}")
+            ok = None
+        rtt = time.perf_counter() - started
+
+        with self._lock:
+            if ok:
+                self.histograms[probe.name].record(rtt)
+            else:
+                self.failures[probe.name] += 1
+        return probe, ok, rtt
+
+    def check(self, timeout: Optional[float] = None) -> ReachabilityResult:
+        """
+        Runs all probes concurrently and returns on the first decisive answer.
+
+        Args:
+            timeout: Overrides the default timeout (seconds) for this check.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        started = time.perf_counter()
+        futures = []
+        with self._lock:
+            for probe in self.probes:
+                future = self._inflight.get(probe.name)
+                if future is None or future.done():
+                    future = self._executor.submit(self._run_probe, probe, timeout)
+                    self._inflight[probe.name] = future
+                futures.append(future)
+
+        # A non-authoritative success, used only if no authoritative probe answers.
+        fallback = None
+        # The first authoritative probe that answered without a 204.
+        captive = None
+        pending = sum(1 for probe in self.probes if probe.authoritative)
+        try:
+            for future in as_completed(futures, timeout=timeout):
+                probe, ok, rtt = future.result()
+                if probe.authoritative:
+                    if ok:
+                        return ReachabilityResult(True, probe.name, rtt, time.perf_counter() - started)
+                    pending -= 1
+                    if ok is not None and captive is None:
+                        self.logger.info(f"Probe {probe.name} got an unexpected answer (captive portal?).")
+                        captive = probe.name
+                    if not pending and captive is not None:
+                        break
+                elif ok and fallback is None:
+                    fallback = (probe.name, rtt)
+        except FuturesTimeout:
+            self.logger.debug(f"No HTTP 204 within {timeout:.1f}s.")
+        if captive is not None:
+            return ReachabilityResult(False, captive, None, time.perf_counter() - started, captive=True)
+        if fallback is not None:
+            return ReachabilityResult(True, fallback[0], fallback[1], time.perf_counter() - started)
+        return ReachabilityResult(False, None, None, time.perf_counter() - started)
+
+    def stats(self) -> dict:
+        """Returns per-probe RTT summaries and failure counts."""
+        with self._lock:
+            return {
+                name: dict(histogram.summary(), failures=self.failures[name])
+                for name, histogram in self.histograms.items()
+            }
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
@@ -0,0 +1,181 @@
+import time
+import logging
+from collections import deque
+from typing import NamedTuple
+
+from core.utils.deadline import Deadline
+
+
+class RecoveryAttempt(NamedTuple):
+    """One rung of the ladder tried during an incident."""
+    step: str
+    recovered: bool
+    duration: float
+
+
+class RecoveryIncident(NamedTuple):
+    """The path taken to recover from one loss of internet connectivity."""
+    started: float
+    attempts: tuple
+    recovered: bool
+    duration: float
+    # True if the climb was cut short by the caller's deadline and continues on the next call.
+    paused: bool = False
+
+    @property
+    def path(self) -> str:
+        return " -> ".join(attempt.step for attempt in self.attempts)
+
+
+class RecoveryLadder:
+    """
+    Restores internet connectivity with the cheapest action that works. Steps are tried
+    in order and the next, heavier one is only taken when the previous one did not
+    bring the connection back:
+
+        reprobe -> renew -> reassociate -> recreate_profile -> restart_vpn
+
+    Each step is time-boxed: it runs under a Deadline of its budget (itself bounded by the
+    caller's deadline), a step taking longer than its budget is logged, and success is
+    verified with a reachability probe bounded by what is left of the budget.
+
+    A climb cut short by the caller's deadline is paused: the next `recover` call continues
+    with the following step instead of starting over, so the heavier steps are still reached
+    when every call only has the time of one configuration tick.
+    """
+
+    # (step, budget in seconds)
+    STEPS = (
+        ('reprobe', 3.0),
+        ('renew', 20.0),
+        ('reassociate', 20.0),
+        ('recreate_profile', 25.0),
+        ('restart_vpn', 25.0),
+    )
+    # Minimum time left for verifying a step.
+    MIN_VERIFY_TIMEOUT = 2.0
+    # A paused climb is resumed only within this many seconds; after that it starts over.
+    RESUME_WINDOW = 300.0
+
+    def __init__(self, network_manager, history=100):
+        """
+        Args:
+            network_manager (NetworkManager): Performs the actions.
+            history (int): The number of incidents kept in `incidents`.
+        """
+        self.network_manager = network_manager
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.incidents = deque(maxlen=history)
+        # Index into STEPS where the next climb starts, and when the climb was paused.
+        self._resume_at = 0
+        self._paused_at = None
+
+    def reset(self):
+        """Starts the next climb at the first step, e.g. once the internet is reachable again."""
+        self._resume_at = 0
+        self._paused_at = None
+
+    def _first_step(self) -> int:
+        if self._paused_at is None or time.monotonic() - self._paused_at > self.RESUME_WINDOW:
+            self.reset()
+        return self._resume_at
+
+    def _reprobe(self, deadline):
+        # A single failed probe is often a transient DNS or captive-portal hiccup.
+        pass
+
+    def _renew(self, deadline):
+        self.network_manager.renew_ip(timeout=deadline.budget / 2, deadline=deadline)
+
+    def _reassociate(self, deadline):
+        self.network_manager.disconnect_wifi(deadline)
+        self.network_manager.connect_wifi(deadline)
+
+    def _recreate_profile(self, deadline):
+        manager = self.network_manager
+        if manager.current_ssid and manager.current_password:
+            manager.delete_wifi_profile(manager.current_ssid, deadline)
+            manager.create_wifi_profile(deadline)
+        manager.connect_wifi(deadline)
+
+    def _restart_vpn(self, deadline):
+        self.network_manager.stop_psiphon(deadline)
+        self.network_manager.start_psiphon(deadline)
+
+    def recover(self, use_vpn=False, deadline=None) -> RecoveryIncident:
+        """
+        Climbs the ladder until the internet is reachable again or all steps failed.
+
+        Args:
+            use_vpn (bool): Whether restarting the VPN is part of the ladder.
+            deadline (Deadline, optional): Bounds the whole climb; steps that would start
+                after it expired are left to the next call, which resumes there.
+
+        Returns:
+            RecoveryIncident: The steps tried with their durations.
+        """
+        deadline = deadline or Deadline()
+        started_at = time.time()
+        started = time.monotonic()
+        attempts = []
+        recovered = False
+        paused_at = None
+        first = self._first_step()
+        if first:
+            self.logger.info(f"Resuming recovery at step '{self.STEPS[first][0]}'.")
+
+        for index, (step, budget) in enumerate(self.STEPS[first:], start=first):
+            if step == 'restart_vpn' and not use_vpn:
+                continue
+            if deadline.expired:
+                self.logger.warning(f"Recovery paused before '{step}': time budget exhausted.")
+                paused_at = index
+                break
+            step_deadline = deadline.child(budget)
+            step_started = time.monotonic()
+            self.logger.info(f"Recovery step '{step}' (budget {step_deadline.budget:.0f}s).")
+            try:
+                getattr(self, f"_{step}")(step_deadline)
+                verify_timeout = step_deadline.timeout(self.network_manager.reachability.timeout,
+                                                       minimum=self.MIN_VERIFY_TIMEOUT)
+                recovered = self.network_manager.get_internet_status(timeout=verify_timeout)
+            except Exception as e:
+                self.logger.exception(f"Recovery step '{step}' failed: {e}")
+                recovered = False
+
+            duration = time.monotonic() - step_started
+            attempts.append(RecoveryAttempt(step, recovered, duration))
+            if step_deadline.overrun():
+                self.logger.warning(
+                    f"Recovery step '{step}' took {duration:.1f}s, over its {step_deadline.budget:.0f}s budget."
+                )
+            if recovered:
+                break
+
+        if paused_at is not None and not recovered:
+            self._resume_at = paused_at
+            self._paused_at = time.monotonic()
+        else:
+            self.reset()
+
+        incident = RecoveryIncident(started_at, tuple(attempts), recovered, time.monotonic() - started,
+                                    paused=paused_at is not None and not recovered)
+        if not attempts:
+            return incident
+        self.incidents.append(incident)
+        outcome = "recovered" if recovered else "paused" if paused_at is not None else "failed"
+        self.logger.info(f"Recovery {outcome} in {incident.duration:.1f}s via {incident.path}.")
+        self.network_manager.events.record(
+            'recovery', f"{outcome}:{attempts[-1].step}", cause=incident.path, latency=incident.duration,
+            always=True,
+        )
+        return incident
+
+    def summary(self) -> dict:
+        """Returns {final_step: (count, mean_duration)} over the kept incidents that recovered."""
+        totals = {}
+        for incident in self.incidents:
+            if incident.recovered:
+                count, total = totals.get(incident.attempts[-1].step, (0, 0.0))
+                totals[incident.attempts[-1].step] = (count + 1, total + incident.duration)
+        return {step: (count, total / count) for step, (count, total) in totals.items()}
@@ -0,0 +1,73 @@
+import threading
+import time
+from typing import Optional
+
+
+class Deadline:
+    """
+    A time budget shared by a chain of operations. Each operation asks the deadline
+    for its timeout, which is its usual timeout shrunk to what is left of the budget,
+    so the whole chain ends on time. A Deadline without a budget never expires.
+
+    A deadline can also be tied to a cancel event (e.g. of a NetworkJob): once the event
+    is set, the deadline counts as expired, so the chain stops at its next step.
+    """
+
+    def __init__(self, budget: Optional[float] = None, cancel_event: Optional[threading.Event] = None):
+        """
+        Args:
+            budget: The total time in seconds, or None for no limit.
+            cancel_event: An optional event that expires the deadline when set.
+        """
+        self.budget = budget
+        self.cancel_event = cancel_event
+        self.started = time.monotonic()
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event is not None and self.cancel_event.is_set()
+
+    def remaining(self) -> Optional[float]:
+        """Returns the seconds left (never negative, 0 once cancelled), or None without a budget."""
+        if self.cancelled:
+            return 0.0
+        if self.budget is None:
+            return None
+        return max(0.0, self.budget - self.elapsed())
+
+    @property
+    def expired(self) -> bool:
+        return self.cancelled or (self.budget is not None and self.elapsed() >= self.budget)
+
+    def timeout(self, default: Optional[float], minimum: float = 0.0) -> Optional[float]:
+        """
+        Returns `default` shrunk to the remaining budget, but at least `minimum`
+        (so a final check still gets a chance to answer).
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return default
+        timeout = remaining if default is None else min(default, remaining)
+        return max(timeout, minimum)
+
+    def child(self, budget: Optional[float]) -> "Deadline":
+        """Returns a deadline for a sub-operation that also ends no later than this one."""
+        remaining = self.remaining()
+        if remaining is not None and budget is not None:
+            remaining = min(budget, remaining)
+        return Deadline(budget if remaining is None else remaining, self.cancel_event)
+
+    def overrun(self) -> float:
+        """Returns by how many seconds the budget was exceeded (0 if not)."""
+        if self.budget is None:
+            return 0.0
+        return max(0.0, self.elapsed() - self.budget)
+
+    def __repr__(self):
+        if self.cancelled:
+            return "Deadline(cancelled)"
+        remaining = self.remaining()
+        return "Deadline(unlimited)" if remaining is None else f"Deadline({remaining:.1f}s left of {self.budget:.1f}s)"
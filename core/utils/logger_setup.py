@@ -1,5 +1,12 @@
+import gzip
 import logging
-from PyQt6.QtCore import QObject, pyqtSignal
+import os
+import queue
+import shutil
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 
 
 class QtSignalHandler(logging.Handler, QObject):
@@ -25,28 +32,144 @@ class QtSignalHandler(logging.Handler, QObject):
         self.log_signal.emit(msg, level)
 
 
-def setup_logging():
+class LogQueueConsumer(QObject):
     """
-    Configures the application's logging system.
+    Drains log records queued by a `QueueHandler` on the GUI thread and hands them to a
+    LogListModel in batches. Any thread may log: enqueueing never blocks and the model
+    is only touched on the thread this consumer lives on.
     """
-    logger = logging.getLogger()
-    logger.setLevel(logging.DEBUG)
 
-    # Prevent adding duplicate handlers.
-    if not logger.handlers:
-        # File Handler: Logs all messages to a file.
-        file_handler = logging.FileHandler('app.log', encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)
-        file_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(name)s - %(message)s')
-        file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+    def __init__(self, log_queue, model, interval=50, max_batch=2000, parent=None):
+        """
+        Args:
+            log_queue (queue.SimpleQueue): The queue the `QueueHandler` writes to.
+            model (LogListModel): The model receiving the messages.
+            interval (int): Milliseconds between drains.
+            max_batch (int): The maximum number of records taken per drain.
+        """
+        super().__init__(parent)
+        self.queue = log_queue
+        self.model = model
+        self.max_batch = max_batch
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self.drain)
+
+    def start(self):
+        self._timer.start()
+
+    def stop(self):
+        """Stops the periodic drain and delivers what is still queued."""
+        self._timer.stop()
+        self.drain()
+
+    def drain(self):
+        """Moves up to `max_batch` queued records into the model as one batch."""
+        batch = []
+        try:
+            while len(batch) < self.max_batch:
+                record = self.queue.get_nowait()
+                batch.append((record.getMessage(), record.levelname))
+        except queue.Empty:
+            pass
+        if batch:
+            self.model.add_logs(batch)
+            self.model.flush()
+
+
+def create_model_log_handler(model, parent=None):
+    """
+    Builds the thread-safe pipeline from the logging system to a LogListModel.
+
+    Returns:
+        tuple: (QueueHandler to add to a logger, started LogQueueConsumer).
+    """
+    log_queue = queue.SimpleQueue()
+    handler = QueueHandler(log_queue)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    consumer = LogQueueConsumer(log_queue, model, parent=parent)
+    consumer.start()
+    return handler, consumer
+
+
+def default_log_dir():
+    """
+    Returns the log directory: `MPA_LOG_DIR` if set, otherwise a `logs` folder next to
+    the portable executable (or the working directory when running from source).
+    Logs must not go to the PyInstaller temp folder, which is deleted on exit.
+    """
+    if os.environ.get("MPA_LOG_DIR"):
+        return os.environ["MPA_LOG_DIR"]
+    if getattr(sys, "frozen", False):
+        return os.path.join(os.path.dirname(sys.executable), "logs")
+    return os.path.abspath("logs")
+
+
+def _gzip_rotator(source, dest):
+    """Compresses a rotated log file into `dest` and removes the original."""
+    with open(source, "rb") as f_in, gzip.open(dest, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+
+class CompressedRotatingFileHandler(RotatingFileHandler):
+    """
+    A file handler that rotates when the file exceeds `max_bytes` or is older than
+    `rotate_interval` seconds, and gzips rotated files (app.log.1.gz, app.log.2.gz, ...).
+    """
+
+    def __init__(self, filename, max_bytes=5 * 1024 * 1024, backup_count=10, rotate_interval=24 * 3600):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True)
+        self.rotate_interval = rotate_interval
+        self.namer = lambda name: name + ".gz"
+        self.rotator = _gzip_rotator
+        started = os.path.getmtime(filename) if os.path.exists(filename) else time.time()
+        self._rollover_at = started + rotate_interval
+
+    def shouldRollover(self, record):
+        if (self.rotate_interval and time.time() >= self._rollover_at
+                and os.path.exists(self.baseFilename) and os.path.getsize(self.baseFilename) > 0):
+            return True
+        return super().shouldRollover(record)
+
+    def doRollover(self):
+        super().doRollover()
+        self._rollover_at = time.time() + self.rotate_interval
+
+
+def setup_logging(log_dir=None, level=logging.INFO, max_bytes=5 * 1024 * 1024, backup_count=10,
+                  rotate_interval=24 * 3600):
+    """
+    Configures durable file logging. Records are only queued on the logging thread;
+    a background listener writes, rotates and compresses the files, so slow (USB)
+    writes never stall the caller.
+
+    Args:
+        log_dir (str): The directory for app.log; defaults to `default_log_dir()`.
+        level (int): The minimum level written to the file.
+        max_bytes (int): Rotate when the file would exceed this size.
+        backup_count (int): The number of compressed archives kept.
+        rotate_interval (float): Rotate at least this often (seconds).
+
+    Returns:
+        QueueListener: The started background writer; call `stop()` on exit to flush it.
+    """
+    log_dir = log_dir or default_log_dir()
+    os.makedirs(log_dir, exist_ok=True)
+
+    file_handler = CompressedRotatingFileHandler(
+        os.path.join(log_dir, "app.log"), max_bytes, backup_count, rotate_interval
+    )
+    file_handler.setLevel(level)
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(name)s - %(message)s'))
 
-        # Console Handler: Prints INFO level and above messages to the console.
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        console_formatter = logging.Formatter('%(name)s - %(levelname)s - %(message)s')
-        console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
 
-    # Return the custom handler for GUI integration.
-    return QtSignalHandler()
\ No newline at end of file
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setLevel(level)
+    root_logger.addHandler(queue_handler)
+    return listener
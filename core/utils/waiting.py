@@ -0,0 +1,63 @@
+import time
+import threading
+from typing import Callable, NamedTuple, Optional
+
+
+class WaitResult(NamedTuple):
+    """The outcome of `wait_until`."""
+    satisfied: bool
+    elapsed: float
+    attempts: int
+
+
+def wait_until(
+        predicate: Callable[[], bool],
+        timeout: float,
+        interval: float = 0.1,
+        max_interval: float = 1.0,
+        backoff: float = 2.0,
+        cancel_event: Optional[threading.Event] = None
+) -> WaitResult:
+    """
+    Polls `predicate` until it returns True or `timeout` seconds have passed.
+    The delay between polls starts at `interval` and grows by `backoff` up to
+    `max_interval`, so fast transitions are observed quickly without busy-waiting
+    on slow ones. Exceptions raised by the predicate count as "not yet".
+
+    Args:
+        predicate: A callable returning True once the target state is reached.
+        timeout: The deadline in seconds.
+        interval: The initial delay between polls.
+        max_interval: The upper bound for the delay between polls.
+        backoff: The factor applied to the delay after every unsuccessful poll.
+        cancel_event: An optional event that aborts the wait when set.
+
+    Returns:
+        A WaitResult with whether the condition was met, the time it took and the number of polls.
+    """
+    started = time.monotonic()
+    delay = interval
+    attempts = 0
+
+    while True:
+        attempts += 1
+        try:
+            satisfied = bool(predicate())
+        except Exception:
+            satisfied = False
+
+        elapsed = time.monotonic() - started
+        if satisfied:
+            return WaitResult(True, elapsed, attempts)
+
+        remaining = timeout - elapsed
+        if remaining <= 0:
+            return WaitResult(False, elapsed, attempts)
+
+        pause = min(delay, remaining)
+        if cancel_event is not None:
+            if cancel_event.wait(pause):
+                return WaitResult(False, time.monotonic() - started, attempts)
+        else:
+            time.sleep(pause)
+        delay = min(delay * backoff, max_interval)
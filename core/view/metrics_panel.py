@@ -0,0 +1,90 @@
+from PyQt6 import QtGui, QtWidgets
+
+
+class Sparkline(QtWidgets.QWidget):
+    """
+    A small line chart of one DownsampledSeries, with points placed by their bucket start
+    time; the line is interrupted where buckets are missing (a gap in the history). The
+    path is rebuilt only when the series version or the widget size changed; otherwise a
+    repaint just redraws the cached path.
+    """
+
+    def __init__(self, series, minimum=None, maximum=None, parent=None):
+        super().__init__(parent)
+        self.series = series
+        self.minimum = minimum
+        self.maximum = maximum
+        self._path = QtGui.QPainterPath()
+        self._path_key = None
+        self.setMinimumSize(160, 28)
+        self.setSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Fixed)
+
+    def _rebuild(self):
+        points = self.series.points()
+        self._path = QtGui.QPainterPath()
+        if len(points) < 2:
+            return
+        values = [value for _, value in points]
+        low = self.minimum if self.minimum is not None else min(values)
+        high = self.maximum if self.maximum is not None else max(values)
+        span = (high - low) or 1.0
+        width, height = self.width() - 2, self.height() - 2
+        first = points[0][0]
+        duration = (points[-1][0] - first) or 1.0
+        previous = None
+        for start, value in points:
+            x = 1 + (start - first) / duration * width
+            y = 1 + height - (value - low) / span * height
+            if previous is None or start - previous > self.series.resolution:
+                self._path.moveTo(x, y)
+            else:
+                self._path.lineTo(x, y)
+            previous = start
+
+    def paintEvent(self, event):
+        key = (self.series.version, self.width(), self.height())
+        if key != self._path_key:
+            self._rebuild()
+            self._path_key = key
+        painter = QtGui.QPainter(self)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        painter.setPen(QtGui.QPen(self.palette().color(QtGui.QPalette.ColorRole.Highlight), 1.5))
+        painter.drawPath(self._path)
+
+
+class MetricsPanel(QtWidgets.QGroupBox):
+    """Shows the history of the MetricsModel series as sparklines with a summary value."""
+
+    ROWS = (
+        ('internet', "Internet", 0.0, 100.0, "{:.1f}% up"),
+        ('wifi', "Wi-Fi", 0.0, 100.0, "{:.1f}% up"),
+        ('tunnel', "Tunnel", 0.0, 100.0, "{:.1f}% up"),
+        ('rtt', "Probe RTT", 0.0, None, "{:.0f} ms avg"),
+        ('reconnect', "Reconnect", 0.0, None, "{:.1f} s avg"),
+    )
+
+    def __init__(self, model, parent=None):
+        super().__init__("Metrics", parent)
+        self.model = model
+        self._sparklines = {}
+        self._values = {}
+
+        layout = QtWidgets.QGridLayout(self)
+        for row, (name, title, low, high, _) in enumerate(self.ROWS):
+            sparkline = Sparkline(model.series[name], low, high, parent=self)
+            value = QtWidgets.QLabel("-", parent=self)
+            value.setMinimumWidth(110)
+            layout.addWidget(QtWidgets.QLabel(title, parent=self), row, 0)
+            layout.addWidget(sparkline, row, 1)
+            layout.addWidget(value, row, 2)
+            self._sparklines[name] = sparkline
+            self._values[name] = value
+
+        model.changed.connect(self.refresh)
+
+    def refresh(self, name):
+        """Updates the row of one series; the sparkline repaints lazily."""
+        row = next(r for r in self.ROWS if r[0] == name)
+        mean = self.model.series[name].mean
+        self._values[name].setText(row[4].format(mean) if mean is not None else "-")
+        self._sparklines[name].update()
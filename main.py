@@ -1,9 +1,11 @@
 import sys
 from PyQt6 import QtCore, QtGui, QtWidgets
 from core.controller.main_controller import MainController
+from core.utils.logger_setup import setup_logging
 from core.utils.paths import resource_path
 
 if __name__ == "__main__":
+    log_listener = setup_logging()
     app = QtWidgets.QApplication(sys.argv)
     app_icon = QtGui.QIcon()
     app_icon_path = resource_path("img/mpas.ico")
@@ -24,5 +26,7 @@ if __name__ == "__main__":
         (QtWidgets.QApplication.primaryScreen().availableGeometry().height() - main_window.height()) // 2
     )
 
-    sys.exit(app.exec())
+    exit_code = app.exec()
+    log_listener.stop()
+    sys.exit(exit_code)
 
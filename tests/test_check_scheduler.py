@@ -0,0 +1,49 @@
+import threading
+import time
+
+import pytest
+from PyQt6.QtCore import QCoreApplication
+
+from core.services.check_scheduler import CheckScheduler
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def test_stop_does_not_wait_for_running_checks(app):
+    scheduler = CheckScheduler()
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_check():
+        started.set()
+        release.wait(5.0)
+        return True
+
+    scheduler.add('internet', slow_check, 60.0)
+    scheduler.start()
+    assert started.wait(2.0)
+    began = time.monotonic()
+    assert scheduler.stop(1000)
+    assert time.monotonic() - began < 0.5
+    release.set()
+    time.sleep(0.1)
+    # The late result is dropped instead of being reported after the stop.
+    assert scheduler.store.get('internet') is None
+
+
+def test_restart_runs_checks_again(app):
+    scheduler = CheckScheduler()
+    runs = []
+    scheduler.add('wifi', lambda: runs.append(1) or True, 60.0)
+    for _ in range(2):
+        scheduler.start()
+        deadline = time.monotonic() + 2.0
+        count = len(runs)
+        while len(runs) == count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert scheduler.stop()
+        scheduler.trigger('wifi')
+    assert len(runs) == 2
@@ -0,0 +1,23 @@
+from core.model.metrics_model import DownsampledSeries
+
+
+def test_compaction_does_not_average_across_gaps():
+    series = DownsampledSeries(capacity=8, resolution=5.0)
+    for i in range(10):
+        series.add(100, 1000.0 + i * 5)
+    for i in range(10):
+        series.add(0, 11000.0 + i * 5)
+    assert len(series) <= 8
+    assert {mean for _, mean in series.points()} == {0.0, 100.0}
+    assert series.mean == 50.0
+
+
+def test_capacity_holds_for_long_runs():
+    series = DownsampledSeries(capacity=120, resolution=5.0)
+    for i in range(50000):
+        series.add(i % 7, i * 5.0)
+    assert len(series) <= 120
+    assert series.count == 50000
+    starts = [start for start, _ in series.points()]
+    assert starts == sorted(starts)
+    assert all(start % series.resolution == 0 for start in starts)
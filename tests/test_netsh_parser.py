@@ -0,0 +1,161 @@
+import os
+import random
+import sys
+
+import pytest
+
+from core.services.command_runner import SubprocessRunner
+from core.services.netsh_parser import (
+    LABELS, band_for_channel, parse_fields, parse_interfaces, parse_key_content, parse_networks, parse_profiles,
+)
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures", "netsh")
+
+# Per locale: (interface name, SSID, signal), profile names, key content and, for every
+# visible network, its SSID and (bssid suffix, channel, band) per access point.
+EXPECTED = {
+    'en': {
+        'interface': ("Wi-Fi", "Home:Net", 92),
+        'profiles': ["Home:Net", "Cafe Wi-Fi", "Office"],
+        'key': "s3cret:pass word",
+        'networks': [
+            ("Home:Net", [("ad:01", 37, "6 GHz"), ("ad:02", 6, "2.4 GHz")]),
+            ("Cafe Wi-Fi", [("4d:5e", 149, "5 GHz")]),
+        ],
+    },
+    'de': {
+        'interface': ("WLAN", "Heimnetz", 78),
+        'profiles': ["Heimnetz", "FRITZ!Box 7590 XY"],
+        'key': "Geheim123!",
+        'networks': [
+            ("Heimnetz", [("22:33", 44, "5 GHz"), ("22:34", 1, "2.4 GHz")]),
+            ("FRITZ!Box 7590 XY", [("02:03", 13, "2.4 GHz")]),
+        ],
+    },
+    'fr': {
+        'interface': ("Wi-Fi", "Livebox-1A2B", 85),
+        'profiles': ["Livebox-1A2B", "Café : Wi-Fi gratuit"],
+        'key': "motdepasse:2024",
+        'networks': [
+            ("Livebox-1A2B", [("00:01", 11, "2.4 GHz")]),
+            ("Café : Wi-Fi gratuit", [("00:02", 100, "5 GHz")]),
+        ],
+    },
+    'es': {
+        'interface': ("Wi-Fi", "MOVISTAR_5F3A", 70),
+        'profiles': ["MOVISTAR_5F3A", "vodafoneAB12"],
+        'key': "clave.segura-99",
+        'networks': [
+            ("MOVISTAR_5F3A", [("02:03", 36, "5 GHz")]),
+            ("vodafoneAB12", [("20:30", 6, "2.4 GHz")]),
+        ],
+    },
+    'ru': {
+        'interface': ("Беспроводная сеть", "Дом", 99),
+        'profiles': ["Дом", "MGTS_GPON_1234"],
+        'key': "пароль2024",
+        'networks': [
+            ("Дом", [("bb:cc", 1, "2.4 GHz")]),
+            ("MGTS_GPON_1234", [("22:33", 52, "5 GHz")]),
+        ],
+    },
+}
+
+
+def fixture(locale, name):
+    # netsh writes CRLF line endings; keep them.
+    with open(os.path.join(FIXTURES, locale, f"{name}.txt"), encoding="utf-8", newline="") as f:
+        return f.read()
+
+
+# The console (OEM) code page netsh writes in, per locale.
+OEM_CODE_PAGES = {'en': "cp437", 'de': "cp850", 'fr': "cp850", 'es': "cp850", 'ru': "cp866"}
+
+
+def run_encoded(tmp_path, text, encoding):
+    """Runs a process printing `text` in `encoding` through a SubprocessRunner decoding that code page."""
+    path = tmp_path / "output.bin"
+    path.write_bytes(text.encode(encoding))
+    script = "import sys; sys.stdout.buffer.write(open(sys.argv[1], 'rb').read())"
+    return SubprocessRunner(encoding=encoding).run([sys.executable, "-c", script, str(path)], check=True).stdout
+
+
+def test_every_locale_has_fixtures():
+    assert sorted(EXPECTED) == sorted(LABELS)
+
+
+@pytest.mark.parametrize("locale", sorted(EXPECTED))
+def test_parse_interfaces(locale):
+    name, ssid, signal = EXPECTED[locale]['interface']
+    interfaces = parse_interfaces(fixture(locale, "interfaces"))
+    assert len(interfaces) == 1
+    state = interfaces[0]
+    assert (state.name, state.ssid, state.signal) == (name, ssid, signal)
+    assert state.connected
+
+
+@pytest.mark.parametrize("locale", sorted(EXPECTED))
+def test_parse_profiles_and_key(locale):
+    assert parse_profiles(fixture(locale, "profiles")) == EXPECTED[locale]['profiles']
+    assert parse_key_content(fixture(locale, "profile_key")) == EXPECTED[locale]['key']
+
+
+@pytest.mark.parametrize("locale", sorted(EXPECTED))
+def test_parse_networks(locale):
+    networks = parse_networks(fixture(locale, "networks"))
+    parsed = [
+        (network.ssid, [(b.bssid[-5:], b.channel, b.band) for b in network.bssids])
+        for network in networks
+    ]
+    assert parsed == EXPECTED[locale]['networks']
+
+
+@pytest.mark.parametrize("locale", sorted(EXPECTED))
+def test_oem_encoded_output_through_runner(locale, tmp_path):
+    encoding = OEM_CODE_PAGES[locale]
+    interfaces = parse_interfaces(run_encoded(tmp_path, fixture(locale, "interfaces"), encoding))
+    assert interfaces[0].connected
+    assert interfaces[0].ssid == EXPECTED[locale]['interface'][1]
+    assert parse_key_content(run_encoded(tmp_path, fixture(locale, "profile_key"), encoding)) == EXPECTED[locale]['key']
+    assert parse_profiles(run_encoded(tmp_path, fixture(locale, "profiles"), encoding)) == EXPECTED[locale]['profiles']
+
+
+def test_band_for_channel():
+    assert band_for_channel(None) is None
+    assert band_for_channel(11) == "2.4 GHz"
+    assert band_for_channel(165) == "5 GHz"
+    assert band_for_channel(197) == "6 GHz"
+    assert band_for_channel(250) is None
+
+
+def mutate(rng, text):
+    """Returns `text` damaged the way truncated, mis-decoded or unexpected output might be."""
+    lines = text.splitlines(keepends=True)
+    for _ in range(rng.randint(1, 5)):
+        choice = rng.randrange(5)
+        if choice == 0 and lines:
+            del lines[rng.randrange(len(lines))]
+        elif choice == 1 and lines:
+            i = rng.randrange(len(lines))
+            lines[i] = lines[i][:rng.randrange(len(lines[i]) + 1)]
+        elif choice == 2:
+            lines.insert(rng.randrange(len(lines) + 1),
+                         "".join(rng.choice(" :%\t\r\n0123456789abcÿé€Ж\x00") for _ in range(rng.randint(0, 30))))
+        elif choice == 3 and len(lines) > 1:
+            rng.shuffle(lines)
+        else:
+            lines = lines[:rng.randrange(len(lines) + 1)]
+    return "".join(lines)
+
+
+def test_parsers_never_raise():
+    rng = random.Random(1234)
+    outputs = [fixture(locale, name) for locale in EXPECTED
+               for name in ("interfaces", "networks", "profiles", "profile_key")]
+    for _ in range(2000):
+        text = mutate(rng, rng.choice(outputs))
+        parse_interfaces(text)
+        parse_networks(text)
+        parse_profiles(text)
+        parse_key_content(text)
+        parse_fields(text)
@@ -0,0 +1,64 @@
+import threading
+import time
+
+import pytest
+from PyQt6.QtCore import QCoreApplication
+
+from core.services.network_service import NetworkService
+from core.utils.deadline import Deadline
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def wait_until_started(event):
+    assert event.wait(2.0), "job did not start"
+
+
+def test_stop_expires_deadline_of_running_cancellable_job(app):
+    service = NetworkService()
+    service.start()
+    started = threading.Event()
+    seen = {}
+
+    def job(deadline=None):
+        started.set()
+        while not deadline.expired:
+            time.sleep(0.01)
+        seen['deadline'] = deadline
+
+    service.submit("job", job, cancellable=True)
+    wait_until_started(started)
+    began = time.monotonic()
+    assert service.stop(2000)
+    assert time.monotonic() - began < 1.0
+    assert seen['deadline'].cancelled
+
+
+def test_stop_is_bounded_for_jobs_that_cannot_stop(app):
+    service = NetworkService()
+    service.start()
+    started = threading.Event()
+    release = threading.Event()
+
+    def job():
+        started.set()
+        release.wait(5.0)
+
+    service.submit("job", job)
+    wait_until_started(started)
+    began = time.monotonic()
+    assert not service.stop(100)
+    assert time.monotonic() - began < 1.0
+    release.set()
+    assert service.wait(2000)
+
+
+def test_child_deadline_follows_cancellation():
+    cancel = threading.Event()
+    child = Deadline(cancel_event=cancel).child(10.0)
+    assert not child.expired
+    cancel.set()
+    assert child.expired and child.remaining() == 0.0
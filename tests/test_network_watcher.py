@@ -0,0 +1,68 @@
+import errno
+import socket
+import struct
+
+from core.services.network_watcher import NetlinkBackend
+
+
+def link_message(msg_type, index, flags, name):
+    """Builds one rtnetlink link message (nlmsghdr + ifinfomsg + IFLA_IFNAME attribute)."""
+    value = name.encode() + b"\0"
+    attribute = struct.pack("=HH", 4 + len(value), NetlinkBackend.IFLA_IFNAME) + value
+    attribute += b"\0" * (-len(attribute) % 4)
+    body = struct.pack("=BxHiII", socket.AF_UNSPEC, 1, index, flags, 0xFFFFFFFF) + attribute
+    return struct.pack("=IHHII", 16 + len(body), msg_type, 0, 0, 0) + body
+
+
+def test_parse_link_up():
+    data = link_message(16, 3, NetlinkBackend.IFF_UP | NetlinkBackend.IFF_RUNNING, "wlan0")
+    changes = NetlinkBackend.parse(data)
+    assert [(c.kind, c.action, c.interface, c.detail) for c in changes] == [("link", "new", "wlan0", "up")]
+
+
+def test_parse_several_messages():
+    data = link_message(16, 3, NetlinkBackend.IFF_UP, "wlan0") + link_message(17, 4, 0, "tun0")
+    changes = NetlinkBackend.parse(data)
+    assert [(c.kind, c.action, c.interface, c.detail) for c in changes] == [
+        ("link", "new", "wlan0", "down"),
+        ("link", "del", "tun0", "down"),
+    ]
+
+
+def test_parse_ignores_truncated_and_unknown_messages():
+    data = link_message(16, 3, NetlinkBackend.IFF_UP, "wlan0")
+    assert NetlinkBackend.parse(data[:10]) == []
+    assert NetlinkBackend.parse(struct.pack("=IHHII", 16, 3, 0, 0, 0)) == []
+
+
+class OverflowingSocket:
+    """A readable socket whose first recv fails with ENOBUFS, like an overrun netlink socket."""
+
+    def __init__(self):
+        self._reader, self._writer = socket.socketpair()
+        self._writer.send(b"x")
+        self._calls = 0
+
+    def fileno(self):
+        return self._reader.fileno()
+
+    def recv(self, size):
+        self._calls += 1
+        if self._calls == 1:
+            raise OSError(errno.ENOBUFS, "No buffer space available")
+        self._reader.recv(size)
+        return link_message(16, 3, NetlinkBackend.IFF_UP | NetlinkBackend.IFF_RUNNING, "wlan0")
+
+    def close(self):
+        self._reader.close()
+        self._writer.close()
+
+
+def test_wait_reports_overflow_as_change():
+    backend = NetlinkBackend.__new__(NetlinkBackend)
+    backend._socket = OverflowingSocket()
+    try:
+        changes = backend.wait(0.5)
+    finally:
+        backend.close()
+    assert [c.kind for c in changes] == ["overflow", "link"]
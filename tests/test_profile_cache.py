@@ -0,0 +1,45 @@
+import os
+
+from core.services.command_runner import ReplayRunner
+from core.services.profile_cache import SystemProfileCache
+
+PROFILES = os.path.join(os.path.dirname(__file__), "fixtures", "netsh", "en", "profiles.txt")
+COMMAND = "netsh wlan show profiles"
+EMPTY = "Profiles on interface Wi-Fi:\n\nUser profiles\n-------------\n    <None>\n"
+
+
+def runner():
+    with open(PROFILES, encoding="utf-8") as f:
+        return ReplayRunner({COMMAND: f.read()})
+
+
+def spawns(replay):
+    return replay.stats.snapshot()[COMMAND]['count']
+
+
+def test_counts_only_cached_positive_lookups_as_hits():
+    replay = runner()
+    cache = SystemProfileCache(replay)
+    assert cache.contains("Home:Net")       # loaded: miss
+    assert cache.contains("Home:Net")       # cached: hit
+    assert not cache.contains("Unknown")    # cached but absent: miss
+    assert (cache.hits, cache.misses, cache.loads) == (1, 2, 1)
+    assert spawns(replay) == 1
+
+
+def test_reloads_positive_entries_after_max_age():
+    replay = runner()
+    cache = SystemProfileCache(replay, max_age=0.0)
+    assert cache.contains("Home:Net")
+    replay.add(COMMAND, EMPTY)
+    assert not cache.contains("Home:Net")
+    assert spawns(replay) == 2
+
+
+def test_invalidate_forces_reload():
+    replay = runner()
+    cache = SystemProfileCache(replay)
+    assert cache.contains("Home:Net")
+    replay.add(COMMAND, EMPTY)
+    cache.invalidate()
+    assert not cache.contains("Home:Net")
@@ -0,0 +1,112 @@
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from core.services.reachability import HttpProbe, ReachabilityChecker, TcpProbe
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    Answers /204 with No Content, /portal with a login page, /blocked with 403,
+    /delayed with No Content after 50 ms and /slow after 2 s.
+    """
+
+    def do_GET(self):
+        if self.path == "/slow":
+            time.sleep(2.0)
+            self.send_response(204)
+        elif self.path == "/delayed":
+            time.sleep(0.05)
+            self.send_response(204)
+        elif self.path == "/blocked":
+            self.send_response(403)
+        elif self.path == "/portal":
+            body = b"<html><body>Please log in</body></html>"
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        else:
+            self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd.server_address
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _unused_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _check(probes, timeout=1.0):
+    checker = ReachabilityChecker(probes, timeout=timeout)
+    try:
+        return checker.check()
+    finally:
+        checker.close()
+
+
+def test_204_is_reachable(server):
+    host, port = server
+    url = f"http://{host}:{port}/204"
+    result = _check([HttpProbe(url)])
+    assert result.reachable
+    assert result.probe == f"http:{url}"
+    assert not result.captive
+
+
+def test_portal_page_is_not_reachable_even_if_tcp_connects(server):
+    host, port = server
+    result = _check([HttpProbe(f"http://{host}:{port}/portal"), TcpProbe(host, port)])
+    assert not result.reachable
+    assert result.captive
+
+
+def test_timeout_without_answer_is_not_reachable(server):
+    host, port = server
+    started = time.perf_counter()
+    result = _check([HttpProbe(f"http://{host}:{port}/slow")], timeout=0.5)
+    assert not result.reachable
+    assert not result.captive
+    assert time.perf_counter() - started < 1.5
+
+
+def test_tcp_breaks_the_tie_when_no_http_probe_answers(server):
+    host, port = server
+    result = _check([HttpProbe(f"http://127.0.0.1:{_unused_port()}/204"), TcpProbe(host, port)])
+    assert result.reachable
+    assert result.probe == f"tcp:{host}:{port}"
+
+
+def test_one_blocked_host_does_not_mean_down(server):
+    host, port = server
+    healthy = f"http://{host}:{port}/delayed"
+    result = _check([HttpProbe(f"http://{host}:{port}/blocked"), HttpProbe(healthy)])
+    assert result.reachable
+    assert result.probe == f"http:{healthy}"
+    assert not result.captive
+
+
+def test_blocked_host_is_captive_once_other_probes_time_out(server):
+    host, port = server
+    result = _check([HttpProbe(f"http://{host}:{port}/blocked"), HttpProbe(f"http://{host}:{port}/slow")],
+                    timeout=0.5)
+    assert not result.reachable
+    assert result.captive